@@ -319,6 +319,7 @@ def cmd_scheduler_add(args):
         inputs=inputs,
     )
     eng.add_job(job)
+    eng.close()
     print(f"Added job {job.id}")
 
 
@@ -329,6 +330,7 @@ def cmd_scheduler_list(args):
     import json as _json
     eng = SchedulerEngine()
     jobs = eng.list_jobs(state=args.state if args.state else None)
+    eng.close()
     for j in jobs:
         print(_json.dumps(j.__dict__, ensure_ascii=False))
 
@@ -339,6 +341,7 @@ def cmd_scheduler_cancel(args):
         return
     eng = SchedulerEngine()
     ok = eng.cancel_job(args.id)
+    eng.close()
     if ok:
         print(f"Cancelled job {args.id}")
     else:
@@ -2485,7 +2488,7 @@ def main():
             
         except ImportError as e:
             print(f'RAG system not available: {e}')
-            print('Install with: pip install sentence-transformers rank-bm25')
+            print('Install with: pip install sentence-transformers')
         except Exception as e:
             print(f'Error: {e}')
     p_ask.set_defaults(func=_cmd_ask)
@@ -7,13 +7,13 @@ Phase 3 M4: User approval workflows with dry-run simulation.
 from __future__ import annotations
 import json
 import logging
-from datetime import datetime, timezone
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from enum import Enum
 
 from ..utils.paths import data_subdir
+from ..utils.timestamps import iso_now
 
 logger = logging.getLogger('halbert.approval.engine')
 
@@ -387,4 +387,4 @@ class ApprovalEngine:
     
     def _get_timestamp(self) -> str:
         """Get ISO timestamp."""
-        return datetime.now(timezone.utc).isoformat() + 'Z'
+        return iso_now() + 'Z'
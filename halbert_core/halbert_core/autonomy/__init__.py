@@ -9,7 +9,7 @@ Safety systems for autonomous operations:
 - Recovery playbooks
 """
 
-from .guardrails import GuardrailEnforcer, GuardrailViolation
+from .guardrails import GuardrailEnforcer, GuardrailViolation, load_autonomy_config
 from .budgets import BudgetTracker, BudgetExceeded
 from .anomaly_detector import AnomalyDetector, AnomalyDetected
 from .recovery import RecoveryExecutor, RecoveryAction
@@ -17,6 +17,7 @@ from .recovery import RecoveryExecutor, RecoveryAction
 __all__ = [
     "GuardrailEnforcer",
     "GuardrailViolation",
+    "load_autonomy_config",
     "BudgetTracker",
     "BudgetExceeded",
     "AnomalyDetector",
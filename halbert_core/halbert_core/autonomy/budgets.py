@@ -6,7 +6,7 @@ Tracks resource usage during job execution and enforces limits.
 
 from __future__ import annotations
 from typing import Dict, Any
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 import psutil
 from ..obs.logging import get_logger
@@ -157,6 +157,15 @@ class BudgetTracker:
         self.started = False
         return summary
     
+    def clone_reset(self) -> "BudgetTracker":
+        """
+        Copy of this tracker with the same limits and fresh counters.
+        
+        Lets callers build a tracker from config once and take a new one
+        per job.
+        """
+        return replace(self)
+    
     @classmethod
     def from_config(cls, budgets_config: Dict[str, Any]) -> "BudgetTracker":
         """
@@ -7,12 +7,41 @@ Enforces confidence thresholds, budgets, and safety policies for autonomous oper
 from __future__ import annotations
 from typing import Dict, Any, Optional
 from pathlib import Path
+import copy
+import functools
+import os
 import yaml
 from ..obs.logging import get_logger
 from ..obs.audit import write_audit
 
 logger = get_logger("halbert")
 
+# libyaml C loader when available (several times faster than pure Python)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_autonomy_config(path: str, mtime: float) -> Dict[str, Any]:
+    with open(path) as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
+def load_autonomy_config(path: Path | str = "config/autonomy.yml") -> Dict[str, Any]:
+    """
+    Load autonomy.yml, parsing it again only when the file changes.
+    
+    Args:
+        path: Path to autonomy.yml
+    
+    Returns:
+        Config dict (a copy; safe to modify)
+    
+    Raises:
+        OSError: If the file cannot be read
+    """
+    path = os.fspath(path)
+    return copy.deepcopy(_parse_autonomy_config(path, os.path.getmtime(path)))
+
 
 class GuardrailViolation(Exception):
     """Raised when a guardrail check fails."""
@@ -52,8 +81,7 @@ class GuardrailEnforcer:
     def _load_config(self) -> Dict[str, Any]:
         """Load guardrail configuration."""
         try:
-            with open(self.config_path) as f:
-                config = yaml.safe_load(f)
+            config = load_autonomy_config(self.config_path)
             logger.info("Loaded guardrail config", extra={"source": str(self.config_path)})
             return config
         except Exception as e:
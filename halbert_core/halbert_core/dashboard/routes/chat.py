@@ -269,7 +269,7 @@ def call_ollama_with_tools(prompt: str, system_prompt: str, model: str = None) -
     tool invocations if the LLM wants to use tools.
     """
     try:
-        from ...tools.system_tools import SYSTEM_TOOLS, execute_tool
+        from ...tools.system_tools import execute_tool, get_tool_schemas_json
         
         # Smart routing: use specialist for complex queries
         if model is None:
@@ -296,15 +296,16 @@ def call_ollama_with_tools(prompt: str, system_prompt: str, model: str = None) -
             {"role": "user", "content": prompt}
         ]
         
-        # First call - with tools
+        # First call - with tools (schemas spliced in pre-serialized)
+        body = json.dumps({
+            "model": model,
+            "messages": messages,
+            "stream": False
+        }).encode("utf-8")
         response = requests.post(
             f"{endpoint}/api/chat",
-            json={
-                "model": model,
-                "messages": messages,
-                "tools": SYSTEM_TOOLS,
-                "stream": False
-            },
+            data=body[:-1] + b',"tools":' + get_tool_schemas_json() + b'}',
+            headers={"Content-Type": "application/json"},
             timeout=60
         )
         response.raise_for_status()
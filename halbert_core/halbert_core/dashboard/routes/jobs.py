@@ -2,12 +2,30 @@
 Job monitoring API routes.
 """
 
+from contextlib import contextmanager
 from fastapi import APIRouter, HTTPException
 from typing import List, Dict, Any
 
 router = APIRouter()
 
 
+@contextmanager
+def _open_engine():
+    """
+    Open the persisted job store for one request.
+    
+    A fresh engine sees changes made by the running scheduler; closing it
+    writes any change made here and releases its database connection.
+    """
+    from ...scheduler.engine import SchedulerEngine
+    
+    scheduler = SchedulerEngine()
+    try:
+        yield scheduler
+    finally:
+        scheduler.close()
+
+
 @router.get("")
 async def list_jobs(state: str | None = None) -> List[Dict[str, Any]]:
     """
@@ -17,21 +35,15 @@ async def list_jobs(state: str | None = None) -> List[Dict[str, Any]]:
         state: Filter by state (pending, running, completed, failed)
     """
     try:
-        from ...scheduler.engine import SchedulerEngine
-        from ...scheduler.executor import AutonomousExecutor
+        from ...scheduler.executor import read_next_run_times
         
         # Get persisted jobs
-        scheduler = SchedulerEngine()
-        jobs = scheduler.list_jobs(state=state)
+        with _open_engine() as scheduler:
+            jobs = scheduler.list_jobs(state=state)
         
-        # Get scheduled jobs (APScheduler)
-        try:
-            executor = AutonomousExecutor()
-            executor.start()
-            scheduled = executor.get_scheduled_jobs()
-            executor.stop(wait=False)
-        except:
-            scheduled = []
+        # Next run times as last recorded by the running scheduler (starting
+        # an executor here would only see an empty job store)
+        next_runs = read_next_run_times()
         
         # Merge information
         result = []
@@ -51,10 +63,8 @@ async def list_jobs(state: str | None = None) -> List[Dict[str, Any]]:
             }
             
             # Add next_run from APScheduler if available
-            for sched_job in scheduled:
-                if sched_job['id'] == job.id:
-                    job_info['next_run'] = sched_job['next_run']
-                    break
+            if job.id in next_runs:
+                job_info['next_run'] = next_runs[job.id]
             
             result.append(job_info)
         
@@ -68,10 +78,8 @@ async def list_jobs(state: str | None = None) -> List[Dict[str, Any]]:
 async def get_job_details(job_id: str) -> Dict[str, Any]:
     """Get detailed information about a job."""
     try:
-        from ...scheduler.engine import SchedulerEngine
-        
-        scheduler = SchedulerEngine()
-        job = scheduler.get_job(job_id)
+        with _open_engine() as scheduler:
+            job = scheduler.get_job(job_id)
         
         if not job:
             raise HTTPException(status_code=404, detail="Job not found")
@@ -102,10 +110,8 @@ async def get_job_details(job_id: str) -> Dict[str, Any]:
 async def cancel_job(job_id: str):
     """Cancel a running or pending job."""
     try:
-        from ...scheduler.engine import SchedulerEngine
-        
-        scheduler = SchedulerEngine()
-        success = scheduler.cancel_job(job_id)
+        with _open_engine() as scheduler:
+            success = scheduler.cancel_job(job_id)
         
         if not success:
             raise HTTPException(status_code=404, detail="Job not found or already terminal")
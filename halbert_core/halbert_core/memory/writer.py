@@ -6,7 +6,7 @@ Phase 4: Per-persona memory isolation
 """
 
 from __future__ import annotations
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 import json
 import logging
@@ -136,6 +136,23 @@ class MemoryWriter:
         """
         return self._append_jsonl(self.runtime_dir / filename, entry)
     
+    def write_action_outcomes(
+        self,
+        entries: List[Dict[str, Any]],
+        filename: str = 'action_outcomes.jsonl'
+    ) -> bool:
+        """
+        Write several action outcomes with one file append.
+        
+        Args:
+            entries: Memory entries to write
+            filename: Target file (default: action_outcomes.jsonl)
+        
+        Returns:
+            True if successful
+        """
+        return self._append_jsonl_many(self.runtime_dir / filename, entries)
+    
     def write_anomaly_event(
         self,
         entry: Dict[str, Any],
@@ -209,6 +226,19 @@ class MemoryWriter:
             path: File path
             entry: Entry to append
         
+        Returns:
+            True if successful
+        """
+        return self._append_jsonl_many(path, [entry])
+    
+    def _append_jsonl_many(self, path: Path, entries: List[Dict[str, Any]]) -> bool:
+        """
+        Append entries to JSONL file in one write.
+        
+        Args:
+            path: File path
+            entries: Entries to append
+        
         Returns:
             True if successful
         """
@@ -217,14 +247,17 @@ class MemoryWriter:
             path.parent.mkdir(parents=True, exist_ok=True)
             
             # Add timestamp if not present
-            if 'ts' not in entry:
-                entry['ts'] = datetime.utcnow().isoformat() + 'Z'
+            for entry in entries:
+                if 'ts' not in entry:
+                    entry['ts'] = datetime.utcnow().isoformat() + 'Z'
             
             # Append to file
             with open(path, 'a') as f:
-                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+                f.write(''.join(
+                    json.dumps(entry, ensure_ascii=False) + '\n' for entry in entries
+                ))
             
-            logger.debug(f"Wrote entry to {path}")
+            logger.debug(f"Wrote {len(entries)} entries to {path}")
             return True
         
         except Exception as e:
@@ -103,6 +103,34 @@ class OllamaBackend:
         
         return response['response']
     
+    def generate_batch(
+        self,
+        prompts: List[str],
+        max_tokens: int = 512,
+        temperature: float = 0.7,
+        stop: Optional[List[str]] = None,
+        **kwargs: Any
+    ) -> List[str]:
+        """
+        Generate for several prompts concurrently.
+        
+        The Ollama server batches in-flight requests for the same model
+        (up to OLLAMA_NUM_PARALLEL), so issuing them together shares one
+        scheduling/decode pass instead of queueing behind each other.
+        """
+        self._ensure_client()
+        
+        if len(prompts) <= 1:
+            return [self.generate(p, max_tokens, temperature, stop, **kwargs) for p in prompts]
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        with ThreadPoolExecutor(max_workers=len(prompts)) as executor:
+            return list(executor.map(
+                lambda p: self.generate(p, max_tokens, temperature, stop, **kwargs),
+                prompts
+            ))
+    
     def generate_with_tools(
         self,
         prompt: str,
@@ -147,6 +175,13 @@ class LlamaCppBackend:
                     n_threads=4,  # TODO: Make configurable
                     verbose=False
                 )
+                # Reuse KV state for shared prompt prefixes (system prompt,
+                # fixed instructions) across calls
+                try:
+                    from llama_cpp import LlamaRAMCache
+                    self._llama.set_cache(LlamaRAMCache())
+                except ImportError:
+                    pass
                 logger.info(f"llama.cpp model loaded from: {self.model_path}")
             except ImportError:
                 raise RuntimeError(
@@ -299,6 +334,42 @@ class ModelManager:
         
         return self.backend.generate(prompt, max_tokens, temp, stop, **kwargs)
     
+    def generate_batch(
+        self,
+        prompts: List[str],
+        max_tokens: int = 512,
+        temperature: Optional[float] = None,
+        stop: Optional[List[str]] = None,
+        **kwargs: Any
+    ) -> List[str]:
+        """
+        Generate text for several prompts in one batched call.
+        
+        Uses the backend's batched path when it has one (Ollama), and falls
+        back to sequential generate() calls otherwise.
+        
+        Args:
+            prompts: Input prompts
+            max_tokens: Maximum tokens to generate per prompt
+            temperature: Sampling temperature (overrides config)
+            stop: Stop sequences
+            **kwargs: Additional backend-specific options
+        
+        Returns:
+            Generated texts, one per prompt
+        """
+        if self.backend is None:
+            raise RuntimeError("Model backend not initialized")
+        
+        if self.lora_adapter is None and hasattr(self.backend, 'generate_batch'):
+            temp = temperature if temperature is not None else self.config.temperature
+            return self.backend.generate_batch(prompts, max_tokens, temp, stop, **kwargs)
+        
+        return [
+            self.generate(prompt, max_tokens, temperature, stop, **kwargs)
+            for prompt in prompts
+        ]
+    
     def generate_with_tools(
         self,
         prompt: str,
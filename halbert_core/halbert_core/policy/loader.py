@@ -1,4 +1,6 @@
 from __future__ import annotations
+import copy
+import functools
 import os
 from typing import Any, Dict
 import yaml  # type: ignore
@@ -10,20 +12,31 @@ DEFAULT_POLICY: Dict[str, Any] = {
 }
 
 
+@functools.lru_cache(maxsize=4)
+def _parse_policy(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    # Keyed by file identity so edits to policy.yml are picked up
+    with open(path, "r", encoding="utf-8") as f:
+        doc = yaml.safe_load(f) or {}
+    # Merge with defaults
+    pol = dict(DEFAULT_POLICY)
+    pol.update({k: v for k, v in (doc or {}).items() if k in ("default_allow", "tools")})
+    pol["tools"] = pol.get("tools") or {}
+    return pol
+
+
 def load_policy() -> Dict[str, Any]:
     """
     Load policy from <config>/policy.yml if present, else return DEFAULT_POLICY.
+
+    The parsed file is cached until its mtime or size changes.
     """
     path = os.path.join(config_dir(), "policy.yml")
     try:
-        if os.path.exists(path):
-            with open(path, "r", encoding="utf-8") as f:
-                doc = yaml.safe_load(f) or {}
-            # Merge with defaults
-            pol = dict(DEFAULT_POLICY)
-            pol.update({k: v for k, v in (doc or {}).items() if k in ("default_allow", "tools")})
-            pol["tools"] = pol.get("tools") or {}
-            return pol
+        st = os.stat(path)
+    except OSError:
+        return dict(DEFAULT_POLICY)
+    try:
+        return copy.deepcopy(_parse_policy(path, st.st_mtime_ns, st.st_size))
     except Exception:
         pass
     return dict(DEFAULT_POLICY)
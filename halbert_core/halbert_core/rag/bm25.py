@@ -0,0 +1,150 @@
+"""
+Integer-ID BM25 index for the hybrid retriever.
+
+Implements the same Okapi BM25 scoring as ``rank_bm25.BM25Okapi`` (including
+the epsilon floor on negative IDF), but maps tokens to integer IDs once at
+build time and stores postings in term-major CSR arrays. Scoring a query
+only touches the postings of its terms instead of probing a per-document
+dict for every token.
+
+Because BM25's per-(term, document) contribution does not depend on the
+query, it is precomputed into one contiguous float32 impact array aligned
+with the postings. Scoring is a gather plus a single ``np.bincount``.
+"""
+
+import logging
+import math
+from collections import Counter
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+logger = logging.getLogger('halbert')
+
+
+class BM25Index:
+    """
+    Okapi BM25 over integer token IDs.
+
+    Postings are stored as CSR arrays keyed by term ID:
+    ``_indptr[t]:_indptr[t + 1]`` slices ``_post_docs`` / ``_post_impacts``.
+    """
+
+    def __init__(
+        self,
+        tokenized_corpus: Sequence[Sequence[str]],
+        k1: float = 1.5,
+        b: float = 0.75,
+        epsilon: float = 0.25
+    ):
+        """
+        Build BM25 index.
+
+        Args:
+            tokenized_corpus: One list of tokens per document
+            k1: Term-frequency saturation
+            b: Document-length normalization
+            epsilon: IDF floor as a fraction of the average IDF
+        """
+        self.k1 = k1
+        self.b = b
+        self.epsilon = epsilon
+
+        self._vocab: Dict[str, int] = {}
+
+        term_ids: List[int] = []
+        doc_ids: List[int] = []
+        tfs: List[int] = []
+        doc_lens: List[int] = []
+
+        for doc_idx, tokens in enumerate(tokenized_corpus):
+            doc_lens.append(len(tokens))
+            for token, tf in Counter(tokens).items():
+                term_id = self._vocab.setdefault(token, len(self._vocab))
+                term_ids.append(term_id)
+                doc_ids.append(doc_idx)
+                tfs.append(tf)
+
+        self.corpus_size = len(doc_lens)
+        self._doc_lens = np.asarray(doc_lens, dtype=np.int32)
+        self.avgdl = float(self._doc_lens.mean()) if self.corpus_size else 0.0
+
+        # Group postings by term (stable, so doc IDs stay ascending per term)
+        term_arr = np.asarray(term_ids, dtype=np.int32)
+        order = np.argsort(term_arr, kind='stable')
+        self._post_docs = np.asarray(doc_ids, dtype=np.int32)[order]
+        post_terms = term_arr[order]
+        post_tfs = np.asarray(tfs, dtype=np.float32)[order]
+
+        doc_freq = np.bincount(term_arr, minlength=len(self._vocab))
+        self._indptr = np.zeros(len(self._vocab) + 1, dtype=np.int64)
+        np.cumsum(doc_freq, out=self._indptr[1:])
+
+        self._idf = self._calc_idf(doc_freq).astype(np.float32)
+
+        # Per-document length normalization, computed once
+        if self.corpus_size:
+            self._doc_norm = (
+                k1 * (1 - b + b * self._doc_lens / self.avgdl)
+            ).astype(np.float32)
+        else:
+            self._doc_norm = np.zeros(0, dtype=np.float32)
+
+        # Query-independent impact of each posting
+        self._post_impacts = (
+            self._idf[post_terms]
+            * (post_tfs * (k1 + 1))
+            / (post_tfs + self._doc_norm[self._post_docs])
+        ).astype(np.float32)
+
+    def _calc_idf(self, doc_freq: np.ndarray) -> np.ndarray:
+        """IDF per term ID, with negative values floored to eps * average IDF."""
+        idf = np.array(
+            [
+                math.log(self.corpus_size - freq + 0.5) - math.log(freq + 0.5)
+                for freq in doc_freq.tolist()
+            ],
+            dtype=np.float64
+        )
+        if len(idf):
+            eps = self.epsilon * float(idf.mean())
+            idf[idf < 0] = eps
+        return idf
+
+    @property
+    def vocab_size(self) -> int:
+        """Number of distinct terms."""
+        return len(self._vocab)
+
+    def token_ids(self, tokens: Sequence[str]) -> List[int]:
+        """Map tokens to term IDs, dropping out-of-vocabulary tokens."""
+        vocab = self._vocab
+        return [vocab[t] for t in tokens if t in vocab]
+
+    def get_scores(self, query: Sequence[str]) -> np.ndarray:
+        """
+        Score every document against a tokenized query.
+
+        Args:
+            query: Query tokens (repeated tokens count repeatedly)
+
+        Returns:
+            float32 array of BM25 scores, one per document
+        """
+        term_ids = self.token_ids(query)
+        if not self.corpus_size or not term_ids:
+            return np.zeros(self.corpus_size, dtype=np.float32)
+
+        if len(term_ids) == 1:
+            start, end = self._indptr[term_ids[0]], self._indptr[term_ids[0] + 1]
+            scores = np.zeros(self.corpus_size, dtype=np.float32)
+            scores[self._post_docs[start:end]] = self._post_impacts[start:end]
+            return scores
+
+        slices = [slice(self._indptr[t], self._indptr[t + 1]) for t in term_ids]
+        docs = np.concatenate([self._post_docs[sl] for sl in slices])
+        impacts = np.concatenate([self._post_impacts[sl] for sl in slices])
+
+        return np.bincount(
+            docs, weights=impacts, minlength=self.corpus_size
+        ).astype(np.float32)
@@ -85,13 +85,19 @@ class EmbeddingManager:
         
         return self._reranker
     
-    def encode_queries(self, queries: List[str], batch_size: int = 32) -> np.ndarray:
+    def encode_queries(
+        self,
+        queries: List[str],
+        batch_size: int = 32,
+        normalize: bool = True
+    ) -> np.ndarray:
         """
         Encode queries to embeddings.
         
         Args:
             queries: List of query strings
             batch_size: Batch size for encoding
+            normalize: L2-normalize inside the forward pass (cosine == dot)
             
         Returns:
             numpy array of embeddings (n_queries, embedding_dim)
@@ -101,7 +107,8 @@ class EmbeddingManager:
             queries,
             batch_size=batch_size,
             show_progress_bar=False,
-            convert_to_numpy=True
+            convert_to_numpy=True,
+            normalize_embeddings=normalize
         )
         return embeddings
     
@@ -109,7 +116,8 @@ class EmbeddingManager:
         self,
         documents: List[str],
         batch_size: int = 32,
-        show_progress: bool = True
+        show_progress: bool = True,
+        normalize: bool = True
     ) -> np.ndarray:
         """
         Encode documents to embeddings.
@@ -118,6 +126,7 @@ class EmbeddingManager:
             documents: List of document strings
             batch_size: Batch size for encoding
             show_progress: Show progress bar
+            normalize: L2-normalize inside the forward pass (cosine == dot)
             
         Returns:
             numpy array of embeddings (n_docs, embedding_dim)
@@ -127,7 +136,8 @@ class EmbeddingManager:
             documents,
             batch_size=batch_size,
             show_progress_bar=show_progress,
-            convert_to_numpy=True
+            convert_to_numpy=True,
+            normalize_embeddings=normalize
         )
         logger.info(f"Encoded {len(documents)} documents to {embeddings.shape}")
         return embeddings
@@ -5,9 +5,10 @@ Orchestrates retrieval, context building, and integration with LLM.
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterable, Iterator
 from pathlib import Path
 from dataclasses import dataclass, asdict
+import io
 import json
 
 from .embeddings import EmbeddingManager
@@ -105,24 +106,12 @@ class RAGPipeline:
         
         logger.info(f"Indexing {len(documents)} documents")
         
-        # Normalize documents (handle old schema)
-        documents = self._normalize_documents(documents)
-        
-        # Prepare documents for indexing
-        indexed_docs = []
-        for doc in documents:
-            # Create searchable content
-            content = self._format_document_content(doc)
-            
-            indexed_docs.append({
-                'id': doc.get('name', doc.get('id', 'unknown')),
-                'content': content,
-                'name': doc.get('name', ''),
-                'section': doc.get('section', ''),
-                'description': doc.get('description', ''),
-                'full_text': doc.get('full_text', ''),
-                'metadata': doc
-            })
+        # Normalize and format in a single streaming pass so each document
+        # is touched once and no intermediate list is materialized
+        indexed_docs = (
+            self._to_indexed_document(doc)
+            for doc in self._iter_normalized_documents(documents)
+        )
         
         # Index documents
         self.retriever.index_documents(
@@ -132,7 +121,19 @@ class RAGPipeline:
         )
         
         self._indexed = True
-        logger.info(f"Indexed {len(indexed_docs)} documents")
+        logger.info(f"Indexed {len(self.retriever._doc_ids)} documents")
+    
+    def _to_indexed_document(self, doc: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the retriever record for a normalized document."""
+        return {
+            'id': doc.get('name', doc.get('id', 'unknown')),
+            'content': self._format_document_content(doc),
+            'name': doc.get('name', ''),
+            'section': doc.get('section', ''),
+            'description': doc.get('description', ''),
+            'full_text': doc.get('full_text', ''),
+            'metadata': doc
+        }
     
     def _load_jsonl(self, path: Path) -> List[Dict[str, Any]]:
         """Load documents from JSONL file."""
@@ -161,18 +162,23 @@ class RAGPipeline:
         Handles old schema: {"text": "...", "metadata": {"man_page": "name(section)"}}
         Converts to: {"name": "...", "section": "...", "full_text": "..."}
         """
-        normalized = []
-        
+        return list(self._iter_normalized_documents(documents))
+    
+    def _iter_normalized_documents(
+        self,
+        documents: Iterable[Dict[str, Any]]
+    ) -> Iterator[Dict[str, Any]]:
+        """Lazily normalize document schema (see _normalize_documents)."""
         for doc in documents:
             # If already in new schema, keep as-is
             if 'name' in doc and 'full_text' in doc:
-                normalized.append(doc)
+                yield doc
                 continue
             
             # Handle 'content' field (Phase 10 user-added docs)
             if 'name' in doc and 'content' in doc:
                 doc['full_text'] = doc['content']
-                normalized.append(doc)
+                yield doc
                 continue
             
             # Convert old schema
@@ -219,18 +225,16 @@ class RAGPipeline:
                             description = line[:200]
                             break
                 
-                normalized.append({
+                yield {
                     'name': name or 'Unknown',
                     'section': section,
                     'description': description,
                     'full_text': text,
                     'metadata': metadata
-                })
+                }
             else:
                 # Unknown schema, keep as-is
-                normalized.append(doc)
-        
-        return normalized
+                yield doc
     
     def _format_document_content(self, doc: Dict[str, Any]) -> str:
         """
@@ -339,11 +343,13 @@ class RAGPipeline:
         if not documents:
             return ""
         
+        # Rough token estimate: 1 token ≈ 4 chars, split evenly across docs
+        max_chars = (self.max_context_length // len(documents)) * 4
+        
         # Format context
-        context_parts = [
-            "# Relevant Documentation\n",
-            f"Query: {query}\n"
-        ]
+        buf = io.StringIO()
+        buf.write("# Relevant Documentation\n")
+        buf.write(f"\nQuery: {query}\n")
         
         for i, doc in enumerate(documents, 1):
             name = doc.get('name', 'Unknown')
@@ -352,24 +358,25 @@ class RAGPipeline:
             
             # Header
             if section:
-                context_parts.append(f"\n## {i}. {name}({section})")
+                buf.write(f"\n\n## {i}. {name}({section})")
             else:
-                context_parts.append(f"\n## {i}. {name}")
+                buf.write(f"\n\n## {i}. {name}")
             
             # Description
             if description:
-                context_parts.append(f"{description}\n")
+                buf.write(f"\n{description}\n")
             
             # Content (truncate if needed)
             content = doc.get('full_text', doc.get('content', ''))
             if content:
-                # Rough token estimate: 1 token ≈ 4 chars
-                max_chars = (self.max_context_length // len(documents)) * 4
+                buf.write('\n')
                 if len(content) > max_chars:
-                    content = content[:max_chars] + '...'
-                context_parts.append(content)
+                    buf.write(content[:max_chars])
+                    buf.write('...')
+                else:
+                    buf.write(content)
         
-        context = '\n'.join(context_parts)
+        context = buf.getvalue()
         
         logger.debug(f"Built context with {len(documents)} documents (~{len(context)} chars)")
         return context
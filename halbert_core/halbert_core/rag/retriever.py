@@ -4,14 +4,59 @@ Hybrid retriever combining BM25 (sparse) and dense embeddings.
 Uses Reciprocal Rank Fusion (RRF) to merge results from both retrievers.
 """
 
+import hashlib
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterable
 from dataclasses import dataclass
 import numpy as np
 
+from .bm25 import BM25Index
+
 logger = logging.getLogger('halbert')
 
 
+def _to_dense_tensor(embeddings: np.ndarray):
+    """
+    Move a normalized embedding matrix to reduced precision.
+
+    Uses FP16 on GPU and BF16 on CPU when torch is available (it ships with
+    sentence-transformers). Falls back to float32 numpy otherwise.
+    """
+    try:
+        import torch
+    except ImportError:
+        return np.ascontiguousarray(embeddings, dtype=np.float32)
+    
+    if torch.cuda.is_available():
+        device, dtype = 'cuda', torch.float16
+    else:
+        device, dtype = 'cpu', torch.bfloat16
+    
+    tensor = torch.from_numpy(np.ascontiguousarray(embeddings, dtype=np.float32))
+    return tensor.to(device=device, dtype=dtype)
+
+
+def _content_key(text: str) -> bytes:
+    """Stable digest of indexed text, used to memoize embeddings."""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+
+def _top_k_indices(scores: np.ndarray, top_k: int) -> np.ndarray:
+    """
+    Indices of the top_k highest scores, sorted descending.
+
+    O(N) partition plus O(k log k) sort instead of a full O(N log N) argsort.
+    """
+    n = len(scores)
+    if top_k <= 0 or n == 0:
+        return np.empty(0, dtype=np.intp)
+    if top_k >= n:
+        return np.argsort(-scores, kind='stable')
+    
+    idx = np.argpartition(-scores, top_k - 1)[:top_k]
+    return idx[np.argsort(-scores[idx], kind='stable')]
+
+
 @dataclass
 class RetrievalResult:
     """Single retrieval result."""
@@ -56,6 +101,10 @@ class HybridRetriever:
         self._doc_metadata = []
         self._dense_index = None
         
+        # Embedding rows keyed by content digest, so re-indexing only
+        # encodes new or changed documents
+        self._embedding_cache: Dict[bytes, np.ndarray] = {}
+        
         logger.info(
             f"Initialized HybridRetriever "
             f"(BM25:{bm25_weight}, Dense:{dense_weight}, RRF_k:{rrf_k})"
@@ -63,7 +112,7 @@ class HybridRetriever:
     
     def index_documents(
         self,
-        documents: List[Dict[str, Any]],
+        documents: Iterable[Dict[str, Any]],
         text_field: str = 'content',
         id_field: str = 'id'
     ):
@@ -71,16 +120,18 @@ class HybridRetriever:
         Index documents for retrieval.
         
         Args:
-            documents: List of document dicts with text and metadata
+            documents: Iterable of document dicts with text and metadata
+                (consumed once, so a generator avoids an intermediate list)
             text_field: Field name for document text
             id_field: Field name for document ID
         """
-        logger.info(f"Indexing {len(documents)} documents")
+        logger.info("Indexing documents")
         
-        # Extract text and metadata
+        # Extract text and metadata, tokenizing for BM25 in the same pass
         self._documents = []
         self._doc_ids = []
         self._doc_metadata = []
+        tokenized_docs = []
         
         for doc in documents:
             text = doc.get(text_field, '')
@@ -92,49 +143,106 @@ class HybridRetriever:
             self._documents.append(text)
             self._doc_ids.append(doc_id)
             self._doc_metadata.append(doc)
+            tokenized_docs.append(self._tokenize(text))
         
         logger.info(f"Extracted {len(self._documents)} valid documents")
         
-        # Build BM25 index
-        self._build_bm25_index()
+        # Build BM25 index (token lists are released once it is built)
+        self._build_bm25_index(tokenized_docs)
+        del tokenized_docs
         
         # Build dense index
         self._build_dense_index()
         
         logger.info("Document indexing complete")
     
-    def _build_bm25_index(self):
-        """Build BM25 sparse index."""
-        try:
-            from rank_bm25 import BM25Okapi
-            
-            logger.info("Building BM25 index")
-            
-            # Tokenize documents (simple whitespace split)
-            tokenized_docs = [doc.lower().split() for doc in self._documents]
-            
-            self._bm25 = BM25Okapi(tokenized_docs)
-            
-            logger.info(f"BM25 index built with {len(tokenized_docs)} documents")
-            
-        except ImportError:
-            logger.error("rank-bm25 not installed. Run: pip install rank-bm25")
-            raise
+    @staticmethod
+    def _tokenize(text: str) -> List[str]:
+        """BM25 tokenizer (lowercase whitespace split) for docs and queries."""
+        return text.lower().split()
+    
+    def _build_bm25_index(self, tokenized_docs: List[List[str]]):
+        """Build BM25 sparse index from pre-tokenized documents."""
+        logger.info("Building BM25 index")
+        
+        self._bm25 = BM25Index(tokenized_docs)
+        
+        logger.info(
+            f"BM25 index built with {len(tokenized_docs)} documents "
+            f"({self._bm25.vocab_size} terms)"
+        )
     
     def _build_dense_index(self):
         """Build dense embedding index."""
         logger.info("Building dense embedding index")
         
-        # Encode all documents
-        embeddings = self.embedding_manager.encode_documents(
-            self._documents,
-            show_progress=True
+        keys = [_content_key(text) for text in self._documents]
+        missing = {}
+        for i, key in enumerate(keys):
+            if key not in self._embedding_cache and key not in missing:
+                missing[key] = i
+        
+        # Encode new/changed documents only (L2-normalized by the encoder,
+        # so cosine similarity is a single mat-vec per query)
+        if missing:
+            new_embeddings = self.embedding_manager.encode_documents(
+                [self._documents[i] for i in missing.values()],
+                show_progress=True,
+                normalize=True
+            )
+            for key, row in zip(missing, new_embeddings):
+                self._embedding_cache[key] = row
+        
+        logger.info(
+            f"Encoded {len(missing)} new documents, "
+            f"reused {len(keys) - len(missing)} cached embeddings"
         )
         
-        # Store embeddings (using simple numpy for now, can swap to FAISS later)
-        self._dense_index = embeddings
+        # Drop rows for documents no longer in the corpus
+        self._embedding_cache = {key: self._embedding_cache[key] for key in keys}
+        
+        if keys:
+            embeddings = np.stack([self._embedding_cache[key] for key in keys])
+        else:
+            embeddings = np.zeros(
+                (0, self.embedding_manager.embedding_dimension), dtype=np.float32
+            )
         
-        logger.info(f"Dense index built: {embeddings.shape}")
+        # Store in FP16 (GPU) / BF16 (CPU) to halve memory traffic per scan
+        self._dense_index = _to_dense_tensor(embeddings)
+        
+        logger.info(f"Dense index built: {tuple(embeddings.shape)}")
+    
+    def _dense_top_k(self, query_embedding: np.ndarray, top_k: int):
+        """
+        Cosine similarity of a normalized query against the dense index,
+        fused with top-k selection.
+        
+        Returns:
+            (indices, scores) numpy arrays, sorted by score descending
+        """
+        if isinstance(self._dense_index, np.ndarray):
+            sims = self._dense_index @ query_embedding.astype(np.float32)
+            top_indices = _top_k_indices(sims, top_k)
+            return top_indices, sims[top_indices]
+        
+        import torch
+        
+        index = self._dense_index
+        k = min(top_k, index.shape[0])
+        if k <= 0:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float32)
+        
+        query = torch.from_numpy(
+            np.ascontiguousarray(query_embedding, dtype=np.float32)
+        ).to(device=index.device, dtype=index.dtype)
+        
+        # Mat-vec and top-k run back to back on the device; only k
+        # scores/indices are copied back to the host
+        with torch.inference_mode():
+            values, indices = torch.topk(torch.mv(index, query), k)
+        
+        return indices.cpu().numpy(), values.float().cpu().numpy()
     
     def retrieve_bm25(self, query: str, top_k: int = 20) -> List[RetrievalResult]:
         """
@@ -152,13 +260,13 @@ class HybridRetriever:
             return []
         
         # Tokenize query
-        tokenized_query = query.lower().split()
+        tokenized_query = self._tokenize(query)
         
         # Get scores
         scores = self._bm25.get_scores(tokenized_query)
         
         # Get top-k indices
-        top_indices = np.argsort(scores)[::-1][:top_k]
+        top_indices = _top_k_indices(scores, top_k)
         
         results = []
         for idx in top_indices:
@@ -191,26 +299,19 @@ class HybridRetriever:
             logger.warning("Dense index not built")
             return []
         
-        # Encode query
-        query_embedding = self.embedding_manager.encode_queries([query])[0]
+        # Encode query (normalized, like the index)
+        query_embedding = self.embedding_manager.encode_queries(
+            [query], normalize=True
+        )[0]
         
-        # Compute cosine similarity with all documents
-        # Normalize embeddings for cosine similarity
-        query_norm = query_embedding / np.linalg.norm(query_embedding)
-        doc_norms = self._dense_index / np.linalg.norm(
-            self._dense_index, axis=1, keepdims=True
-        )
-        
-        similarities = np.dot(doc_norms, query_norm)
-        
-        # Get top-k indices
-        top_indices = np.argsort(similarities)[::-1][:top_k]
+        # Cosine similarity with all documents + top-k in one step
+        top_indices, top_scores = self._dense_top_k(query_embedding, top_k)
         
         results = []
-        for idx in top_indices:
+        for idx, score in zip(top_indices, top_scores):
             results.append(RetrievalResult(
                 doc_id=self._doc_ids[idx],
-                score=float(similarities[idx]),
+                score=float(score),
                 content=self._documents[idx],
                 metadata=self._doc_metadata[idx],
                 source='dense'
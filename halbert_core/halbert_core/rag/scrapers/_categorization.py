@@ -0,0 +1,92 @@
+"""
+Topic categorization shared by the scrapers.
+
+Keyword tables are built once at import time. Free text (titles, page
+content) is matched by substring against one precompiled alternation per
+category. Stack Overflow tags are matched exactly against per-category
+frozensets.
+"""
+
+import re
+from typing import Iterable
+
+# Category keywords, in priority order (first matching category wins)
+_CATEGORY_KEYWORDS = {
+    'system_admin': ['systemd', 'service', 'daemon', 'init', 'boot'],
+    'networking': ['network', 'interface', 'ip', 'firewall', 'ssh', 'vpn'],
+    'file_system': ['file system', 'mount', 'disk', 'partition', 'lvm', 'raid'],
+    'security': ['security', 'encryption', 'sudo', 'permission', 'firewall'],
+    'package_mgmt': ['pacman', 'package', 'makepkg', 'repository'],
+    'kernel': ['kernel', 'module', 'driver'],
+    'hardware': ['hardware', 'device', 'driver', 'usb', 'pci'],
+    'shell': ['bash', 'shell', 'script', 'command line'],
+}
+
+# One precompiled alternation per category; plain substring matching, same
+# as `keyword in text`, but a single C-level scan per category
+_CATEGORY_PATTERNS = [
+    (category, re.compile('|'.join(map(re.escape, keywords))))
+    for category, keywords in _CATEGORY_KEYWORDS.items()
+]
+
+# Stack Exchange tags per category, in priority order (exact tag match)
+_CATEGORY_TAGS = {
+    'system_admin': frozenset({'systemd', 'systemctl', 'init', 'service', 'daemon'}),
+    'networking': frozenset({'networking', 'network', 'ssh', 'firewall', 'iptables'}),
+    'file_system': frozenset({'filesystem', 'disk-space', 'partition', 'mount'}),
+    'security': frozenset({'security', 'sudo', 'permissions', 'encryption'}),
+    'shell': frozenset({'bash', 'shell', 'scripting'}),
+}
+
+
+def categorize(title: str, content: str, tags: Iterable[str]) -> str:
+    """
+    Categorize a document by keywords in its title, tags and content.
+
+    Title and tags are checked first (more reliable), then the first
+    1000 characters of content.
+
+    Args:
+        title: Document title
+        content: Document text
+        tags: Lowercased tags
+
+    Returns:
+        Category name, or 'general'
+    """
+    title_lower = title.lower()
+    tags = list(tags)
+
+    for category, pattern in _CATEGORY_PATTERNS:
+        if pattern.search(title_lower) or any(pattern.search(tag) for tag in tags):
+            return category
+
+    content_head = content[:1000].lower()
+    for category, pattern in _CATEGORY_PATTERNS:
+        if pattern.search(content_head):
+            return category
+
+    return 'general'
+
+
+def categorize_tags(tags: Iterable[str]) -> str:
+    """
+    Categorize by exact Stack Exchange tag membership.
+
+    Args:
+        tags: Question tags
+
+    Returns:
+        Category name, 'linux_general' for otherwise untagged Linux
+        questions, or 'general'
+    """
+    tag_set = {t.lower() for t in tags}
+
+    for category, category_tags in _CATEGORY_TAGS.items():
+        if not category_tags.isdisjoint(tag_set):
+            return category
+
+    if 'linux' in tag_set:
+        return 'linux_general'
+
+    return 'general'
@@ -4,15 +4,162 @@ Arch Wiki scraper for Linux documentation.
 Scrapes high-quality system administration content from Arch Wiki.
 """
 
+import asyncio
 import logging
-from typing import List, Optional
-from datetime import datetime
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 import re
 
-from .base import BaseScraper, ScrapedDocument, ScraperConfig
+from ._categorization import categorize
+from .base import BaseScraper, ScrapedDocument, ScraperConfig, HTML_PARSER
 
 logger = logging.getLogger('halbert')
 
+# selectolax (lexbor C parser) is much faster than BeautifulSoup for the
+# fixed-shape wiki pages; BeautifulSoup remains the fallback
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser
+    except ImportError:
+        HTMLParser = None
+
+# Without selectolax, raw lxml strips and extracts in C; BeautifulSoup is
+# the last resort
+try:
+    import lxml.html
+    from lxml import etree
+    # MediaWiki always serves UTF-8; lxml would otherwise assume Latin-1
+    # for bytes without a charset declaration
+    _LXML_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+except ImportError:
+    etree = None
+
+try:
+    from bs4 import BeautifulSoup
+    _HAS_BS4 = True
+except ImportError:
+    BeautifulSoup = None
+    _HAS_BS4 = False
+
+
+def _has_html_parser() -> bool:
+    """Check for an HTML parser, logging if none is installed."""
+    if HTMLParser is None and etree is None and not _HAS_BS4:
+        logger.error("beautifulsoup4 not installed. Run: pip install beautifulsoup4")
+        return False
+    return True
+
+
+def _clean_tags(link_texts: Iterable[str]) -> List[str]:
+    """Normalize category link texts into tags."""
+    tags = []
+    
+    for text in link_texts:
+        text = text.strip()
+        if text and text not in ['Categories', 'Category']:
+            tags.append(text.lower().replace(' ', '_'))
+    
+    return tags[:10]  # Limit to 10 tags
+
+
+def parse_html(html: bytes) -> Optional[Tuple[str, str, List[str]]]:
+    """
+    Extract (title, text, tags) from a rendered Arch Wiki page.
+    
+    Module-level (not a method) so it can run in a process pool.
+    
+    Args:
+        html: Raw page HTML bytes
+        
+    Returns:
+        Tuple of title, raw content text and tags, or None if the page has
+        no content element
+    """
+    if HTMLParser is not None:
+        return _parse_selectolax(html)
+    if etree is not None:
+        return _parse_lxml(html)
+    return _parse_bs4(html)
+
+
+def _parse_selectolax(html: bytes) -> Optional[Tuple[str, str, List[str]]]:
+    """Extract (title, text, tags) with selectolax's C parser."""
+    tree = HTMLParser(html)
+    
+    title_elem = tree.css_first('h1#firstHeading')
+    title = title_elem.text(strip=True) if title_elem else ''
+    
+    content_elem = tree.css_first('div#mw-content-text')
+    if content_elem is None:
+        return None
+    
+    # Remove unwanted elements
+    for elem in content_elem.css('script, style, noscript'):
+        elem.decompose()
+    
+    content = content_elem.text(separator='\n', strip=True)
+    
+    # Extract categories/tags
+    tags = _clean_tags(link.text() for link in tree.css('div#catlinks a'))
+    
+    return title, content, tags
+
+
+def _parse_lxml(html: bytes) -> Optional[Tuple[str, str, List[str]]]:
+    """Extract (title, text, tags) with lxml, without a BeautifulSoup tree."""
+    root = lxml.html.fromstring(html, parser=_LXML_PARSER)
+    
+    title_elem = root.find('.//h1[@id="firstHeading"]')
+    title = title_elem.text_content().strip() if title_elem is not None else ''
+    
+    content_elem = root.find('.//div[@id="mw-content-text"]')
+    if content_elem is None:
+        return None
+    
+    # Remove unwanted elements (single C-level pass, keeps their tails)
+    etree.strip_elements(content_elem, 'script', 'style', 'noscript', with_tail=False)
+    
+    # Same as get_text(separator='\n', strip=True)
+    content = '\n'.join(
+        text for text in (s.strip() for s in content_elem.itertext()) if text
+    )
+    
+    # Extract categories/tags
+    tags = _clean_tags(
+        link.text_content() for link in root.iterfind('.//div[@id="catlinks"]//a')
+    )
+    
+    return title, content, tags
+
+
+def _parse_bs4(html: bytes) -> Optional[Tuple[str, str, List[str]]]:
+    """Extract (title, text, tags) with BeautifulSoup (fallback)."""
+    soup = BeautifulSoup(html, HTML_PARSER)
+    
+    title_elem = soup.find('h1', {'id': 'firstHeading'})
+    title = title_elem.text.strip() if title_elem else ''
+    
+    content_elem = soup.find('div', {'id': 'mw-content-text'})
+    if not content_elem:
+        return None
+    
+    # Remove unwanted elements
+    for elem in content_elem(['script', 'style', 'noscript']):
+        elem.decompose()
+    
+    content = content_elem.get_text(separator='\n', strip=True)
+    
+    # Extract categories/tags
+    tags = []
+    cat_box = soup.find('div', {'id': 'catlinks'})
+    if cat_box:
+        tags = _clean_tags(link.text for link in cat_box.find_all('a'))
+    
+    return title, content, tags
+
 
 class ArchWikiScraper(BaseScraper):
     """
@@ -59,6 +206,13 @@ class ArchWikiScraper(BaseScraper):
     
     BASE_URL = 'https://wiki.archlinux.org'
     
+    # TextExtracts accepts at most 20 titles per query
+    EXTRACTS_BATCH_SIZE = 20
+    
+    # Full-page extracts come one page per response, the rest of a batch
+    # through 'continue'; cap the follow-ups in case the API keeps going
+    MAX_CONTINUATIONS = 2 * EXTRACTS_BATCH_SIZE
+    
     def get_source_name(self) -> str:
         """Get source name."""
         return 'arch_wiki'
@@ -67,34 +221,254 @@ class ArchWikiScraper(BaseScraper):
         """
         Scrape Arch Wiki pages.
         
+        Plain-text extracts are pulled in batches through the MediaWiki API;
+        pages the API returns no extract for fall back to fetching and
+        parsing the rendered HTML. Fetches run concurrently when aiohttp is
+        available, sequentially otherwise.
+        
         Args:
             max_pages: Maximum number of pages to scrape
             
         Returns:
             List of scraped documents
         """
+        if self.can_scrape_async():
+            return asyncio.run(self.scrape_async(max_pages))
+        
         logger.info(f"Starting Arch Wiki scrape (max_pages={max_pages})")
+        self._start_run()
+        
+        titles = self.PRIORITY_PAGES[:max_pages]
+        
+        # Batched plain-text extracts first
+        found = {}
+        for batch in self._title_batches(titles):
+            found.update(self.fetch_extracts(batch))
+        
+        # HTML fallback for anything the API didn't cover
+        fetched = []
+        for title in titles:
+            if title not in found:
+                url = self._page_url(title)
+                html = self.fetch_url(url)
+                if html:
+                    fetched.append((title, url, html))
+                else:
+                    found[title] = None
+        found.update(self.parse_pages(fetched))
+        
+        return self._finish_scrape([found[title] for title in titles])
+    
+    async def scrape_async(self, max_pages: int = 100) -> List[ScrapedDocument]:
+        """
+        Scrape Arch Wiki pages with overlapped, rate-limited async fetches.
+        
+        Args:
+            max_pages: Maximum number of pages to scrape
+            
+        Returns:
+            List of scraped documents
+        """
+        logger.info(f"Starting async Arch Wiki scrape (max_pages={max_pages})")
+        self._start_run()
+        
+        titles = self.PRIORITY_PAGES[:max_pages]
+        
+        async with self.open_session() as session:
+            found = {}
+            for extracts in await asyncio.gather(*(
+                self.fetch_extracts_async(session, batch)
+                for batch in self._title_batches(titles)
+            )):
+                found.update(extracts)
+            
+            missing = [title for title in titles if title not in found]
+            urls = [self._page_url(title) for title in missing]
+            htmls = await asyncio.gather(*(
+                self.fetch_url_async(session, url) for url in urls
+            ))
         
+        # Parse after the session closes (CPU-bound, runs in a process pool)
+        fetched = []
+        for title, url, html in zip(missing, urls, htmls):
+            if html:
+                fetched.append((title, url, html))
+            else:
+                found[title] = None
+        found.update(self.parse_pages(fetched))
+        
+        return self._finish_scrape([found[title] for title in titles])
+    
+    def _finish_scrape(self, pages: List[Optional[ScrapedDocument]]) -> List[ScrapedDocument]:
+        """Validate, deduplicate and save scraped pages."""
         documents = []
         
-        # Scrape priority pages first
-        for page_title in self.PRIORITY_PAGES[:max_pages]:
-            doc = self.scrape_page(page_title)
+        for doc in pages:
             if doc and self.validate_document(doc):
                 documents.append(doc)
                 logger.info(f"Scraped: {doc.title} ({len(doc.content)} chars)")
-            
-            if len(documents) >= max_pages:
-                break
         
         logger.info(f"Scraped {len(documents)} pages from Arch Wiki")
         
         # Deduplicate and save
         documents = self.deduplicate_documents(documents)
         self.save_documents(documents)
+        self._end_run()
         
         return documents
     
+    def _page_url(self, page_title: str) -> str:
+        """Build the wiki URL for a page title."""
+        return f"{self.BASE_URL}/title/{page_title.replace(' ', '_')}"
+    
+    def _title_batches(self, titles: List[str]) -> List[List[str]]:
+        """Split titles into API-sized batches."""
+        size = self.EXTRACTS_BATCH_SIZE
+        return [titles[i:i + size] for i in range(0, len(titles), size)]
+    
+    def _extracts_params(self, titles: List[str]) -> Dict[str, Any]:
+        """Query parameters for a batched extracts + categories request."""
+        return {
+            'action': 'query',
+            'format': 'json',
+            'formatversion': 2,
+            'prop': 'extracts|categories',
+            'explaintext': 1,
+            'exlimit': 'max',
+            'cllimit': 'max',
+            'clshow': '!hidden',
+            'redirects': 1,
+            'titles': '|'.join(titles),
+        }
+    
+    def fetch_extracts(self, titles: List[str]) -> Dict[str, ScrapedDocument]:
+        """
+        Fetch plain-text extracts for a batch of pages via the MediaWiki API.
+        
+        Without exintro, TextExtracts returns one full extract per response
+        and signals the rest through 'continue', which is followed until the
+        batch is complete.
+        
+        Args:
+            titles: Up to EXTRACTS_BATCH_SIZE page titles
+            
+        Returns:
+            Documents keyed by requested title; titles without an extract
+            are omitted so the caller can fall back to HTML
+        """
+        url = f"{self.BASE_URL}/api.php"
+        params = self._extracts_params(titles)
+        merged: Dict[str, Any] = {}
+        
+        for _ in range(self.MAX_CONTINUATIONS + 1):
+            data = self.fetch_url(url, params=params, as_json=True)
+            cont = self._merge_extracts(merged, data)
+            if not cont:
+                break
+            params = {**params, **cont}
+        
+        return self._parse_extracts(titles, merged)
+    
+    async def fetch_extracts_async(self, session, titles: List[str]) -> Dict[str, ScrapedDocument]:
+        """
+        Fetch plain-text extracts for a batch of pages asynchronously.
+        
+        Args:
+            session: Session from open_session()
+            titles: Up to EXTRACTS_BATCH_SIZE page titles
+            
+        Returns:
+            Documents keyed by requested title
+        """
+        url = f"{self.BASE_URL}/api.php"
+        params = self._extracts_params(titles)
+        merged: Dict[str, Any] = {}
+        
+        for _ in range(self.MAX_CONTINUATIONS + 1):
+            data = await self.fetch_url_async(session, url, params=params, as_json=True)
+            cont = self._merge_extracts(merged, data)
+            if not cont:
+                break
+            params = {**params, **cont}
+        
+        return self._parse_extracts(titles, merged)
+    
+    def _merge_extracts(
+        self,
+        merged: Dict[str, Any],
+        data: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fold one extracts response into merged, a combined response.
+        
+        Pages are merged by title: the first extract wins and categories
+        (split across responses by clcontinue) are concatenated.
+        
+        Returns:
+            The response's 'continue' parameters, or None when done or on
+            error
+        """
+        if not data or 'query' not in data:
+            if data and 'error' in data:
+                logger.warning(f"Extracts API error: {data['error'].get('info', data['error'])}")
+            return None
+        
+        query = data['query']
+        acc = merged.setdefault('query', {'normalized': [], 'redirects': [], 'pages': []})
+        if not acc['pages']:
+            acc['normalized'] = query.get('normalized', [])
+            acc['redirects'] = query.get('redirects', [])
+        
+        pages = {page.get('title'): page for page in acc['pages']}
+        for page in query.get('pages', []):
+            existing = pages.get(page.get('title'))
+            if existing is None:
+                page = dict(page)
+                acc['pages'].append(page)
+                pages[page.get('title')] = page
+                continue
+            if not existing.get('extract') and page.get('extract'):
+                existing['extract'] = page['extract']
+            if page.get('categories'):
+                existing['categories'] = existing.get('categories', []) + page['categories']
+        
+        return data.get('continue')
+    
+    def _parse_extracts(self, titles: List[str], data: Optional[Dict[str, Any]]) -> Dict[str, ScrapedDocument]:
+        """Build documents from a (merged) formatversion=2 extracts response."""
+        if not data or 'query' not in data:
+            if data and 'error' in data:
+                logger.warning(f"Extracts API error: {data['error'].get('info', data['error'])}")
+            return {}
+        
+        query = data['query']
+        
+        # Map API titles back to requested ones (underscores, redirects)
+        normalized = {entry['from']: entry['to'] for entry in query.get('normalized', [])}
+        redirects = {entry['from']: entry['to'] for entry in query.get('redirects', [])}
+        requested = {}
+        for title in titles:
+            name = normalized.get(title, title)
+            requested[redirects.get(name, name)] = title
+        
+        documents = {}
+        
+        for page in query.get('pages', []):
+            page_title = requested.get(page.get('title'))
+            content = page.get('extract')
+            if page_title is None or not content:
+                continue
+            
+            tags = _clean_tags(
+                cat['title'].split(':', 1)[-1] for cat in page.get('categories', [])
+            )
+            documents[page_title] = self._build_document(
+                page_title, self._page_url(page_title), page['title'], content, tags
+            )
+        
+        logger.debug(f"Got {len(documents)}/{len(titles)} extracts from API")
+        return documents
+    
     def scrape_page(self, page_title: str) -> Optional[ScrapedDocument]:
         """
         Scrape a single Arch Wiki page.
@@ -105,110 +479,140 @@ class ArchWikiScraper(BaseScraper):
         Returns:
             ScrapedDocument or None on failure
         """
-        url = f"{self.BASE_URL}/title/{page_title.replace(' ', '_')}"
+        url = self._page_url(page_title)
         
         html = self.fetch_url(url)
         if not html:
             return None
         
-        try:
-            from bs4 import BeautifulSoup
-            
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # Extract title
-            title_elem = soup.find('h1', {'id': 'firstHeading'})
-            title = title_elem.text.strip() if title_elem else page_title
-            
-            # Extract main content
-            content_elem = soup.find('div', {'id': 'mw-content-text'})
-            if not content_elem:
-                logger.warning(f"No content found for {page_title}")
-                return None
-            
-            # Remove unwanted elements
-            for elem in content_elem.find_all(['script', 'style', 'noscript']):
-                elem.decompose()
-            
-            # Extract text
-            content = content_elem.get_text(separator='\n', strip=True)
-            content = self.clean_text(content)
-            
-            # Extract categories/tags
-            tags = self._extract_tags(soup)
-            
-            # Determine category
-            category = self._determine_category(title, content, tags)
-            
-            # Create document
-            doc = ScrapedDocument(
-                id=self.generate_doc_id(url),
-                url=url,
-                title=title,
-                content=content,
-                source='arch_wiki',
-                category=category,
-                tags=tags,
-                scraped_at=datetime.now().isoformat(),
-                metadata={
-                    'page_title': page_title,
-                    'language': 'en'
-                }
-            )
+        return self.parse_page(page_title, url, html)
+    
+    async def scrape_page_async(self, session, page_title: str) -> Optional[ScrapedDocument]:
+        """
+        Scrape a single Arch Wiki page asynchronously.
+        
+        Args:
+            session: Session from open_session()
+            page_title: Page title (e.g., 'Systemd')
             
-            return doc
+        Returns:
+            ScrapedDocument or None on failure
+        """
+        url = self._page_url(page_title)
+        
+        html = await self.fetch_url_async(session, url)
+        if not html:
+            return None
+        
+        return self.parse_page(page_title, url, html)
+    
+    def parse_page(self, page_title: str, url: str, html: bytes) -> Optional[ScrapedDocument]:
+        """
+        Build a document from a fetched Arch Wiki page.
+        
+        Args:
+            page_title: Page title (e.g., 'Systemd')
+            url: Page URL
+            html: Raw page HTML bytes
             
-        except ImportError:
-            logger.error("beautifulsoup4 not installed. Run: pip install beautifulsoup4")
+        Returns:
+            ScrapedDocument or None on failure
+        """
+        if not _has_html_parser():
             return None
+        
+        try:
+            parsed = parse_html(html)
         except Exception as e:
             logger.error(f"Failed to parse {page_title}: {e}")
             return None
+        
+        return self._parsed_document(page_title, url, parsed)
     
-    def _extract_tags(self, soup) -> List[str]:
-        """Extract tags/categories from page."""
-        tags = []
+    def parse_pages(self, fetched: List[Tuple[str, str, bytes]]) -> Dict[str, Optional[ScrapedDocument]]:
+        """
+        Build documents from several fetched pages.
+        
+        HTML parsing is CPU-bound, so with more than one page it is spread
+        over a process pool (ScraperConfig.parse_workers). Documents are
+        assembled, and later written, in this process only.
+        
+        Args:
+            fetched: (page_title, url, html) tuples
+            
+        Returns:
+            Documents (or None on failure) keyed by page title
+        """
+        workers = min(self.config.parse_workers or os.cpu_count() or 1, len(fetched))
+        if workers <= 1 or not _has_html_parser():
+            return {title: self.parse_page(title, url, html) for title, url, html in fetched}
         
-        # Look for category links
-        cat_box = soup.find('div', {'id': 'catlinks'})
-        if cat_box:
-            for link in cat_box.find_all('a'):
-                text = link.text.strip()
-                if text and text not in ['Categories', 'Category']:
-                    tags.append(text.lower().replace(' ', '_'))
+        documents = {}
         
-        return tags[:10]  # Limit to 10 tags
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                (title, url, executor.submit(parse_html, html))
+                for title, url, html in fetched
+            ]
+            for title, url, future in futures:
+                try:
+                    parsed = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to parse {title}: {e}")
+                    documents[title] = None
+                    continue
+                documents[title] = self._parsed_document(title, url, parsed)
+        
+        return documents
     
-    def _determine_category(self, title: str, content: str, tags: List[str]) -> str:
-        """Determine document category based on content."""
-        title_lower = title.lower()
-        content_lower = content.lower()
-        
-        # Category keywords
-        categories = {
-            'system_admin': ['systemd', 'service', 'daemon', 'init', 'boot'],
-            'networking': ['network', 'interface', 'ip', 'firewall', 'ssh', 'vpn'],
-            'file_system': ['file system', 'mount', 'disk', 'partition', 'lvm', 'raid'],
-            'security': ['security', 'encryption', 'sudo', 'permission', 'firewall'],
-            'package_mgmt': ['pacman', 'package', 'makepkg', 'repository'],
-            'kernel': ['kernel', 'module', 'driver'],
-            'hardware': ['hardware', 'device', 'driver', 'usb', 'pci'],
-            'shell': ['bash', 'shell', 'script', 'command line'],
-        }
+    def _parsed_document(
+        self,
+        page_title: str,
+        url: str,
+        parsed: Optional[Tuple[str, str, List[str]]]
+    ) -> Optional[ScrapedDocument]:
+        """Wrap parse_html output in a document."""
+        if parsed is None:
+            logger.warning(f"No content found for {page_title}")
+            return None
         
-        # Check title and tags first (more reliable)
-        for category, keywords in categories.items():
-            for keyword in keywords:
-                if keyword in title_lower or any(keyword in tag for tag in tags):
-                    return category
+        title, content, tags = parsed
+        return self._build_document(page_title, url, title, content, tags)
+    
+    def _build_document(
+        self,
+        page_title: str,
+        url: str,
+        title: str,
+        content: str,
+        tags: List[str]
+    ) -> ScrapedDocument:
+        """Clean, categorize and wrap extracted page text."""
+        title = title or page_title
+        content = self.clean_text(content)
         
-        # Check content (less reliable, more broad)
-        for category, keywords in categories.items():
-            for keyword in keywords:
-                if keyword in content_lower[:1000]:  # Check first 1000 chars
-                    return category
+        # Determine category
+        category = self._determine_category(title, content, tags)
         
-        return 'general'
+        # Create document
+        return ScrapedDocument(
+            id=self.generate_doc_id(url),
+            url=url,
+            title=title,
+            content=content,
+            source='arch_wiki',
+            category=category,
+            tags=tags,
+            scraped_at=self.scraped_at(),
+            metadata={
+                'page_title': page_title,
+                'language': 'en'
+            }
+        )
+    
+    def _determine_category(self, title: str, content: str, tags: List[str]) -> str:
+        """Determine document category based on content."""
+        return categorize(title, content, tags)
     
     def get_category_pages(self, category: str) -> List[str]:
         """
@@ -252,6 +656,11 @@ def scrape_arch_wiki_cli():
         default=1.0,
         help='Seconds between requests'
     )
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help='Reuse responses cached by an earlier run (within the cache TTL)'
+    )
     
     args = parser.parse_args()
     
@@ -264,13 +673,15 @@ def scrape_arch_wiki_cli():
     # Create scraper
     config = ScraperConfig(
         output_dir=args.output_dir,
-        rate_limit_delay=args.rate_limit
+        rate_limit_delay=args.rate_limit,
+        use_cache=args.cache
     )
     
     scraper = ArchWikiScraper(config)
     
     # Scrape
     documents = scraper.scrape(max_pages=args.max_pages)
+    scraper.close()
     
     logger.info(f"Scraped {len(documents)} documents")
     logger.info(f"Output: {args.output_dir / 'arch_wiki.jsonl'}")
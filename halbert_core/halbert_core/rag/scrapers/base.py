@@ -2,17 +2,87 @@
 Base scraper with rate limiting and error handling.
 """
 
+import asyncio
 import logging
+import os
+import tempfile
 import time
 from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from datetime import datetime
 from pathlib import Path
+from urllib.parse import urlencode, urlsplit
 import json
 from abc import ABC, abstractmethod
 import hashlib
+import re
+import sys
+
+from .minhash import find_near_duplicates
 
 logger = logging.getLogger('halbert')
 
+# BeautifulSoup tree builder: C-backed lxml when installed, else stdlib parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Whitespace run containing at least one newline (covers trailing/leading
+# spaces on each line and blank lines in between)
+_LINE_BREAK_RUN = re.compile(r'\s*\n\s*')
+
+# Optional: C-accelerated JSON for bulk JSONL write/load
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: overlapped async fetching (falls back to sequential requests)
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
+
+
+def _dumps_line(obj: Any) -> bytes:
+    """Encode obj as one UTF-8 JSON line."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(obj).encode('utf-8') + b'\n'
+
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Keys marking an API error or throttling payload (MediaWiki, Stack Exchange)
+_API_ERROR_KEYS = ('error', 'error_id', 'backoff')
+
+
+def _decode(url: str, body: bytes, as_json: bool) -> Optional[Any]:
+    """Decode a response body; None (logged) when JSON was expected but not sent."""
+    if not as_json:
+        return body
+    try:
+        return _loads(body)
+    except ValueError as e:
+        # e.g. a bot-challenge or maintenance HTML page served with 200
+        logger.warning(f"Non-JSON response from {url}: {e}")
+        return None
+
+
+def _cacheable(result: Any) -> bool:
+    """Whether a fetched (decoded) response may be cached and replayed."""
+    if isinstance(result, dict):
+        return not any(key in result for key in _API_ERROR_KEYS)
+    return True
+
 
 @dataclass
 class ScraperConfig:
@@ -23,6 +93,11 @@ class ScraperConfig:
     timeout: int = 30
     user_agent: str = "Halbert/1.0 (Educational Purpose)"
     respect_robots_txt: bool = True
+    max_concurrency: int = 8  # In-flight requests when scraping async
+    use_cache: bool = False  # Reuse fetched responses from output_dir/.http_cache
+    cache_ttl: float = 7 * 86400  # Seconds before a cached response is refetched
+    near_dup_threshold: Optional[float] = 0.85  # MinHash Jaccard cutoff (None disables)
+    parse_workers: Optional[int] = None  # Processes for HTML parsing (None = CPU count)
 
 
 @dataclass
@@ -54,16 +129,21 @@ class ScrapedDocument:
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ScrapedDocument':
-        """Create from dictionary."""
+        """
+        Create from dictionary.
+        
+        Low-cardinality fields (source, category, tags, run timestamp) are
+        interned so a loaded corpus holds one copy of each value.
+        """
         return cls(
             id=data['id'],
             url=data['url'],
             title=data['title'],
             content=data['content'],
-            source=data['source'],
-            category=data.get('category', 'general'),
-            tags=data.get('tags', []),
-            scraped_at=data.get('scraped_at', ''),
+            source=sys.intern(data['source']),
+            category=sys.intern(data.get('category', 'general')),
+            tags=[sys.intern(tag) for tag in data.get('tags', [])],
+            scraped_at=sys.intern(data.get('scraped_at', '')),
             metadata=data.get('metadata', {})
         )
 
@@ -87,6 +167,18 @@ class BaseScraper(ABC):
         self._last_request_time = 0
         self._documents: List[ScrapedDocument] = []
         
+        # One "scraped at" stamp shared by every document of a scrape run
+        self._run_timestamp: Optional[str] = None
+        
+        # Async rate limiting: next free request slot per host (loop time)
+        self._host_slots: Dict[str, float] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        
+        self._cache_dir = config.output_dir / '.http_cache'
+        
+        # Keep-alive connection pool for sync fetches (one TLS handshake per host)
+        self._session = self._new_http_session() if requests is not None else None
+        
         logger.info(f"Initialized {self.__class__.__name__} with output_dir={config.output_dir}")
     
     @abstractmethod
@@ -104,6 +196,38 @@ class BaseScraper(ABC):
         """Get source name (e.g., 'arch_wiki')."""
         pass
     
+    def _start_run(self):
+        """Stamp the start of a scrape run."""
+        self._run_timestamp = datetime.now().isoformat()
+    
+    def _end_run(self):
+        """Clear the run stamp so one-off scrapes get their own time."""
+        self._run_timestamp = None
+    
+    def scraped_at(self) -> str:
+        """Timestamp for a new document: the run stamp, or now outside a run."""
+        return self._run_timestamp or datetime.now().isoformat()
+    
+    def _new_http_session(self) -> 'requests.Session':
+        """Create a pooled requests session (retries are handled by fetch_url)."""
+        session = requests.Session()
+        session.headers.update({'User-Agent': self.config.user_agent})
+        
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=self.config.max_concurrency,
+            max_retries=0
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        
+        return session
+    
+    def close(self):
+        """Close pooled HTTP connections."""
+        if self._session is not None:
+            self._session.close()
+    
     def rate_limit(self):
         """Enforce rate limiting between requests."""
         elapsed = time.time() - self._last_request_time
@@ -113,32 +237,101 @@ class BaseScraper(ABC):
             time.sleep(sleep_time)
         self._last_request_time = time.time()
     
-    def fetch_url(self, url: str, retries: int = 0) -> Optional[str]:
+    def _cache_path(self, url: str, params: Optional[Dict[str, Any]]) -> Optional[Path]:
+        """Disk cache location for a request, or None when caching is off."""
+        if not self.config.use_cache:
+            return None
+        
+        # API keys don't change the response, so leave them out of the key
+        key = url
+        if params:
+            key += '?' + urlencode(sorted((k, v) for k, v in params.items() if k != 'key'))
+        
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return self._cache_dir / digest[:2] / digest
+    
+    def _cache_get(self, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[bytes]:
+        """Return a fresh cached response body, if any."""
+        path = self._cache_path(url, params)
+        if path is None:
+            return None
+        
+        try:
+            if time.time() - path.stat().st_mtime > self.config.cache_ttl:
+                return None
+            body = path.read_bytes()
+        except OSError:
+            return None
+        
+        logger.debug(f"Cache hit: {url}")
+        return body
+    
+    def _cache_put(self, url: str, params: Optional[Dict[str, Any]], body: bytes):
+        """Store a response body (atomic rename, failures are non-fatal)."""
+        path = self._cache_path(url, params)
+        if path is None:
+            return
+        
+        tmp_name = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as tmp:
+                tmp_name = tmp.name
+                tmp.write(body)
+            os.replace(tmp_name, path)
+        except OSError as e:
+            logger.debug(f"Failed to cache {url}: {e}")
+            if tmp_name is not None:
+                try:
+                    os.remove(tmp_name)
+                except OSError:
+                    pass
+    
+    def fetch_url(
+        self,
+        url: str,
+        retries: int = 0,
+        params: Optional[Dict[str, Any]] = None,
+        as_json: bool = False
+    ) -> Optional[Any]:
         """
         Fetch URL with retries and error handling.
         
+        Responses are served from the disk cache when fresh; cache hits
+        skip rate limiting entirely.
+        
         Args:
             url: URL to fetch
             retries: Current retry count
+            params: Optional query parameters
+            as_json: Decode the response body as JSON
             
         Returns:
-            HTML content or None on failure
+            Raw (undecoded) HTML bytes, or decoded JSON, or None on failure.
+            HTML parsers accept bytes and detect the encoding themselves,
+            which avoids holding both a decoded str and the bytes for large
+            pages.
         """
+        body = self._cache_get(url, params)
+        if body is not None:
+            return _decode(url, body, as_json)
+        
+        if requests is None:
+            logger.error("requests not installed. Run: pip install requests")
+            return None
+        
         try:
-            import requests
-            
             self.rate_limit()
             
-            headers = {'User-Agent': self.config.user_agent}
-            response = requests.get(
+            response = self._session.get(
                 url,
-                headers=headers,
+                params=params,
                 timeout=self.config.timeout
             )
             response.raise_for_status()
+            body = response.content
             
-            logger.debug(f"Fetched {url} ({len(response.text)} bytes)")
-            return response.text
+            logger.debug(f"Fetched {url} ({len(body)} bytes)")
             
         except requests.RequestException as e:
             logger.warning(f"Failed to fetch {url}: {e}")
@@ -147,10 +340,130 @@ class BaseScraper(ABC):
                 wait_time = 2 ** retries  # Exponential backoff
                 logger.info(f"Retrying in {wait_time}s (attempt {retries + 1}/{self.config.max_retries})")
                 time.sleep(wait_time)
-                return self.fetch_url(url, retries + 1)
+                return self.fetch_url(url, retries + 1, params=params, as_json=as_json)
             
             logger.error(f"Failed to fetch {url} after {self.config.max_retries} retries")
             return None
+        
+        # Decode before caching so malformed JSON and API error/backoff
+        # payloads are never cached
+        result = _decode(url, body, as_json)
+        if result is not None and _cacheable(result):
+            self._cache_put(url, params, body)
+        return result
+    
+    def can_scrape_async(self) -> bool:
+        """
+        Check whether the async scrape path can be used.
+        
+        Requires aiohttp and no event loop already running in this thread
+        (asyncio.run cannot nest).
+        """
+        if aiohttp is None:
+            return False
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return True
+        return False
+    
+    def open_session(self) -> 'aiohttp.ClientSession':
+        """
+        Create an aiohttp session and reset per-run async state.
+        
+        Must be called from inside the event loop that will use it.
+        """
+        self._semaphore = asyncio.Semaphore(self.config.max_concurrency)
+        self._host_slots = {}
+        return aiohttp.ClientSession(
+            headers={'User-Agent': self.config.user_agent},
+            timeout=aiohttp.ClientTimeout(total=self.config.timeout)
+        )
+    
+    async def rate_limit_async(self, url: str):
+        """
+        Enforce rate_limit_delay between request starts to the same host.
+        
+        Each caller reserves the next free slot for its host and sleeps until
+        it; requests to different hosts and in-flight responses overlap.
+        The reservation has no await in it, so it is atomic on the loop.
+        """
+        host = urlsplit(url).netloc
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._host_slots.get(host, now))
+        self._host_slots[host] = slot + self.config.rate_limit_delay
+        
+        if slot > now:
+            logger.debug(f"Rate limiting {host}: sleeping {slot - now:.2f}s")
+            await asyncio.sleep(slot - now)
+    
+    def defer_requests(self, url: str, seconds: float):
+        """
+        Hold off further requests to url's host (e.g. an API backoff).
+        
+        Inside an event loop this pushes the host's next async slot;
+        otherwise it delays the sync rate limiter.
+        """
+        try:
+            now = asyncio.get_running_loop().time()
+        except RuntimeError:
+            resume_at = time.time() + seconds - self.config.rate_limit_delay
+            self._last_request_time = max(self._last_request_time, resume_at)
+            return
+        
+        host = urlsplit(url).netloc
+        self._host_slots[host] = max(self._host_slots.get(host, now), now + seconds)
+    
+    async def fetch_url_async(
+        self,
+        session: 'aiohttp.ClientSession',
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        as_json: bool = False
+    ) -> Optional[Any]:
+        """
+        Fetch URL asynchronously with rate limiting and retries.
+        
+        Args:
+            session: Session from open_session()
+            url: URL to fetch
+            params: Optional query parameters
+            as_json: Decode the response body as JSON
+            
+        Returns:
+            Raw HTML bytes (or decoded JSON) or None on failure
+        """
+        body = self._cache_get(url, params)
+        if body is not None:
+            return _decode(url, body, as_json)
+        
+        for attempt in range(self.config.max_retries + 1):
+            if attempt:
+                wait_time = 2 ** (attempt - 1)  # Exponential backoff
+                logger.info(f"Retrying in {wait_time}s (attempt {attempt}/{self.config.max_retries})")
+                await asyncio.sleep(wait_time)
+            
+            await self.rate_limit_async(url)
+            
+            try:
+                async with self._semaphore:
+                    async with session.get(url, params=params) as response:
+                        response.raise_for_status()
+                        body = await response.read()
+                
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning(f"Failed to fetch {url}: {e}")
+                continue
+            
+            logger.debug(f"Fetched {url} ({len(body)} bytes)")
+            
+            result = _decode(url, body, as_json)
+            if result is not None and _cacheable(result):
+                self._cache_put(url, params, body)
+            return result
+        
+        logger.error(f"Failed to fetch {url} after {self.config.max_retries} retries")
+        return None
     
     def generate_doc_id(self, url: str) -> str:
         """
@@ -162,7 +475,10 @@ class BaseScraper(ABC):
         Returns:
             MD5 hash of URL
         """
-        return hashlib.md5(url.encode()).hexdigest()
+        # Non-cryptographic use; the MD5 hex format is kept so IDs stay
+        # comparable with previously scraped corpora (DataPipeline can
+        # deduplicate by ID across sources)
+        return hashlib.md5(url.encode(), usedforsecurity=False).hexdigest()
     
     def save_documents(self, documents: List[ScrapedDocument], filename: str = None):
         """
@@ -183,12 +499,41 @@ class BaseScraper(ABC):
         
         logger.info(f"Saving {len(documents)} documents to {output_path}")
         
-        with open(output_path, 'w') as f:
-            for doc in documents:
-                f.write(json.dumps(doc.to_dict()) + '\n')
+        # Stream encoded lines straight to the file (bytes, no str round-trip)
+        with open(output_path, 'wb') as f:
+            f.writelines(_dumps_line(doc.to_dict()) for doc in documents)
         
         logger.info(f"Saved {len(documents)} documents to {output_path}")
     
+    def store_as_columns(self, documents: List[ScrapedDocument], filename: str = None) -> Path:
+        """
+        Save documents column-wise as a single JSON object for analytics.
+        
+        Layout is ``{field: [value_per_document, ...], ...}``.
+        
+        Args:
+            documents: List of documents to save
+            filename: Output filename (default: source_name.columns.json)
+            
+        Returns:
+            Path of the written file
+        """
+        if filename is None:
+            filename = f"{self.get_source_name()}.columns.json"
+        
+        output_path = self.config.output_dir / filename
+        
+        columns = {
+            f.name: [getattr(doc, f.name) for doc in documents]
+            for f in fields(ScrapedDocument)
+        }
+        
+        with open(output_path, 'wb') as f:
+            f.write(_dumps_line(columns))
+        
+        logger.info(f"Saved {len(documents)} documents column-wise to {output_path}")
+        return output_path
+    
     def load_documents(self, filename: str = None) -> List[ScrapedDocument]:
         """
         Load documents from JSONL file.
@@ -209,12 +554,13 @@ class BaseScraper(ABC):
             return []
         
         documents = []
-        with open(input_path, 'r') as f:
+        with open(input_path, 'rb') as f:
             for line in f:
                 try:
-                    data = json.loads(line.strip())
+                    data = _loads(line)
                     documents.append(ScrapedDocument.from_dict(data))
                 except json.JSONDecodeError as e:
+                    # orjson.JSONDecodeError subclasses json.JSONDecodeError
                     logger.warning(f"Failed to parse line: {e}")
         
         logger.info(f"Loaded {len(documents)} documents from {input_path}")
@@ -230,16 +576,8 @@ class BaseScraper(ABC):
         Returns:
             Cleaned text
         """
-        # Remove excessive whitespace
-        lines = [line.strip() for line in text.split('\n')]
-        lines = [line for line in lines if line]
-        text = '\n'.join(lines)
-        
-        # Remove multiple blank lines
-        while '\n\n\n' in text:
-            text = text.replace('\n\n\n', '\n\n')
-        
-        return text.strip()
+        # Strip every line and drop blank lines in one linear pass
+        return _LINE_BREAK_RUN.sub('\n', text).strip()
     
     def validate_document(self, doc: ScrapedDocument) -> bool:
         """
@@ -292,4 +630,36 @@ class BaseScraper(ABC):
         if len(unique_docs) < len(documents):
             logger.info(f"Removed {len(documents) - len(unique_docs)} duplicates")
         
+        if self.config.near_dup_threshold is not None:
+            unique_docs = self.deduplicate_near(unique_docs, self.config.near_dup_threshold)
+        
+        return unique_docs
+    
+    def deduplicate_near(
+        self,
+        documents: List[ScrapedDocument],
+        threshold: float = 0.85
+    ) -> List[ScrapedDocument]:
+        """
+        Remove near-duplicate documents (mirrors, re-asked questions).
+        
+        Uses MinHash-LSH over word 5-grams of the content; of each group of
+        near-duplicates the longest document is kept.
+        
+        Args:
+            documents: List of documents
+            threshold: Estimated Jaccard similarity cutoff
+            
+        Returns:
+            Deduplicated list, in original order
+        """
+        if len(documents) < 2:
+            return documents
+        
+        keep = find_near_duplicates([doc.content for doc in documents], threshold=threshold)
+        unique_docs = [doc for doc, kept in zip(documents, keep) if kept]
+        
+        if len(unique_docs) < len(documents):
+            logger.info(f"Removed {len(documents) - len(unique_docs)} near-duplicates")
+        
         return unique_docs
@@ -0,0 +1,151 @@
+"""
+MinHash-LSH near-duplicate detection for scraped documents.
+
+Each document is reduced to a fixed-size MinHash signature over its word
+shingles. Signatures are split into bands and hashed into buckets, so only
+documents sharing at least one band are ever compared (expected O(n)
+instead of all pairs). Candidates are then confirmed by their estimated
+Jaccard similarity, which removes most LSH false positives.
+"""
+
+import logging
+import zlib
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger('halbert')
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+# Shingles hashed against all permutations at once, per block
+_BLOCK_SIZE = 4096
+
+
+def _shingle_hashes(text: str, ngram: int) -> np.ndarray:
+    """Hash the distinct lowercased word n-grams of text to uint32."""
+    words = text.lower().split()
+    if len(words) <= ngram:
+        shingles = {' '.join(words)}
+    else:
+        shingles = {' '.join(words[i:i + ngram]) for i in range(len(words) - ngram + 1)}
+
+    return np.fromiter(
+        (zlib.crc32(s.encode('utf-8')) for s in shingles),
+        dtype=np.uint64,
+        count=len(shingles)
+    )
+
+
+def _optimal_bands(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """
+    Pick (bands, rows) so the LSH S-curve crosses threshold.
+
+    A pair with Jaccard s becomes a candidate with probability
+    1 - (1 - s**rows)**bands, whose steepest point sits near
+    (1 / bands) ** (1 / rows).
+    """
+    best = (1, num_perm)
+    best_err = float('inf')
+
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        err = abs((1.0 / bands) ** (1.0 / rows) - threshold)
+        if err < best_err:
+            best, best_err = (bands, rows), err
+
+    return best
+
+
+class MinHasher:
+    """
+    Fixed-seed MinHash signature generator.
+
+    Uses universal hashing ``(a * x + b) mod p`` with one (a, b) pair per
+    permutation, like datasketch, so signatures are reproducible across runs.
+    """
+
+    def __init__(self, num_perm: int = 128, ngram: int = 5, seed: int = 1):
+        """
+        Initialize hasher.
+
+        Args:
+            num_perm: Signature length
+            ngram: Words per shingle
+            seed: Seed for the permutation parameters
+        """
+        self.num_perm = num_perm
+        self.ngram = ngram
+
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+
+    def signature(self, text: str) -> np.ndarray:
+        """
+        Compute the MinHash signature of a text.
+
+        Args:
+            text: Document text
+
+        Returns:
+            uint32 array of length num_perm
+        """
+        hashes = _shingle_hashes(text, self.ngram)
+        sig = np.full(self.num_perm, _MAX_HASH, dtype=np.uint64)
+
+        for start in range(0, len(hashes), _BLOCK_SIZE):
+            block = hashes[start:start + _BLOCK_SIZE, None]
+            # uint64 wraparound on a * x is intended (same as datasketch)
+            permuted = ((block * self._a + self._b) % _MERSENNE_PRIME) & _MAX_HASH
+            np.minimum(sig, permuted.min(axis=0), out=sig)
+
+        return sig.astype(np.uint32)
+
+
+def find_near_duplicates(
+    texts: Sequence[str],
+    threshold: float = 0.85,
+    num_perm: int = 128,
+    ngram: int = 5
+) -> List[bool]:
+    """
+    Flag texts that are near-duplicates of another text.
+
+    Longer texts are considered first, so of each near-duplicate group the
+    longest one is kept.
+
+    Args:
+        texts: Document texts
+        threshold: Estimated Jaccard similarity at or above which two texts
+            count as duplicates
+        num_perm: MinHash signature length
+        ngram: Words per shingle
+
+    Returns:
+        Keep mask aligned with texts (False for near-duplicates)
+    """
+    hasher = MinHasher(num_perm=num_perm, ngram=ngram)
+    bands, rows = _optimal_bands(threshold, num_perm)
+
+    signatures = [hasher.signature(text) for text in texts]
+    buckets: List[Dict[bytes, List[int]]] = [{} for _ in range(bands)]
+    keep = [False] * len(texts)
+
+    for idx in sorted(range(len(texts)), key=lambda i: -len(texts[i])):
+        sig = signatures[idx]
+        keys = [sig[band * rows:(band + 1) * rows].tobytes() for band in range(bands)]
+
+        candidates = set()
+        for band, key in enumerate(keys):
+            candidates.update(buckets[band].get(key, ()))
+
+        if any(np.mean(signatures[other] == sig) >= threshold for other in candidates):
+            continue
+
+        keep[idx] = True
+        for band, key in enumerate(keys):
+            buckets[band].setdefault(key, []).append(idx)
+
+    return keep
@@ -4,15 +4,27 @@ Stack Overflow scraper using the Stack Exchange API.
 Scrapes Q&A content related to Linux system administration.
 """
 
+import asyncio
 import logging
 from typing import List, Optional, Dict, Any
-from datetime import datetime
-import time
+import re
+import sys
 
-from .base import BaseScraper, ScrapedDocument, ScraperConfig
+from ._categorization import categorize_tags
+from .base import BaseScraper, ScrapedDocument, ScraperConfig, HTML_PARSER
 
 logger = logging.getLogger('halbert')
 
+try:
+    from bs4 import BeautifulSoup
+    _HAS_BS4 = True
+except ImportError:
+    BeautifulSoup = None
+    _HAS_BS4 = False
+
+# Fallback tag stripper when BeautifulSoup is unavailable
+_HTML_TAG = re.compile('<[^<]+?>')
+
 
 class StackOverflowScraper(BaseScraper):
     """
@@ -23,6 +35,9 @@ class StackOverflowScraper(BaseScraper):
     
     API_BASE = 'https://api.stackexchange.com/2.3'
     
+    # API maximum for pagesize and for semicolon-joined IDs per request
+    MAX_PAGE_SIZE = 100
+    
     # Tags of interest for system administration
     TARGET_TAGS = [
         'linux',
@@ -67,6 +82,9 @@ class StackOverflowScraper(BaseScraper):
         """
         Scrape Stack Overflow questions.
         
+        Fetches tags concurrently when aiohttp is available, sequentially
+        otherwise.
+        
         Args:
             max_questions: Maximum questions to scrape
             min_score: Minimum question score (upvotes)
@@ -74,39 +92,132 @@ class StackOverflowScraper(BaseScraper):
         Returns:
             List of scraped documents
         """
+        if self.can_scrape_async():
+            return asyncio.run(self.scrape_async(max_questions, min_score))
+        
         logger.info(
             f"Starting Stack Overflow scrape "
             f"(max_questions={max_questions}, min_score={min_score})"
         )
+        self._start_run()
         
-        documents = []
+        per_tag = []
         
         for tag in self.TARGET_TAGS:
             logger.info(f"Scraping tag: {tag}")
             
-            questions = self.fetch_questions_by_tag(
+            # Spacing comes from rate_limit() plus any API-requested backoff
+            per_tag.append(self.fetch_questions_by_tag(
                 tag=tag,
                 max_results=max_questions // len(self.TARGET_TAGS),
                 min_score=min_score
-            )
+            ))
+        
+        return self._finish_scrape(per_tag)
+    
+    async def scrape_async(
+        self,
+        max_questions: int = 100,
+        min_score: int = 5
+    ) -> List[ScrapedDocument]:
+        """
+        Scrape Stack Overflow questions with overlapped async API calls.
+        
+        Request starts are still spaced by rate_limit_delay (per host).
+        
+        Args:
+            max_questions: Maximum questions to scrape
+            min_score: Minimum question score (upvotes)
             
+        Returns:
+            List of scraped documents
+        """
+        logger.info(
+            f"Starting async Stack Overflow scrape "
+            f"(max_questions={max_questions}, min_score={min_score})"
+        )
+        self._start_run()
+        
+        async with self.open_session() as session:
+            per_tag = await asyncio.gather(*(
+                self.fetch_questions_by_tag_async(
+                    session,
+                    tag=tag,
+                    max_results=max_questions // len(self.TARGET_TAGS),
+                    min_score=min_score
+                )
+                for tag in self.TARGET_TAGS
+            ))
+        
+        return self._finish_scrape(per_tag)
+    
+    def _finish_scrape(self, per_tag: List[List[Dict[str, Any]]]) -> List[ScrapedDocument]:
+        """Convert, validate, deduplicate and save fetched questions."""
+        documents = []
+        
+        for questions in per_tag:
             for question in questions:
                 doc = self.convert_question_to_document(question)
                 if doc and self.validate_document(doc):
                     documents.append(doc)
                     logger.info(f"Scraped Q: {doc.title[:60]}...")
-            
-            # API rate limiting is critical
-            time.sleep(2)  # Be extra conservative
         
         logger.info(f"Scraped {len(documents)} questions from Stack Overflow")
         
         # Deduplicate and save
         documents = self.deduplicate_documents(documents)
         self.save_documents(documents)
+        self._end_run()
         
         return documents
     
+    def _question_params(
+        self,
+        tag: str,
+        max_results: int,
+        min_score: int,
+        page: int = 1
+    ) -> Dict[str, Any]:
+        """
+        Build /questions query parameters for a tag.
+        
+        Tags are queried one at a time: the API treats ``tagged=a;b`` as
+        "tagged with all of a and b", not any of them.
+        """
+        params = {
+            'site': 'stackoverflow',
+            'tagged': tag,
+            'sort': 'votes',
+            'order': 'desc',
+            'page': page,
+            'pagesize': min(max_results, self.MAX_PAGE_SIZE),
+            'min': min_score,
+            'filter': 'withbody',  # Include question body
+        }
+        
+        if self.api_key:
+            params['key'] = self.api_key
+        
+        return params
+    
+    def _parse_api_response(self, url: str, data: Dict[str, Any], what: str) -> List[Dict[str, Any]]:
+        """Extract items from an API response and honor its backoff field."""
+        # The API asks clients to wait `backoff` seconds before hitting
+        # the same method again
+        if data.get('backoff'):
+            logger.info(f"API requested backoff of {data['backoff']}s")
+            self.defer_requests(url, data['backoff'])
+        
+        if 'items' not in data:
+            logger.warning(f"No items in API response for {what}")
+            return []
+        
+        # Check rate limit
+        if 'quota_remaining' in data:
+            logger.debug(f"API quota remaining: {data['quota_remaining']}")
+        
+        return data['items']
+    
     def fetch_questions_by_tag(
         self,
         tag: str,
@@ -124,50 +235,122 @@ class StackOverflowScraper(BaseScraper):
         Returns:
             List of question objects from API
         """
-        import requests
+        url = f"{self.API_BASE}/questions"
+        questions = []
+        page = 1
         
-        params = {
-            'site': 'stackoverflow',
-            'tagged': tag,
-            'sort': 'votes',
-            'order': 'desc',
-            'pagesize': min(max_results, 100),  # API max is 100
-            'min': min_score,
-            'filter': 'withbody',  # Include question body
-        }
+        try:
+            while True:
+                data = self.fetch_url(
+                    url,
+                    params=self._question_params(tag, max_results, min_score, page),
+                    as_json=True
+                )
+                if data is None:
+                    logger.error(f"Failed to fetch questions for tag '{tag}'")
+                    break
+                
+                questions.extend(self._parse_api_response(url, data, f"tag: {tag}"))
+                
+                if not data.get('has_more') or len(questions) >= max_results:
+                    break
+                page += 1
+            
+        except Exception as e:
+            logger.error(f"Error processing API response: {e}")
         
-        if self.api_key:
-            params['key'] = self.api_key
+        logger.info(f"Fetched {len(questions)} questions for tag: {tag}")
+        return questions[:max_results]
+    
+    async def fetch_questions_by_tag_async(
+        self,
+        session,
+        tag: str,
+        max_results: int = 10,
+        min_score: int = 5
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch questions with specific tag asynchronously.
         
+        Args:
+            session: Session from open_session()
+            tag: Tag to search for
+            max_results: Maximum number of results
+            min_score: Minimum question score
+            
+        Returns:
+            List of question objects from API
+        """
         url = f"{self.API_BASE}/questions"
+        questions = []
+        page = 1
         
         try:
-            self.rate_limit()
-            
-            response = requests.get(url, params=params, timeout=self.config.timeout)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            if 'items' not in data:
-                logger.warning(f"No items in API response for tag: {tag}")
-                return []
+            while True:
+                data = await self.fetch_url_async(
+                    session,
+                    url,
+                    params=self._question_params(tag, max_results, min_score, page),
+                    as_json=True
+                )
+                if data is None:
+                    logger.error(f"Failed to fetch questions for tag '{tag}'")
+                    break
+                
+                questions.extend(self._parse_api_response(url, data, f"tag: {tag}"))
+                
+                if not data.get('has_more') or len(questions) >= max_results:
+                    break
+                page += 1
             
-            questions = data['items']
+        except Exception as e:
+            logger.error(f"Error processing API response: {e}")
+        
+        logger.info(f"Fetched {len(questions)} questions for tag: {tag}")
+        return questions[:max_results]
+    
+    def fetch_questions_by_ids(self, question_ids: List[int]) -> List[Dict[str, Any]]:
+        """
+        Fetch questions (with bodies) by ID in batches.
+        
+        Uses the vectorized /questions/{ids} endpoint, which accepts up to
+        100 semicolon-joined IDs per request.
+        
+        Args:
+            question_ids: Question IDs to fetch
             
-            # Check rate limit
-            if 'quota_remaining' in data:
-                logger.debug(f"API quota remaining: {data['quota_remaining']}")
+        Returns:
+            List of question objects from API
+        """
+        questions = []
+        
+        for start in range(0, len(question_ids), self.MAX_PAGE_SIZE):
+            batch = question_ids[start:start + self.MAX_PAGE_SIZE]
+            url = f"{self.API_BASE}/questions/{';'.join(str(i) for i in batch)}"
             
-            logger.info(f"Fetched {len(questions)} questions for tag: {tag}")
-            return questions
+            params = {
+                'site': 'stackoverflow',
+                'pagesize': self.MAX_PAGE_SIZE,
+                'filter': 'withbody',
+            }
+            if self.api_key:
+                params['key'] = self.api_key
             
-        except requests.RequestException as e:
-            logger.error(f"Failed to fetch questions for tag '{tag}': {e}")
-            return []
-        except Exception as e:
-            logger.error(f"Error processing API response: {e}")
-            return []
+            try:
+                data = self.fetch_url(url, params=params, as_json=True)
+                if data is None:
+                    logger.error(f"Failed to fetch {len(batch)} questions by ID")
+                    continue
+                
+                questions.extend(
+                    self._parse_api_response(url, data, f"{len(batch)} question IDs")
+                )
+                
+            except Exception as e:
+                logger.error(f"Error processing API response: {e}")
+        
+        logger.info(f"Fetched {len(questions)} questions by ID")
+        return questions
     
     def convert_question_to_document(self, question: Dict[str, Any]) -> Optional[ScrapedDocument]:
         """
@@ -191,40 +374,32 @@ class StackOverflowScraper(BaseScraper):
             url = f"https://stackoverflow.com/questions/{question_id}"
             
             # Clean HTML from body
-            try:
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(body, 'html.parser')
+            if _HAS_BS4:
+                soup = BeautifulSoup(body, HTML_PARSER)
                 body_text = soup.get_text(separator='\n', strip=True)
-            except ImportError:
+            else:
                 # Fallback: basic HTML stripping
-                import re
-                body_text = re.sub('<[^<]+?>', '', body)
+                body_text = _HTML_TAG.sub('', body)
             
             # Get answer if available
             answer_count = question.get('answer_count', 0)
             is_answered = question.get('is_answered', False)
             accepted_answer_id = question.get('accepted_answer_id')
             
-            # Build content
-            content_parts = [
-                f"# {title}",
-                "",
-                "## Question",
-                body_text,
-            ]
-            
             # Note: Full answer content would require separate API call
             # For now, we just note if there's an accepted answer
             if is_answered and accepted_answer_id:
-                content_parts.append(f"\n(Accepted answer available at: {url})")
+                answer_note = f"\n\n(Accepted answer available at: {url})"
             elif answer_count > 0:
-                content_parts.append(f"\n({answer_count} answers available at: {url})")
+                answer_note = f"\n\n({answer_count} answers available at: {url})"
+            else:
+                answer_note = ''
             
-            content = '\n'.join(content_parts)
-            content = self.clean_text(content)
+            # Build content
+            content = self.clean_text(f"# {title}\n\n## Question\n{body_text}{answer_note}")
             
-            # Extract tags
-            tags = question.get('tags', [])
+            # Extract tags (interned: the same few tags repeat across questions)
+            tags = [sys.intern(tag) for tag in question.get('tags', [])]
             
             # Determine category from tags
             category = self._determine_category(tags)
@@ -238,7 +413,7 @@ class StackOverflowScraper(BaseScraper):
                 source='stackoverflow',
                 category=category,
                 tags=tags,
-                scraped_at=datetime.now().isoformat(),
+                scraped_at=self.scraped_at(),
                 metadata={
                     'question_id': question_id,
                     'score': question.get('score', 0),
@@ -258,24 +433,7 @@ class StackOverflowScraper(BaseScraper):
     
     def _determine_category(self, tags: List[str]) -> str:
         """Determine category from tags."""
-        tag_set = set(t.lower() for t in tags)
-        
-        categories = {
-            'system_admin': {'systemd', 'systemctl', 'init', 'service', 'daemon'},
-            'networking': {'networking', 'network', 'ssh', 'firewall', 'iptables'},
-            'file_system': {'filesystem', 'disk-space', 'partition', 'mount'},
-            'security': {'security', 'sudo', 'permissions', 'encryption'},
-            'shell': {'bash', 'shell', 'scripting'},
-        }
-        
-        for category, keywords in categories.items():
-            if tag_set & keywords:
-                return category
-        
-        if 'linux' in tag_set:
-            return 'linux_general'
-        
-        return 'general'
+        return categorize_tags(tags)
 
 
 def scrape_stackoverflow_cli():
@@ -309,6 +467,11 @@ def scrape_stackoverflow_cli():
         type=str,
         help='Stack Exchange API key (optional)'
     )
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help='Reuse responses cached by an earlier run (within the cache TTL)'
+    )
     
     args = parser.parse_args()
     
@@ -321,7 +484,8 @@ def scrape_stackoverflow_cli():
     # Create scraper
     config = ScraperConfig(
         output_dir=args.output_dir,
-        rate_limit_delay=2.0  # Stack Exchange rate limits are strict
+        rate_limit_delay=2.0,  # Stack Exchange rate limits are strict
+        use_cache=args.cache
     )
     
     scraper = StackOverflowScraper(config, api_key=args.api_key)
@@ -331,6 +495,7 @@ def scrape_stackoverflow_cli():
         max_questions=args.max_questions,
         min_score=args.min_score
     )
+    scraper.close()
     
     logger.info(f"Scraped {len(documents)} documents")
     logger.info(f"Output: {args.output_dir / 'stackoverflow.jsonl'}")
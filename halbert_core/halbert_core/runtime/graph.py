@@ -13,17 +13,20 @@ class Graph:
     def __init__(self) -> None:
         self.nodes: Dict[str, NodeFn] = {}
         self.start: str | None = None
+        # Resolved at add_node time so run_once skips the dict lookup
+        self._start_fn: NodeFn | None = None
 
     def add_node(self, name: str, fn: NodeFn, start: bool = False) -> None:
         self.nodes[name] = fn
         if start or self.start is None:
             self.start = name
+        if name == self.start:
+            self._start_fn = fn
 
     def run_once(self, state: HalbertState, ctx: Dict[str, Any] | None = None) -> HalbertState:
-        if not self.start:
+        if self._start_fn is None:
             return state
-        fn = self.nodes[self.start]
-        return fn(state, ctx or {})
+        return self._start_fn(state, ctx or {})
 
 # Placeholder agents
 
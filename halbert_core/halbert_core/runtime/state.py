@@ -1,17 +1,17 @@
 from __future__ import annotations
+from dataclasses import dataclass, field
 from typing import Any, Dict, List
-from pydantic import BaseModel, Field
 
 """
 Halbert Phase 1 typed shared state.
 See docs/Phase1/engineering-spec.md and docs/Phase1/architecture.md
 """
 
-class HalbertState(BaseModel):
-    conversation: List[Dict[str, Any]] = Field(default_factory=list)
-    tasks: List[Dict[str, Any]] = Field(default_factory=list)
-    metrics: Dict[str, float] = Field(default_factory=dict)
-    flags: Dict[str, Any] = Field(default_factory=dict)
-
-    class Config:
-        extra = "allow"
+@dataclass(slots=True)
+class HalbertState:
+    conversation: List[Dict[str, Any]] = field(default_factory=list)
+    tasks: List[Dict[str, Any]] = field(default_factory=list)
+    metrics: Dict[str, float] = field(default_factory=dict)
+    flags: Dict[str, Any] = field(default_factory=dict)
+    # Free-form fields (previously pydantic extra="allow")
+    extra: Dict[str, Any] = field(default_factory=dict)
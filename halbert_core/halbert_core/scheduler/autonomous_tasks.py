@@ -11,14 +11,72 @@ Example autonomous tasks:
 """
 
 from __future__ import annotations
+import functools
+import hashlib
 import logging
 import json
+import os
+import re
 import subprocess
-from typing import Dict, Any, Optional, Tuple
-from dataclasses import dataclass
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+from dataclasses import dataclass, replace
+
+from ..model.prompt_manager import PromptMode
+from ..utils.timestamps import iso_now
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
 
 logger = logging.getLogger('halbert.scheduler.autonomous_tasks')
 
+# How long core-memory retrieval results are reused per task description
+MEMORY_CACHE_TTL_S = 300
+
+# Optional: C JSON for state serialization and LLM response parsing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Optional: typed decoding of LLM responses straight into TaskDecision
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# Trailing comma before a closing bracket (invalid JSON LLMs sometimes emit)
+_TRAILING_COMMA = re.compile(r',\s*([}\]])')
+
+# End generation at the pretty-printed decision object's closing brace (a
+# brace at the start of a line) instead of decoding up to max_tokens; the
+# matched brace is not returned
+_DECISION_STOP = ["\n}"]
+
+_JSON_DECODER = json.JSONDecoder()
+
+# Identical for every decision, so it forms a cacheable prompt prefix
+_DECISION_INSTRUCTIONS = """
+Analyze the task and current state given below and recommend the next action.
+Output ONLY a JSON object matching this format (no other text):
+{
+  "step": <step number given below>,
+  "action": "<specific action to take>",
+  "confidence": <0.0-1.0>,
+  "reasoning": "<brief explanation>",
+  "requires_approval": <true|false>,
+  "approval_reason": "<reason if true, otherwise null>",
+  "risk_level": "<low|medium|high>"
+}
+"""
+
 
 @dataclass
 class TaskDecision:
@@ -36,6 +94,192 @@ class TaskDecision:
     risk_level: str = 'medium'  # low, medium, high
 
 
+@functools.lru_cache(maxsize=None)
+def _no_llm_decision(step: int) -> TaskDecision:
+    """Fallback decision template when no LLM is configured (hand out copies)."""
+    return TaskDecision(
+        step=step,
+        action="Skip (no LLM available)",
+        confidence=0.0,
+        reasoning="LLM not configured",
+        requires_approval=True,
+        approval_reason="Cannot make autonomous decisions without LLM"
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _llm_error_decision(step: int, message: str) -> TaskDecision:
+    """Fallback decision template for an LLM failure (hand out copies)."""
+    return TaskDecision(
+        step=step,
+        action="Skip (LLM error)",
+        confidence=0.0,
+        reasoning=f"LLM failed: {message}",
+        requires_approval=True,
+        approval_reason="Cannot proceed without valid LLM decision"
+    )
+
+
+def _dumps_state(state: Dict[str, Any]) -> str:
+    """Compact, key-sorted JSON for prompts and cache keys."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                state,
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+                default=str
+            ).decode('utf-8')
+        except TypeError:
+            pass
+    return json.dumps(state, sort_keys=True, separators=(',', ':'), default=str)
+
+
+def _parse_json_lenient(text: str) -> Any:
+    """Parse JSON; on failure retry once with trailing commas removed."""
+    try:
+        return _json_loads(text)
+    except ValueError:
+        return json.loads(_TRAILING_COMMA.sub(r'\1', text))
+
+
+def _extract_json_object(response: str) -> str:
+    """
+    Text of the first JSON object in an LLM response.
+    
+    Decoding from the first '{' finds the object's real end (braces inside
+    strings and nested objects included) and ignores any text after it. A
+    response cut at the closing brace by _DECISION_STOP gets it back, and
+    trailing commas are tolerated.
+    
+    Raises:
+        ValueError: If the response holds no decodable object
+    """
+    start = response.find('{')
+    if start < 0:
+        raise ValueError("No JSON found in response")
+    candidate = response[start:].rstrip()
+    
+    for text in (candidate, candidate + '\n}'):
+        for attempt in (text, _TRAILING_COMMA.sub(r'\1', text)):
+            try:
+                _, end = _JSON_DECODER.raw_decode(attempt)
+            except ValueError:
+                continue
+            return attempt[:end]
+    raise ValueError("Malformed JSON in response")
+
+
+def _decode_decision(text: str, step: int) -> TaskDecision:
+    """
+    Decode a JSON decision object.
+    
+    Well-formed, complete responses are decoded and type-checked in one pass
+    by msgspec when installed; anything else goes through the tolerant path
+    (trailing commas, missing fields, numbers as strings).
+    """
+    if msgspec is not None:
+        try:
+            return msgspec.json.decode(text, type=TaskDecision)
+        except msgspec.DecodeError:
+            pass
+    
+    decision_data = _parse_json_lenient(text)
+    return TaskDecision(
+        step=decision_data.get('step', step),
+        action=decision_data.get('action', 'Unknown'),
+        confidence=float(decision_data.get('confidence', 0.0)),
+        reasoning=decision_data.get('reasoning', 'No reasoning provided'),
+        requires_approval=decision_data.get('requires_approval', True),
+        approval_reason=decision_data.get('approval_reason'),
+        risk_level=decision_data.get('risk_level', 'medium')
+    )
+
+
+class DecisionCache:
+    """
+    Thread-safe LRU cache of LLM decisions, keyed by task + state text.
+    
+    Keys are stored as blake2b digests of the canonical key text. One cache
+    is shared by tasks running on the scheduler's worker threads, so every
+    access holds a lock.
+    """
+    
+    def __init__(self, max_size: int = 256):
+        """
+        Initialize cache.
+        
+        Args:
+            max_size: Maximum cached decisions (least recently used evicted)
+        """
+        self.max_size = max_size
+        self._entries: OrderedDict[bytes, TaskDecision] = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _digest(key_text: str) -> bytes:
+        return hashlib.blake2b(key_text.encode('utf-8'), digest_size=16).digest()
+    
+    def get(self, key_text: str) -> Optional[TaskDecision]:
+        """
+        Look up a cached decision.
+        
+        Args:
+            key_text: Canonical task + state text
+        
+        Returns:
+            Copy of the cached decision, or None on miss
+        """
+        digest = self._digest(key_text)
+        with self._lock:
+            decision = self._entries.get(digest)
+            if decision is None:
+                return None
+            self._entries.move_to_end(digest)
+        return replace(decision)
+    
+    def put(self, key_text: str, decision: TaskDecision) -> None:
+        """
+        Cache a decision.
+        
+        Args:
+            key_text: Canonical task + state text
+            decision: Decision to cache (a copy is stored)
+        """
+        digest = self._digest(key_text)
+        decision = replace(decision)
+        with self._lock:
+            self._entries[digest] = decision
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop all cached decisions."""
+        with self._lock:
+            self._entries.clear()
+
+
+def _model_identity(model_manager) -> str:
+    """Runtime and model a ModelManager generates with, for cache keys."""
+    config = getattr(model_manager, 'config', None)
+    if config is None:
+        return type(model_manager).__name__
+    return f"{getattr(config, 'runtime', '')}:{getattr(config, 'model_id', '')}"
+
+
+def _quantize(value: Any, step: float) -> Any:
+    """Round a number (or each number in a list/tuple) to a multiple of step."""
+    if isinstance(value, (list, tuple)):
+        return [_quantize(v, step) for v in value]
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return round(round(value / step) * step, 6)
+    return value
+
+
+# Shared across task instances so repeated scheduler runs hit the cache
+_decision_cache = DecisionCache()
+
+
 class AutonomousTask:
     """
     Base class for autonomous tasks with LLM integration.
@@ -49,7 +293,8 @@ class AutonomousTask:
         prompt_manager=None,
         memory_retrieval=None,
         memory_writer=None,
-        confidence_threshold: float = 0.7
+        confidence_threshold: float = 0.7,
+        decision_cache: Optional[DecisionCache] = None
     ):
         """
         Initialize autonomous task.
@@ -60,12 +305,24 @@ class AutonomousTask:
             memory_retrieval: MemoryRetrieval for context
             memory_writer: MemoryWriter for outcomes
             confidence_threshold: Minimum confidence for autonomous execution
+            decision_cache: Cache for LLM decisions (default: process-wide)
         """
         self.model_manager = model_manager
         self.prompt_manager = prompt_manager
         self.memory_retrieval = memory_retrieval
         self.memory_writer = memory_writer
         self.confidence_threshold = confidence_threshold
+        self.decision_cache = decision_cache if decision_cache is not None else _decision_cache
+        self._prompt_prefix: Optional[str] = None
+        self._memory_cache: Dict[str, Tuple[float, str]] = {}
+    
+    # Set by subclasses using the default execute()
+    TASK_NAME = ''
+    TASK_DESCRIPTION = ''
+    STATE_KEY = 'state'  # Result/outcome key for the gathered state
+    # Decision cache granularity: state key -> step its numbers are rounded
+    # to in the cache key (live readings rarely repeat exactly)
+    STATE_QUANTA: Dict[str, float] = {}
     
     def execute(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -77,7 +334,57 @@ class AutonomousTask:
         Returns:
             Result dict with success status and details
         """
-        raise NotImplementedError("Subclass must implement execute()")
+        current_state = self.gather_state(context)
+        
+        # Ask LLM for decision
+        decision = self._make_decision(
+            task_description=self.TASK_DESCRIPTION,
+            current_state=current_state,
+            step=1
+        )
+        
+        return self._complete(current_state, decision)
+    
+    def gather_state(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Gather the state the LLM decides on.
+        
+        Args:
+            context: Task-specific context
+        
+        Returns:
+            State dict
+        """
+        raise NotImplementedError("Subclass must implement gather_state() or execute()")
+    
+    def _complete(self, current_state: Dict[str, Any], decision: TaskDecision) -> Dict[str, Any]:
+        """
+        Log the decision outcome and build the result dict.
+        
+        The logged entry and the result each get their own copy of the
+        decision's fields, so editing one never changes the decision.
+        """
+        if self.memory_writer:
+            try:
+                self.memory_writer.write_action_outcome({
+                    'task': self.TASK_NAME,
+                    'decision': dict(decision.__dict__),
+                    self.STATE_KEY: current_state,
+                    'ts': self._get_timestamp()
+                })
+            except Exception as e:
+                logger.warning(f"Failed to log decision: {e}")
+        
+        return {
+            'success': True,
+            'decision': dict(decision.__dict__),
+            self.STATE_KEY: current_state,
+            'requires_approval': decision.requires_approval
+        }
+    
+    def _get_timestamp(self) -> str:
+        """Get ISO timestamp."""
+        return iso_now() + 'Z'
     
     def _make_decision(
         self,
@@ -96,90 +403,199 @@ class AutonomousTask:
         Returns:
             TaskDecision with LLM's recommendation
         """
-        if not self.model_manager or not self.prompt_manager:
-            # Fallback: No LLM available
-            return TaskDecision(
-                step=step,
-                action="Skip (no LLM available)",
-                confidence=0.0,
-                reasoning="LLM not configured",
-                requires_approval=True,
-                approval_reason="Cannot make autonomous decisions without LLM"
+        decision, cache_key, system_prompt = self._prepare_decision(
+            task_description, current_state, step
+        )
+        if decision is not None:
+            return decision
+        
+        try:
+            # Generate decision
+            response = self.model_manager.generate(
+                prompt=system_prompt,
+                max_tokens=512,
+                temperature=0.3,  # Low temperature for consistent decisions
+                stop=_DECISION_STOP
             )
+        except Exception as e:
+            return self._error_decision(step, e)
         
-        # Build context from memory
-        memory_context = ""
-        if self.memory_retrieval:
-            try:
-                relevant_memories = self.memory_retrieval.retrieve_from(
-                    'core', task_description, k=3
+        return self._finalize_decision(response, step, cache_key)
+    
+    @staticmethod
+    def make_decisions_batch(
+        requests: List[Tuple['AutonomousTask', str, Dict[str, Any], int]]
+    ) -> List[TaskDecision]:
+        """
+        Make decisions for several tasks with one batched LLM call per model.
+        
+        Prompts are built exactly as in _make_decision; cache hits and
+        no-LLM fallbacks are resolved without generating.
+        
+        Args:
+            requests: (task, task_description, current_state, step) tuples
+        
+        Returns:
+            One TaskDecision per request, in order
+        """
+        if len(requests) == 1:
+            task, task_description, current_state, step = requests[0]
+            return [task._make_decision(task_description, current_state, step)]
+        
+        decisions: List[Optional[TaskDecision]] = [None] * len(requests)
+        pending: Dict[int, List[Tuple[int, AutonomousTask, str, str, int]]] = {}
+        
+        for idx, (task, task_description, current_state, step) in enumerate(requests):
+            decision, cache_key, system_prompt = task._prepare_decision(
+                task_description, current_state, step
+            )
+            if decision is not None:
+                decisions[idx] = decision
+            else:
+                pending.setdefault(id(task.model_manager), []).append(
+                    (idx, task, cache_key, system_prompt, step)
                 )
-                if relevant_memories:
-                    memory_context = "\n\nRELEVANT KNOWLEDGE:\n"
-                    for mem in relevant_memories:
-                        memory_context += f"- {mem.get('text', '')}\n"
+        
+        for group in pending.values():
+            model_manager = group[0][1].model_manager
+            prompts = [system_prompt for _, _, _, system_prompt, _ in group]
+            
+            try:
+                if hasattr(model_manager, 'generate_batch'):
+                    responses = model_manager.generate_batch(
+                        prompts, max_tokens=512, temperature=0.3, stop=_DECISION_STOP
+                    )
+                else:
+                    responses = [
+                        model_manager.generate(
+                            prompt=prompt, max_tokens=512, temperature=0.3,
+                            stop=_DECISION_STOP
+                        )
+                        for prompt in prompts
+                    ]
             except Exception as e:
-                logger.warning(f"Failed to retrieve memory context: {e}")
+                for idx, task, _, _, step in group:
+                    decisions[idx] = task._error_decision(step, e)
+                continue
+            
+            for (idx, task, cache_key, _, step), response in zip(group, responses):
+                decisions[idx] = task._finalize_decision(response, step, cache_key)
+        
+        return decisions
+    
+    def _memory_context(self, task_description: str) -> str:
+        """
+        Build the RELEVANT KNOWLEDGE block for a task.
+        
+        Task descriptions are constant per task, so retrieval results are
+        reused for MEMORY_CACHE_TTL_S instead of re-embedding and
+        re-querying on every tick.
+        
+        Args:
+            task_description: Query for core knowledge
+        
+        Returns:
+            Prompt block, or "" when there is nothing relevant
+        """
+        if not self.memory_retrieval:
+            return ""
+        
+        now = time.monotonic()
+        cached = self._memory_cache.get(task_description)
+        if cached and now - cached[0] < MEMORY_CACHE_TTL_S:
+            return cached[1]
+        
+        memory_context = ""
+        try:
+            relevant_memories = self.memory_retrieval.retrieve_from(
+                'core', task_description, k=3
+            )
+            if relevant_memories:
+                memory_context = "\n\nRELEVANT KNOWLEDGE:\n"
+                for mem in relevant_memories:
+                    memory_context += f"- {mem.get('text', '')}\n"
+        except Exception as e:
+            logger.warning(f"Failed to retrieve memory context: {e}")
+            return ""
+        
+        self._memory_cache[task_description] = (now, memory_context)
+        return memory_context
+    
+    def _prepare_decision(
+        self,
+        task_description: str,
+        current_state: Dict[str, Any],
+        step: int
+    ) -> Tuple[Optional[TaskDecision], Optional[str], Optional[str]]:
+        """
+        Resolve a decision without the LLM if possible, else build its prompt.
+        
+        Returns:
+            (decision, None, None) when no LLM is needed (not configured or
+            cached), otherwise (None, cache_key, system_prompt)
+        """
+        if not self.model_manager or not self.prompt_manager:
+            # Fallback: No LLM available
+            return replace(_no_llm_decision(step)), None, None
+        
+        memory_context = self._memory_context(task_description)
         
-        # Build prompt
-        from ..model.prompt_manager import PromptMode
+        # Serialized once, for both the cache key and the prompt
+        state_json = _dumps_state(current_state)
         
-        system_prompt = self.prompt_manager.build_prompt(
-            mode=PromptMode.AUTONOMOUS,
-            task_context=f"""
+        # Same model, task, (quantized) state, knowledge and step -> reuse
+        # the earlier decision
+        if self.STATE_QUANTA:
+            key_state = _dumps_state({
+                k: _quantize(v, self.STATE_QUANTA[k]) if k in self.STATE_QUANTA else v
+                for k, v in current_state.items()
+            })
+        else:
+            key_state = state_json
+        cache_key = "\n".join([
+            _model_identity(self.model_manager),
+            task_description,
+            key_state,
+            memory_context,
+            str(step),
+            str(self.confidence_threshold),
+        ])
+        cached = self.decision_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Reusing cached LLM decision: action='{cached.action}'")
+            return cached, None, None
+        
+        # Build prompt: static prefix first so backends can reuse its KV
+        # cache, per-call task/state/step last
+        system_prompt = f"""{self._static_prompt_prefix()}
+
 TASK: {task_description}
 
 CURRENT STATE:
-{json.dumps(current_state, indent=2)}
+{state_json}
 {memory_context}
 
 STEP: {step}
 
-Analyze the current state and recommend the next action.
-Output ONLY a JSON object matching this format (no other text):
-{{
-  "step": {step},
-  "action": "<specific action to take>",
-  "confidence": <0.0-1.0>,
-  "reasoning": "<brief explanation>",
-  "requires_approval": <true|false>,
-  "approval_reason": "<reason if true, otherwise null>",
-  "risk_level": "<low|medium|high>"
-}}
-"""
-        )
+Respond with the JSON object only."""
         
-        try:
-            # Generate decision
-            response = self.model_manager.generate(
-                prompt=system_prompt,
-                max_tokens=512,
-                temperature=0.3  # Low temperature for consistent decisions
-            )
-            
-            # Parse JSON response
-            # Try to extract JSON from response (LLM might add extra text)
-            response_cleaned = response.strip()
-            
-            # Find JSON block
-            if '{' in response_cleaned and '}' in response_cleaned:
-                json_start = response_cleaned.find('{')
-                json_end = response_cleaned.rfind('}') + 1
-                json_str = response_cleaned[json_start:json_end]
-                decision_data = json.loads(json_str)
-            else:
-                raise ValueError("No JSON found in response")
-            
-            # Create TaskDecision
-            decision = TaskDecision(
-                step=decision_data.get('step', step),
-                action=decision_data.get('action', 'Unknown'),
-                confidence=float(decision_data.get('confidence', 0.0)),
-                reasoning=decision_data.get('reasoning', 'No reasoning provided'),
-                requires_approval=decision_data.get('requires_approval', True),
-                approval_reason=decision_data.get('approval_reason'),
-                risk_level=decision_data.get('risk_level', 'medium')
+        return None, cache_key, system_prompt
+    
+    def _static_prompt_prefix(self) -> str:
+        """System prompt + decision instructions, built once per task."""
+        if self._prompt_prefix is None:
+            self._prompt_prefix = self.prompt_manager.build_prompt(
+                mode=PromptMode.AUTONOMOUS,
+                task_context=_DECISION_INSTRUCTIONS
             )
+        
+        return self._prompt_prefix
+    
+    def _finalize_decision(self, response: str, step: int, cache_key: str) -> TaskDecision:
+        """Parse an LLM response into a decision and apply approval rules."""
+        try:
+            # Parse JSON response (LLM might add extra text around it)
+            decision = _decode_decision(_extract_json_object(response), step)
             
             # Enforce confidence threshold
             if decision.confidence < self.confidence_threshold:
@@ -201,19 +617,16 @@ Output ONLY a JSON object matching this format (no other text):
                 f"approval={decision.requires_approval}"
             )
             
+            self.decision_cache.put(cache_key, decision)
             return decision
         
         except Exception as e:
-            logger.error(f"Failed to get LLM decision: {e}")
-            # Fallback: Conservative decision
-            return TaskDecision(
-                step=step,
-                action="Skip (LLM error)",
-                confidence=0.0,
-                reasoning=f"LLM failed: {str(e)}",
-                requires_approval=True,
-                approval_reason="Cannot proceed without valid LLM decision"
-            )
+            return self._error_decision(step, e)
+    
+    def _error_decision(self, step: int, error: Exception) -> TaskDecision:
+        """Conservative fallback decision when the LLM call or parse fails."""
+        logger.error(f"Failed to get LLM decision: {error}")
+        return replace(_llm_error_decision(step, str(error)[:200]))
 
 
 class SystemHealthCheckTask(AutonomousTask):
@@ -223,50 +636,37 @@ class SystemHealthCheckTask(AutonomousTask):
     Checks CPU, memory, disk, and recommends actions if needed.
     """
     
-    def execute(self, context: Dict[str, Any]) -> Dict[str, Any]:
+    TASK_NAME = 'system_health_check'
+    TASK_DESCRIPTION = "Perform system health check and recommend maintenance actions"
+    STATE_KEY = 'state'
+    STATE_QUANTA = {
+        'cpu_percent': 10,
+        'cpu_temp': 5,
+        'memory_percent': 5,
+        'memory_available_gb': 1,
+        'disk_percent': 1,
+        'disk_free_gb': 5,
+        'load_avg': 0.5,
+    }
+    
+    def gather_state(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Execute health check.
+        Gather system state for the health check.
         
         Args:
             context: Optional context (unused for health check)
         
         Returns:
-            Health check results
+            Current system state
         """
         logger.info("Starting autonomous system health check")
         
-        # Gather system state
-        current_state = self._gather_system_state()
-        
-        # Ask LLM for decision
-        decision = self._make_decision(
-            task_description="Perform system health check and recommend maintenance actions",
-            current_state=current_state,
-            step=1
-        )
-        
-        # Log decision
-        if self.memory_writer:
-            try:
-                self.memory_writer.write_action_outcome({
-                    'task': 'system_health_check',
-                    'decision': decision.__dict__,
-                    'state': current_state,
-                    'ts': self._get_timestamp()
-                })
-            except Exception as e:
-                logger.warning(f"Failed to log decision: {e}")
-        
-        return {
-            'success': True,
-            'decision': decision.__dict__,
-            'state': current_state,
-            'requires_approval': decision.requires_approval
-        }
+        return self._gather_system_state()
     
     def _gather_system_state(self) -> Dict[str, Any]:
         """Gather current system state."""
-        import psutil
+        if psutil is None:
+            return {'error': 'psutil not installed'}
         
         state = {}
         
@@ -297,7 +697,6 @@ class SystemHealthCheckTask(AutonomousTask):
     def _get_cpu_temp(self) -> Optional[float]:
         """Get CPU temperature if available."""
         try:
-            import psutil
             temps = psutil.sensors_temperatures()
             
             # Try common sensor names
@@ -311,11 +710,6 @@ class SystemHealthCheckTask(AutonomousTask):
         
         except Exception:
             return None
-    
-    def _get_timestamp(self) -> str:
-        """Get ISO timestamp."""
-        from datetime import datetime, timezone
-        return datetime.now(timezone.utc).isoformat() + 'Z'
 
 
 class LogCleanupTask(AutonomousTask):
@@ -325,51 +719,26 @@ class LogCleanupTask(AutonomousTask):
     Analyzes log disk usage and recommends cleanup actions.
     """
     
-    def execute(self, context: Dict[str, Any]) -> Dict[str, Any]:
+    TASK_NAME = 'log_cleanup'
+    TASK_DESCRIPTION = "Analyze log disk usage and recommend cleanup actions"
+    STATE_KEY = 'analysis'
+    
+    def gather_state(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Execute log cleanup analysis.
+        Analyze log directories for the cleanup decision.
         
         Args:
             context: Optional context (e.g., max_age_days)
         
         Returns:
-            Cleanup recommendations
+            Log directory analysis
         """
         logger.info("Starting autonomous log cleanup analysis")
         
-        # Analyze log directories
-        log_analysis = self._analyze_logs()
-        
-        # Ask LLM for decision
-        decision = self._make_decision(
-            task_description="Analyze log disk usage and recommend cleanup actions",
-            current_state=log_analysis,
-            step=1
-        )
-        
-        # Log decision
-        if self.memory_writer:
-            try:
-                self.memory_writer.write_action_outcome({
-                    'task': 'log_cleanup',
-                    'decision': decision.__dict__,
-                    'analysis': log_analysis,
-                    'ts': self._get_timestamp()
-                })
-            except Exception as e:
-                logger.warning(f"Failed to log decision: {e}")
-        
-        return {
-            'success': True,
-            'decision': decision.__dict__,
-            'analysis': log_analysis,
-            'requires_approval': decision.requires_approval
-        }
+        return self._analyze_logs()
     
     def _analyze_logs(self) -> Dict[str, Any]:
         """Analyze log directory sizes."""
-        import os
-        
         log_dirs = [
             '/var/log',
             '/var/log/journal',
@@ -377,41 +746,92 @@ class LogCleanupTask(AutonomousTask):
             '/var/log/apache2'
         ]
         
-        analysis = {'directories': []}
+        existing = [log_dir for log_dir in log_dirs if os.path.exists(log_dir)]
         
-        for log_dir in log_dirs:
-            if not os.path.exists(log_dir):
-                continue
+        # Scans are stat-bound and release the GIL, so run them side by side;
+        # results keep log_dirs order (stable state for the decision cache)
+        with ThreadPoolExecutor(max_workers=max(1, len(existing))) as executor:
+            results = list(executor.map(self._scan_dir, existing))
+        
+        return {'directories': [r for r in results if r is not None]}
+    
+    def _scan_dir(self, log_dir: str) -> Optional[Dict[str, Any]]:
+        """Size summary for one log directory, or None on failure."""
+        try:
+            # Get directory size
+            total_size, file_count = self._dir_usage(log_dir)
             
+            return {
+                'path': log_dir,
+                'size_gb': total_size / (1024**3),
+                'file_count': file_count
+            }
+        
+        except Exception as e:
+            logger.warning(f"Failed to analyze {log_dir}: {e}")
+            return None
+    
+    @staticmethod
+    def _dir_usage(path: str) -> Tuple[int, int]:
+        """
+        Total size and count of regular files under path.
+        
+        Uses os.scandir, whose entries carry the file type from the
+        directory read and cache their stat result, instead of os.walk +
+        os.path.getsize (a separate path build and stat per file).
+        Symlinks are not followed. Sizes are collected into a list and
+        reduced once with sum(), keeping per-file work to one append.
+        """
+        sizes: List[int] = []
+        add_size = sizes.append
+        pending = [path]
+        
+        while pending:
             try:
-                # Get directory size
-                total_size = 0
-                file_count = 0
-                
-                for dirpath, dirnames, filenames in os.walk(log_dir):
-                    for filename in filenames:
-                        filepath = os.path.join(dirpath, filename)
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
                         try:
-                            total_size += os.path.getsize(filepath)
-                            file_count += 1
-                        except (OSError, FileNotFoundError):
+                            if entry.is_file(follow_symlinks=False):
+                                add_size(entry.stat(follow_symlinks=False).st_size)
+                            elif entry.is_dir(follow_symlinks=False):
+                                pending.append(entry.path)
+                        except OSError:
                             pass
-                
-                analysis['directories'].append({
-                    'path': log_dir,
-                    'size_gb': total_size / (1024**3),
-                    'file_count': file_count
-                })
-            
-            except Exception as e:
-                logger.warning(f"Failed to analyze {log_dir}: {e}")
+            except OSError:
+                pass
         
-        return analysis
+        return sum(sizes), len(sizes)
+
+
+def execute_batch(
+    tasks: List[AutonomousTask],
+    context: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Execute several autonomous tasks with batched LLM decisions.
     
-    def _get_timestamp(self) -> str:
-        """Get ISO timestamp."""
-        from datetime import datetime, timezone
-        return datetime.now(timezone.utc).isoformat() + 'Z'
+    State is gathered per task, then all decisions go through one
+    make_decisions_batch() call (one generate_batch() per model).
+    
+    Args:
+        tasks: Tasks using the default execute() flow
+        context: Context passed to every task
+    
+    Returns:
+        One result dict per task, in order
+    """
+    context = context or {}
+    states = [task.gather_state(context) for task in tasks]
+    
+    decisions = AutonomousTask.make_decisions_batch([
+        (task, task.TASK_DESCRIPTION, state, 1)
+        for task, state in zip(tasks, states)
+    ])
+    
+    return [
+        task._complete(state, decision)
+        for task, state, decision in zip(tasks, states, decisions)
+    ]
 
 
 # Factory function for creating tasks
@@ -1,55 +1,248 @@
 from __future__ import annotations
+import atexit
 import json
+import logging
 import os
-from datetime import datetime, timezone
+import sqlite3
+import threading
+import time
+import weakref
+from collections import defaultdict
 from typing import Dict, List, Optional
 from .job import Job
 from ..utils.paths import data_subdir
+from ..utils.timestamps import iso_now
 from ..obs.tracing import trace_call
 
+# Optional: faster JSON for job blobs
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger('halbert')
+
+# Writes queued within this window are coalesced into one transaction
+FLUSH_DEBOUNCE_S = 0.05
+# Wait before retrying after a failed write
+FLUSH_RETRY_S = 1.0
+# Longest wait for the background writer on close or at exit
+FLUSH_JOIN_S = 5.0
+
+_JOBS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    state TEXT,
+    priority INTEGER,
+    created_at TEXT,
+    blob BLOB
+)
+"""
+
+
+def _dumps(data: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(blob: bytes) -> dict:
+    if orjson is not None:
+        return orjson.loads(blob)
+    return json.loads(blob)
+
+
+def _job_sort_key(job: Job):
+    return (job.priority, job.created_at or "")
+
+
+def _flush_at_exit(ref: "weakref.ref[SchedulerEngine]") -> None:
+    """Write an engine's queued changes before the interpreter exits."""
+    engine = ref()
+    if engine is None:
+        return
+    try:
+        engine._drain()
+    except Exception as e:
+        logger.error(f"Failed to persist scheduler jobs at exit: {e}")
+
 
 class SchedulerEngine:
     """
     Phase 2 scheduler engine (minimal).
     Manages job queue, persistence, and execution lifecycle.
+
+    Jobs are persisted in a single SQLite table (``jobs.db``) so startup
+    reads every job in one query instead of opening one file per job.
+    Jobs are also indexed by state, so filtered listings only touch jobs
+    in that state, and sorted listings are cached until the next change.
+    The job maps are shared with scheduler worker threads and guarded by
+    one lock.
+    State changes are written by a short-lived background thread, so
+    bursts of transitions collapse into one write per job; call
+    ``flush()`` to write them immediately. Queued changes are also
+    written by ``close()`` and when the interpreter exits.
     """
     def __init__(self, persist_dir: Optional[str] = None):
         self.persist_dir = persist_dir or data_subdir("scheduler")
         os.makedirs(self.persist_dir, exist_ok=True)
+        self._lock = threading.Lock()
         self.jobs: Dict[str, Job] = {}
+        self._by_state: Dict[str, Dict[str, Job]] = defaultdict(dict)
+        self._sorted: Dict[Optional[str], List[Job]] = {}
+        self._dirty: Dict[str, Job] = {}
+        self._dirty_lock = threading.Lock()
+        self._flush_thread: Optional[threading.Thread] = None
+        self._draining = threading.Event()
+        self._db_lock = threading.Lock()
+        self._db = sqlite3.connect(
+            os.path.join(self.persist_dir, "jobs.db"), check_same_thread=False
+        )
+        with self._db_lock, self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(_JOBS_SCHEMA)
+        self._migrate_json_jobs()
         self._load_jobs()
+        atexit.register(_flush_at_exit, weakref.ref(self))
 
-    def _job_path(self, job_id: str) -> str:
-        return os.path.join(self.persist_dir, f"{job_id}.json")
-
-    def _load_jobs(self) -> None:
-        """Load persisted jobs from disk."""
-        if not os.path.isdir(self.persist_dir):
-            return
+    def _migrate_json_jobs(self) -> None:
+        """One-shot import of legacy per-job ``<id>.json`` files."""
+        migrated = []
         for fname in os.listdir(self.persist_dir):
             if not fname.endswith(".json"):
                 continue
+            path = os.path.join(self.persist_dir, fname)
             try:
-                with open(os.path.join(self.persist_dir, fname), "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                job = Job(**data)
-                self.jobs[job.id] = job
+                with open(path, "r", encoding="utf-8") as f:
+                    migrated.append((path, Job(**json.load(f))))
+            except Exception:
+                continue
+        if not migrated:
+            return
+        self._persist_jobs([job for _, job in migrated])
+        for path, _ in migrated:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        logger.info(f"Migrated {len(migrated)} legacy job files to jobs.db")
+
+    def _load_jobs(self) -> None:
+        """Load persisted jobs from the jobs table."""
+        with self._db_lock:
+            rows = self._db.execute("SELECT blob FROM jobs").fetchall()
+        loaded = []
+        for (blob,) in rows:
+            try:
+                loaded.append(Job(**_loads(blob)))
             except Exception:
                 continue
+        with self._lock:
+            for job in loaded:
+                self.jobs[job.id] = job
+                self._by_state[job.state][job.id] = job
+            self._sorted.clear()
+
+    def _set_state(self, job: Job, state: str) -> None:
+        """Change a job's state and move it to the matching bucket (lock held)."""
+        self._by_state[job.state].pop(job.id, None)
+        job.state = state
+        self._by_state[state][job.id] = job
+        self._sorted.clear()
+
+    def _persist_jobs(self, jobs: List[Job]) -> None:
+        """Persist several jobs in one transaction."""
+        with self._db_lock, self._db:
+            rows = [
+                (job.id, job.state, job.priority, job.created_at, _dumps(job.__dict__))
+                for job in jobs
+            ]
+            self._db.executemany(
+                "INSERT OR REPLACE INTO jobs (id, state, priority, created_at, blob) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
 
     def _persist_job(self, job: Job) -> None:
-        """Persist job state to disk."""
-        path = self._job_path(job.id)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(job.__dict__, f, ensure_ascii=False, indent=2)
+        """Queue job state for the background writer."""
+        with self._dirty_lock:
+            self._dirty[job.id] = job
+            if self._flush_thread is None:
+                self._flush_thread = threading.Thread(
+                    target=self._flush_loop, name="scheduler-flush", daemon=True
+                )
+                self._flush_thread.start()
+
+    def _flush_loop(self) -> None:
+        """Write queued jobs after a short debounce; exit once idle."""
+        while True:
+            # Cut short once the engine is closing
+            self._draining.wait(FLUSH_DEBOUNCE_S)
+            with self._dirty_lock:
+                if not self._dirty:
+                    self._flush_thread = None
+                    return
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Failed to persist scheduler jobs, will retry: {e}")
+                time.sleep(FLUSH_RETRY_S)
+
+    def flush(self) -> None:
+        """
+        Write all queued job changes now.
+
+        If the write fails the jobs are queued again (unless re-queued
+        meanwhile) and the error is raised.
+        """
+        with self._dirty_lock:
+            jobs = list(self._dirty.values())
+            self._dirty.clear()
+        if not jobs:
+            return
+        try:
+            self._persist_jobs(jobs)
+        except Exception:
+            with self._dirty_lock:
+                for job in jobs:
+                    self._dirty.setdefault(job.id, job)
+            raise
+
+    def _drain(self) -> None:
+        """Write queued changes and wait for the background writer."""
+        self._draining.set()
+        with self._dirty_lock:
+            thread = self._flush_thread
+        self.flush()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(FLUSH_JOIN_S)
+
+    def close(self) -> None:
+        """Write queued changes and close the job store."""
+        self._drain()
+        with self._db_lock:
+            self._db.close()
 
     @trace_call("scheduler.add_job")
-    def add_job(self, job: Job) -> None:
-        """Add a job to the queue."""
+    def add_job(self, job: Job, persist: bool = True) -> None:
+        """
+        Add a job to the queue.
+
+        With persist=False the job is only tracked in memory until its
+        first persisted state change, for callers whose own job store
+        already records the schedule.
+        """
         if not job.created_at:
-            job.created_at = datetime.now(timezone.utc).isoformat()
-        self.jobs[job.id] = job
-        self._persist_job(job)
+            job.created_at = iso_now()
+        with self._lock:
+            old = self.jobs.get(job.id)
+            if old is not None:
+                self._by_state[old.state].pop(job.id, None)
+            self.jobs[job.id] = job
+            self._by_state[job.state][job.id] = job
+            self._sorted.clear()
+        if persist:
+            self._persist_job(job)
 
     @trace_call("scheduler.get_job")
     def get_job(self, job_id: str) -> Optional[Job]:
@@ -59,33 +252,57 @@ class SchedulerEngine:
     @trace_call("scheduler.list_jobs")
     def list_jobs(self, state: Optional[str] = None) -> List[Job]:
         """List jobs, optionally filtered by state."""
-        jobs = list(self.jobs.values())
-        if state:
-            jobs = [j for j in jobs if j.state == state]
-        return sorted(jobs, key=lambda j: (j.priority, j.created_at or ""))
+        state = state or None
+        # Sorted and stored under the lock, so a change made meanwhile can
+        # never be followed by a stale listing being cached
+        with self._lock:
+            cached = self._sorted.get(state)
+            if cached is None:
+                jobs = self._by_state.get(state, {}) if state else self.jobs
+                cached = self._sorted[state] = sorted(jobs.values(), key=_job_sort_key)
+            return list(cached)
+
+    def count_by_state(self) -> Dict[str, int]:
+        """Number of jobs per state (states with no jobs are omitted)."""
+        with self._lock:
+            return {state: len(jobs) for state, jobs in self._by_state.items() if jobs}
 
     @trace_call("scheduler.cancel_job")
     def cancel_job(self, job_id: str) -> bool:
         """Cancel a pending job."""
-        job = self.jobs.get(job_id)
-        if not job or job.is_terminal():
-            return False
-        job.state = "cancelled"
-        job.completed_at = datetime.now(timezone.utc).isoformat()
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if not job or job.is_terminal():
+                return False
+            self._set_state(job, "cancelled")
+            job.completed_at = iso_now()
         self._persist_job(job)
         return True
 
     @trace_call("scheduler.update_job_state")
-    def update_job_state(self, job_id: str, state: str, error: Optional[str] = None) -> None:
-        """Update job state and persist."""
-        job = self.jobs.get(job_id)
-        if not job:
-            return
-        job.state = state
-        if state == "running" and not job.started_at:
-            job.started_at = datetime.now(timezone.utc).isoformat()
-        if state in ("completed", "failed", "cancelled"):
-            job.completed_at = datetime.now(timezone.utc).isoformat()
-        if error:
-            job.error = error
-        self._persist_job(job)
+    def update_job_state(
+        self,
+        job_id: str,
+        state: str,
+        error: Optional[str] = None,
+        persist: bool = True
+    ) -> None:
+        """
+        Update job state and persist.
+
+        With persist=False the change is kept in memory only, for transient
+        states that the next persisted transition supersedes.
+        """
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if not job:
+                return
+            self._set_state(job, state)
+            if state == "running" and not job.started_at:
+                job.started_at = iso_now()
+            if state in ("completed", "failed", "cancelled"):
+                job.completed_at = iso_now()
+            if error:
+                job.error = error
+        if persist:
+            self._persist_job(job)
@@ -3,7 +3,7 @@ Autonomous scheduler execution engine for Phase 3 M3.
 
 Based on APScheduler best practices:
 - BackgroundScheduler (non-blocking)
-- SQLAlchemyJobStore (persistence)
+- MemoryJobStore with periodic snapshots, or SQLAlchemyJobStore (persistence)
 - ThreadPoolExecutor (parallelism)
 - Cron triggers (sophisticated patterns)
 
@@ -11,38 +11,211 @@ Research: https://betterstack.com/community/guides/scaling-python/apscheduler-sc
 """
 
 from __future__ import annotations
+import functools
+import importlib.util
+import json
 import logging
 import os
+import queue
+import sqlite3
+import threading
+import time
+import types
+from concurrent import futures
 from datetime import datetime, timezone
-from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 from dataclasses import dataclass
 
 try:
-    from apscheduler.schedulers.background import BackgroundScheduler
-    from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
-    from apscheduler.executors.pool import ThreadPoolExecutor
-    from apscheduler.triggers.cron import CronTrigger
-    APSCHEDULER_AVAILABLE = True
-except ImportError:
-    APSCHEDULER_AVAILABLE = False
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 from .job import Job
 from .engine import SchedulerEngine
-from ..utils.retry import exponential_backoff_retry, STANDARD_TASK_POLICY
-from ..utils.paths import data_subdir
+from ..utils.retry import exponential_backoff_retry
+from ..utils.paths import data_subdir, state_subdir
+from ..utils.timestamps import iso_now_z
 from ..obs.tracing import trace_call
-from ..autonomy import (
-    GuardrailEnforcer,
-    GuardrailViolation,
-    BudgetTracker,
-    BudgetExceeded,
-    AnomalyDetector,
-    RecoveryExecutor
+
+# APScheduler (and SQLAlchemy, through its job store) dominate this module's
+# import time, so they are only imported when an executor is created
+APSCHEDULER_AVAILABLE = (
+    importlib.util.find_spec("apscheduler") is not None
+    and importlib.util.find_spec("sqlalchemy") is not None
 )
 
 logger = logging.getLogger('halbert.scheduler.executor')
 
+# Job outcomes are appended to memory in groups of up to this many, or
+# after this long since the first queued outcome, whichever comes first
+OUTCOME_BATCH_SIZE = 50
+OUTCOME_FLUSH_S = 0.5
+
+# Where task bodies run: threads for I/O-bound or subprocess-dispatching
+# tasks, processes for CPU-bound pure-Python tasks (task_func must then be
+# picklable, i.e. a module-level function)
+TASK_EXECUTORS = ('default', 'processpool')
+
+# Job store backends: 'memory' keeps jobs in RAM and snapshots their next run
+# times every SNAPSHOT_INTERVAL_S; 'sql' writes every change to the database
+PERSISTENCE_MODES = ('memory', 'sql')
+SNAPSHOT_INTERVAL_S = 30.0
+
+SNAPSHOT_FILENAME = "jobs.snapshot.json"
+
+# Process-wide MemoryWriter for job outcomes, created on first use
+_MEMORY_WRITER = None
+_MEMORY_WRITER_LOCK = threading.Lock()
+
+
+def _get_memory_writer():
+    """Return the shared MemoryWriter, creating it on first call."""
+    global _MEMORY_WRITER
+    if _MEMORY_WRITER is None:
+        with _MEMORY_WRITER_LOCK:
+            if _MEMORY_WRITER is None:
+                # Import here to avoid circular dependency
+                from ..memory.writer import MemoryWriter
+                _MEMORY_WRITER = MemoryWriter()
+    return _MEMORY_WRITER
+
+
+def job_snapshot_path(db_path: Optional[str] = None) -> str:
+    """
+    Where the memory job store's snapshot lives for a given db_path.
+    
+    The default location is under the state directory rather than next to
+    jobs.db, whose directory the SchedulerEngine scans for legacy job files.
+    
+    Args:
+        db_path: The executor's db_path (None or a URL for the default)
+    
+    Returns:
+        Snapshot file path
+    """
+    if db_path is None or '://' in db_path:
+        return os.path.join(state_subdir("scheduler"), SNAPSHOT_FILENAME)
+    return os.path.join(os.path.dirname(db_path) or '.', SNAPSHOT_FILENAME)
+
+
+def read_next_run_times(db_path: Optional[str] = None) -> Dict[str, Optional[str]]:
+    """
+    Next run times of scheduled jobs, without starting a scheduler.
+    
+    Reads the memory job store's snapshot and, for persistence='sql' on
+    SQLite, APScheduler's job table; either may be missing.
+    
+    Args:
+        db_path: The executor's db_path (None for the default)
+    
+    Returns:
+        Job ID to ISO next run time (None for paused jobs)
+    """
+    next_runs: Dict[str, Optional[str]] = {}
+    try:
+        with open(job_snapshot_path(db_path), 'rb') as f:
+            data = f.read()
+        for entry in orjson.loads(data) if orjson else json.loads(data):
+            next_runs[entry['id']] = entry['next_run']
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable job snapshot: {e}")
+    
+    if db_path is None:
+        db_path = os.path.join(data_subdir("scheduler"), "jobs.db")
+    if '://' not in db_path and os.path.exists(db_path):
+        try:
+            conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+            try:
+                rows = conn.execute(
+                    "SELECT id, next_run_time FROM apscheduler_jobs"
+                ).fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            rows = []  # No SQL job store in this database
+        for job_id, ts in rows:
+            next_runs[job_id] = (
+                datetime.fromtimestamp(ts, timezone.utc).isoformat() if ts is not None else None
+            )
+    
+    return next_runs
+
+
+@functools.lru_cache(maxsize=None)
+def _apscheduler() -> types.SimpleNamespace:
+    """Import the APScheduler and SQLAlchemy names used here, once."""
+    from apscheduler.schedulers.background import BackgroundScheduler
+    from apscheduler.events import EVENT_ALL_JOBS_REMOVED, EVENT_JOB_REMOVED
+    from apscheduler.jobstores.memory import MemoryJobStore
+    from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
+    from apscheduler.executors.pool import ThreadPoolExecutor
+    from apscheduler.triggers.cron import CronTrigger
+    from sqlalchemy import create_engine, event
+    
+    return types.SimpleNamespace(
+        BackgroundScheduler=BackgroundScheduler,
+        EVENT_ALL_JOBS_REMOVED=EVENT_ALL_JOBS_REMOVED,
+        EVENT_JOB_REMOVED=EVENT_JOB_REMOVED,
+        MemoryJobStore=MemoryJobStore,
+        SQLAlchemyJobStore=SQLAlchemyJobStore,
+        ThreadPoolExecutor=ThreadPoolExecutor,
+        CronTrigger=CronTrigger,
+        create_engine=create_engine,
+        event=event
+    )
+
+
+def _jobstore_engine(db_path: str):
+    """
+    Build the SQLAlchemy engine for the APScheduler job store.
+    
+    SQLite is opened in WAL mode with a long busy timeout, so the executor's
+    worker threads and the scheduler wait for the single writer lock
+    instead of failing with "database is locked".
+    
+    Args:
+        db_path: SQLite file path or a full SQLAlchemy URL
+    
+    Returns:
+        SQLAlchemy engine
+    """
+    aps = _apscheduler()
+    url = db_path if '://' in db_path else f'sqlite:///{db_path}'
+    if not url.startswith('sqlite'):
+        return aps.create_engine(url)
+    
+    engine = aps.create_engine(
+        url, connect_args={'timeout': 60, 'check_same_thread': False}
+    )
+    
+    @aps.event.listens_for(engine, 'connect')
+    def _set_sqlite_pragmas(dbapi_conn, _record):
+        cursor = dbapi_conn.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute('PRAGMA busy_timeout=60000')
+        cursor.execute('PRAGMA wal_autocheckpoint=1000')
+        cursor.close()
+    
+    return engine
+
+
+@functools.lru_cache(maxsize=256)
+def _make_cron_trigger(cron_items: tuple):
+    """
+    Shared UTC CronTrigger for a cron expression.
+    
+    CronTrigger holds no per-job state, so jobs with identical schedules
+    can use one instance instead of re-parsing every field.
+    
+    Args:
+        cron_items: Sorted (field, value) pairs of the cron expression
+    """
+    return _apscheduler().CronTrigger(**dict(cron_items), timezone='UTC')
+
 
 @dataclass
 class JobResult:
@@ -85,21 +258,46 @@ class AutonomousExecutor:
         max_workers: int = 5,
         db_path: Optional[str] = None,
         enable_llm: bool = True,
-        enable_guardrails: bool = True
+        enable_guardrails: bool = True,
+        persistence: str = 'memory'
     ):
         """
         Initialize autonomous executor.
         
         Args:
             max_workers: Maximum parallel jobs (default: 5)
-            db_path: SQLite database path for job persistence
+            db_path: SQLite database path for job persistence, or a full
+                SQLAlchemy URL (e.g. PostgreSQL when several processes share
+                one job store)
             enable_llm: Enable LLM-driven decisions (default: True)
             enable_guardrails: Enable guardrail enforcement (default: True, Phase 3 M6)
+            persistence: 'memory' (default) keeps jobs in RAM and snapshots
+                their next run times (see job_snapshot_path) every
+                SNAPSHOT_INTERVAL_S; 'sql' stores jobs in db_path through
+                SQLAlchemy, committing on every fire (crash-consistent)
+        
+        Raises:
+            ImportError: If APScheduler is not installed
+            ValueError: If persistence is not one of PERSISTENCE_MODES
         """
         if not APSCHEDULER_AVAILABLE:
             raise ImportError(
                 "APScheduler not installed. Install with: pip install apscheduler"
             )
+        if persistence not in PERSISTENCE_MODES:
+            raise ValueError(
+                f"Unknown persistence {persistence!r}; expected one of {PERSISTENCE_MODES}"
+            )
+        aps = _apscheduler()
+        
+        # Guardrail stack (pulls in YAML config loading), imported on first use
+        from ..autonomy import (
+            GuardrailEnforcer,
+            BudgetTracker,
+            AnomalyDetector,
+            RecoveryExecutor,
+            load_autonomy_config
+        )
         
         self.max_workers = max_workers
         self.enable_llm = enable_llm
@@ -110,12 +308,14 @@ class AutonomousExecutor:
         if self.enable_guardrails:
             try:
                 self.guardrail_enforcer = GuardrailEnforcer()
-                # Load anomaly detector config
-                import yaml
-                with open("config/autonomy.yml") as f:
-                    autonomy_config = yaml.safe_load(f)
+                # Load anomaly detector config (cached parse, shared with guardrails)
+                autonomy_config = load_autonomy_config()
                 self.anomaly_detector = AnomalyDetector(autonomy_config["anomalies"])
                 self.recovery_executor = RecoveryExecutor(autonomy_config["recovery"])
+                # Limits parsed once; each job takes a fresh copy
+                self._budget_template = BudgetTracker.from_config(
+                    self.guardrail_enforcer.config["budgets"]
+                )
                 logger.info("Guardrails enabled for autonomous execution")
             except Exception as e:
                 logger.warning(f"Failed to initialize guardrails: {e}. Continuing without guardrails.")
@@ -123,10 +323,14 @@ class AutonomousExecutor:
                 self.guardrail_enforcer = None
                 self.anomaly_detector = None
                 self.recovery_executor = None
+                self._budget_template = None
         else:
             self.guardrail_enforcer = None
             self.anomaly_detector = None
             self.recovery_executor = None
+            self._budget_template = None
+        
+        snapshot_path = job_snapshot_path(db_path)
         
         # Database path for job persistence
         if db_path is None:
@@ -134,15 +338,20 @@ class AutonomousExecutor:
             db_path = os.path.join(data_dir, "jobs.db")
         
         self.db_path = db_path
+        self.persistence = persistence
         
         # Job store (persistence)
-        jobstores = {
-            'default': SQLAlchemyJobStore(url=f'sqlite:///{db_path}')
-        }
+        if persistence == 'sql':
+            jobstore = aps.SQLAlchemyJobStore(engine=_jobstore_engine(db_path))
+            self.snapshot_path = None
+        else:
+            jobstore = aps.MemoryJobStore()
+            self.snapshot_path = snapshot_path
+        jobstores = {'default': jobstore}
         
         # Executors (parallelism)
         executors = {
-            'default': ThreadPoolExecutor(max_workers)
+            'default': aps.ThreadPoolExecutor(max_workers)
         }
         
         # Job defaults
@@ -153,7 +362,7 @@ class AutonomousExecutor:
         }
         
         # Initialize APScheduler
-        self.scheduler = BackgroundScheduler(
+        self.scheduler = aps.BackgroundScheduler(
             jobstores=jobstores,
             executors=executors,
             job_defaults=job_defaults,
@@ -162,9 +371,38 @@ class AutonomousExecutor:
         
         self._running = False
         
+        # Scheduled APScheduler jobs by ID, so listing them never takes the
+        # job store lock. The memory store keeps and updates these same Job
+        # objects, so their next_run_time stays current.
+        self._job_index: Dict[str, Any] = {}
+        self._job_index_lock = threading.RLock()
+        self.scheduler.add_listener(
+            self._on_job_removed, aps.EVENT_JOB_REMOVED | aps.EVENT_ALL_JOBS_REMOVED
+        )
+        
+        # Next run times from the last snapshot (job_id -> (trigger, ISO time)),
+        # applied when the same job is scheduled again
+        self._restored_runs = self._read_snapshot()
+        # Set once a job is scheduled; an executor that never schedules one
+        # (e.g. a short-lived inspector) never overwrites the snapshot
+        self._has_scheduled = False
+        self._snapshot_stop = threading.Event()
+        self._snapshot_thread: Optional[threading.Thread] = None
+        
+        # Run task bodies so their timeout can be enforced from worker threads,
+        # keyed by TASK_EXECUTORS name, created on first use
+        self._task_pools: Dict[str, futures.Executor] = {}
+        self._task_pool_lock = threading.Lock()
+        
+        # Outcome log, drained by a background writer thread
+        self._outcomes: queue.SimpleQueue = queue.SimpleQueue()
+        self._outcome_thread: Optional[threading.Thread] = None
+        self._outcome_lock = threading.Lock()
+        
         logger.info(
             f"Autonomous executor initialized: "
-            f"max_workers={max_workers}, db_path={db_path}, llm={enable_llm}"
+            f"max_workers={max_workers}, db_path={db_path}, "
+            f"persistence={persistence}, llm={enable_llm}"
         )
     
     def start(self):
@@ -175,6 +413,18 @@ class AutonomousExecutor:
         
         self.scheduler.start()
         self._running = True
+        
+        # Pick up jobs restored from the persistent job store
+        with self._job_index_lock:
+            for job in self.scheduler.get_jobs():
+                self._job_index.setdefault(job.id, job)
+        
+        if self.snapshot_path:
+            self._snapshot_stop.clear()
+            self._snapshot_thread = threading.Thread(
+                target=self._snapshot_loop, name="job-snapshot", daemon=True
+            )
+            self._snapshot_thread.start()
         logger.info("Autonomous scheduler started")
     
     def stop(self, wait: bool = True):
@@ -187,8 +437,20 @@ class AutonomousExecutor:
         if not self._running:
             return
         
+        if self._snapshot_thread is not None:
+            self._snapshot_stop.set()
+            self._snapshot_thread.join()
+            self._snapshot_thread = None
+            self._write_snapshot()
+        
         self.scheduler.shutdown(wait=wait)
         self._running = False
+        with self._task_pool_lock:
+            for pool in self._task_pools.values():
+                pool.shutdown(wait=wait)
+            self._task_pools.clear()
+        self.flush_outcomes()
+        self.scheduler_engine.flush()
         logger.info("Autonomous scheduler stopped")
     
     @trace_call("executor.schedule_cron_job")
@@ -199,7 +461,8 @@ class AutonomousExecutor:
         cron_expr: Dict[str, Any],
         max_retries: int = 3,
         timeout_s: int = 600,
-        description: str = ''
+        description: str = '',
+        executor: str = 'default'
     ) -> str:
         """
         Schedule a cron job with retry logic.
@@ -214,6 +477,9 @@ class AutonomousExecutor:
             max_retries: Maximum retry attempts (default: 3)
             timeout_s: Timeout in seconds (default: 600)
             description: Human-readable description
+            executor: 'default' (threads; I/O-bound or subprocess-dispatched
+                tools) or 'processpool' (CPU-bound pure-Python work; task_func
+                must be a picklable module-level function)
         
         Returns:
             Job ID
@@ -234,31 +500,34 @@ class AutonomousExecutor:
             )
         """
         # Create Job record for tracking
-        job = Job(
+        self._track_job(Job(
             id=job_id,
             task=task_func.__name__,
             schedule=str(cron_expr),
             max_retries=max_retries,
             timeout_s=timeout_s
-        )
-        self.scheduler_engine.add_job(job)
+        ))
         
         # Wrap task with retry logic
         wrapped_func = self._wrap_task(
             job_id=job_id,
             task_func=task_func,
             max_retries=max_retries,
-            timeout_s=timeout_s
+            timeout_s=timeout_s,
+            executor=executor
         )
         
         # Schedule with APScheduler
-        self.scheduler.add_job(
+        trigger = _make_cron_trigger(tuple(sorted(cron_expr.items())))
+        aps_job = self.scheduler.add_job(
             func=wrapped_func,
-            trigger=CronTrigger(**cron_expr, timezone='UTC'),
+            trigger=trigger,
             id=job_id,
             name=description or job_id,
-            replace_existing=True
+            replace_existing=True,
+            **self._restored_run_kwargs(job_id, trigger)
         )
+        self._index_job(aps_job)
         
         logger.info(
             f"Scheduled cron job: {job_id} with expr: {cron_expr}, "
@@ -267,6 +536,30 @@ class AutonomousExecutor:
         
         return job_id
     
+    def schedule_many(self, specs: List[Dict[str, Any]]) -> List[str]:
+        """
+        Schedule several cron jobs at once (e.g. replaying a policy file).
+        
+        The scheduler is paused while the jobs are added so it does not wake
+        up and recompute its next run time after every job; the Job records
+        are persisted together by the engine's coalescing flush.
+        
+        Args:
+            specs: Keyword arguments for schedule_cron_job(), one dict per job
+        
+        Returns:
+            Job IDs, in spec order
+        """
+        paused = self._running
+        if paused:
+            self.scheduler.pause()
+        
+        try:
+            return [self.schedule_cron_job(**spec) for spec in specs]
+        finally:
+            if paused:
+                self.scheduler.resume()
+    
     @trace_call("executor.schedule_one_time")
     def schedule_one_time(
         self,
@@ -274,7 +567,8 @@ class AutonomousExecutor:
         task_func: Callable,
         run_at: datetime,
         max_retries: int = 3,
-        timeout_s: int = 600
+        timeout_s: int = 600,
+        executor: str = 'default'
     ) -> str:
         """
         Schedule a one-time job.
@@ -285,28 +579,29 @@ class AutonomousExecutor:
             run_at: Execution time (datetime)
             max_retries: Maximum retry attempts
             timeout_s: Timeout in seconds
+            executor: 'default' or 'processpool' (see schedule_cron_job)
         
         Returns:
             Job ID
         """
-        job = Job(
+        self._track_job(Job(
             id=job_id,
             task=task_func.__name__,
             schedule=run_at.isoformat(),
             max_retries=max_retries,
             timeout_s=timeout_s
-        )
-        self.scheduler_engine.add_job(job)
+        ))
         
-        wrapped_func = self._wrap_task(job_id, task_func, max_retries, timeout_s)
+        wrapped_func = self._wrap_task(job_id, task_func, max_retries, timeout_s, executor)
         
-        self.scheduler.add_job(
+        aps_job = self.scheduler.add_job(
             func=wrapped_func,
             trigger='date',
             run_date=run_at,
             id=job_id,
             replace_existing=True
         )
+        self._index_job(aps_job)
         
         logger.info(f"Scheduled one-time job: {job_id} at {run_at}")
         return job_id
@@ -323,6 +618,8 @@ class AutonomousExecutor:
         """
         try:
             self.scheduler.remove_job(job_id)
+            with self._job_index_lock:
+                self._job_index.pop(job_id, None)
             self.scheduler_engine.cancel_job(job_id)
             logger.info(f"Cancelled job: {job_id}")
             return True
@@ -331,30 +628,178 @@ class AutonomousExecutor:
             return False
     
     def get_scheduled_jobs(self) -> List[Dict[str, Any]]:
-        """Get list of all scheduled jobs."""
+        """
+        Get list of all scheduled jobs.
+        
+        With the memory job store this is served from the job index, whose
+        Job objects are the store's own, so next run times reflect resumed,
+        coalesced and paused jobs. The SQL store deserializes fresh Job
+        objects on every change, so it is read directly.
+        """
+        if self.persistence == 'sql':
+            entries = self.scheduler.get_jobs()
+        else:
+            with self._job_index_lock:
+                entries = list(self._job_index.values())
+        
         jobs = []
-        for job in self.scheduler.get_jobs():
+        for job in entries:
+            # Unset until the scheduler has started
+            next_run = getattr(job, 'next_run_time', None)
             jobs.append({
                 'id': job.id,
                 'name': job.name,
-                'next_run': job.next_run_time.isoformat() if job.next_run_time else None,
+                'next_run': next_run.isoformat() if next_run else None,
                 'trigger': str(job.trigger)
             })
         return jobs
     
+    def _track_job(self, job: Job):
+        """
+        Register a job's tracking record with the scheduler engine.
+        
+        Jobs re-registered unchanged (e.g. at every startup) keep their
+        stored record and history, so scheduling them writes nothing, unless
+        the record is terminal (cancelled, or finished on an earlier run): it
+        is scheduled again, so it goes back to pending. With
+        persistence='sql' APScheduler's job store already holds the schedule,
+        so a new record is written with its first state change instead.
+        """
+        existing = self.scheduler_engine.get_job(job.id)
+        if existing is not None and (
+            (existing.task, existing.schedule, existing.max_retries, existing.timeout_s)
+            == (job.task, job.schedule, job.max_retries, job.timeout_s)
+        ):
+            if existing.is_terminal():
+                existing.started_at = None
+                existing.completed_at = None
+                existing.error = None
+                existing.retries = 0
+                self.scheduler_engine.update_job_state(job.id, 'pending')
+            return
+        
+        self.scheduler_engine.add_job(job, persist=self.persistence != 'sql')
+    
+    def _restored_run_kwargs(self, job_id: str, trigger) -> Dict[str, Any]:
+        """
+        add_job() kwargs resuming a job at its snapshotted next run time.
+        
+        Only applies when the job is rescheduled with the same trigger, so a
+        changed schedule starts afresh.
+        """
+        restored = self._restored_runs.pop(job_id, None)
+        if not restored or restored[0] != str(trigger) or not restored[1]:
+            return {}
+        return {'next_run_time': datetime.fromisoformat(restored[1])}
+    
+    def _read_snapshot(self) -> Dict[str, tuple]:
+        """Load next run times written by _write_snapshot(), if any."""
+        if not self.snapshot_path:
+            return {}
+        
+        try:
+            with open(self.snapshot_path, 'rb') as f:
+                data = f.read()
+            entries = orjson.loads(data) if orjson else json.loads(data)
+            return {
+                entry['id']: (entry['trigger'], entry['next_run'])
+                for entry in entries
+            }
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable job snapshot {self.snapshot_path}: {e}")
+            return {}
+    
+    def _write_snapshot(self):
+        """
+        Atomically write each job's trigger and next run time.
+        
+        Restored entries whose job has not been scheduled again yet are
+        carried over, so they survive until it is.
+        """
+        if not self._has_scheduled:
+            return
+        
+        entries = [
+            {
+                'id': job.id,
+                'trigger': str(job.trigger),
+                'next_run': job.next_run_time.isoformat() if job.next_run_time else None
+            }
+            for job in self.scheduler.get_jobs()
+        ]
+        live = {entry['id'] for entry in entries}
+        entries.extend(
+            {'id': job_id, 'trigger': trigger, 'next_run': next_run}
+            for job_id, (trigger, next_run) in self._restored_runs.copy().items()
+            if job_id not in live
+        )
+        data = orjson.dumps(entries) if orjson else json.dumps(entries).encode()
+        
+        tmp_path = f"{self.snapshot_path}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, self.snapshot_path)
+        except OSError as e:
+            logger.error(f"Failed to write job snapshot {self.snapshot_path}: {e}")
+    
+    def _snapshot_loop(self):
+        """Snapshot the in-memory job store every SNAPSHOT_INTERVAL_S until stopped."""
+        while not self._snapshot_stop.wait(SNAPSHOT_INTERVAL_S):
+            self._write_snapshot()
+    
+    def _index_job(self, aps_job):
+        """Record an APScheduler job in the job index."""
+        with self._job_index_lock:
+            self._job_index[aps_job.id] = aps_job
+            self._has_scheduled = True
+    
+    def _on_job_removed(self, event):
+        """Keep the job index in sync with removals made by APScheduler."""
+        with self._job_index_lock:
+            if event.code == _apscheduler().EVENT_ALL_JOBS_REMOVED:
+                self._job_index.clear()
+            else:
+                self._job_index.pop(event.job_id, None)
+    
     def _wrap_task(
         self,
         job_id: str,
         task_func: Callable,
         max_retries: int,
-        timeout_s: int
+        timeout_s: int,
+        executor: str = 'default'
     ) -> Callable:
         """
         Wrap task with retry logic, timeout, and outcome tracking.
         
         Returns:
             Wrapped function
+        
+        Raises:
+            ValueError: If executor is not one of TASK_EXECUTORS
         """
+        if executor not in TASK_EXECUTORS:
+            raise ValueError(
+                f"Unknown executor {executor!r}; expected one of {TASK_EXECUTORS}"
+            )
+        
+        from ..autonomy import GuardrailViolation, BudgetExceeded
+        
+        # Bound once here rather than looked up on self for every run
+        monotonic = time.monotonic
+        update_state = self.scheduler_engine.update_job_state
+        record_result = self._record_result
+        log_outcome = self._log_outcome
+        run_with_timeout = self._run_with_timeout
+        guardrails = self.guardrail_enforcer if self.enable_guardrails else None
+        budget_template = self._budget_template if self.enable_guardrails else None
+        record_outcome = (
+            self.anomaly_detector.record_job_outcome if self.anomaly_detector else None
+        )
+        
         @exponential_backoff_retry(
             max_attempts=max_retries,
             base_delay=1.0,
@@ -365,20 +810,15 @@ class AutonomousExecutor:
             )
         )
         def wrapped():
-            import signal
-            import time
-            
-            start_time = time.time()
+            start_time = monotonic()
             
             # Phase 3 M6: Check guardrails before execution
-            if self.enable_guardrails and self.guardrail_enforcer:
+            if guardrails:
                 try:
                     # Check safe-mode
-                    if self.guardrail_enforcer.is_safe_mode_active():
+                    if guardrails.is_safe_mode_active():
                         logger.warning(f"Job {job_id} skipped: safe-mode active")
-                        self.scheduler_engine.update_job_state(
-                            job_id, 'skipped', error='safe_mode_active'
-                        )
+                        update_state(job_id, 'skipped', error='safe_mode_active')
                         return None
                     
                     # Check confidence and budgets
@@ -391,7 +831,7 @@ class AutonomousExecutor:
                         'time_minutes': timeout_s / 60
                     }
                     
-                    allowed, reason = self.guardrail_enforcer.check_all(
+                    allowed, reason = guardrails.check_all(
                         confidence=estimated_confidence,
                         estimated_resources=estimated_resources,
                         task=job_id
@@ -404,37 +844,23 @@ class AutonomousExecutor:
                 
                 except GuardrailViolation as e:
                     logger.error(f"Job {job_id} rejected by guardrails: {e}")
-                    self.scheduler_engine.update_job_state(
-                        job_id, 'rejected', error=str(e)
-                    )
-                    if self.anomaly_detector:
-                        self.anomaly_detector.record_job_outcome(False, job_id)
+                    update_state(job_id, 'rejected', error=str(e))
+                    if record_outcome:
+                        record_outcome(False, job_id)
                     return None
             
-            # Update job state
-            self.scheduler_engine.update_job_state(job_id, 'running')
+            # Update job state (in memory; the outcome transition persists it)
+            update_state(job_id, 'running', persist=False)
             
             # Phase 3 M6: Start budget tracking
             budget_tracker = None
-            if self.enable_guardrails and self.guardrail_enforcer:
-                budget_tracker = BudgetTracker.from_config(
-                    self.guardrail_enforcer.config["budgets"]
-                )
+            if budget_template:
+                budget_tracker = budget_template.clone_reset()
                 budget_tracker.start()
             
-            # Set timeout
-            def timeout_handler(signum, frame):
-                raise TimeoutError(f"Job {job_id} exceeded {timeout_s}s timeout")
-            
-            signal.signal(signal.SIGALRM, timeout_handler)
-            signal.alarm(timeout_s)
-            
             try:
                 # Execute task
-                result = task_func()
-                
-                # Cancel timeout
-                signal.alarm(0)
+                result = run_with_timeout(job_id, task_func, timeout_s, executor)
                 
                 # Phase 3 M6: Check budgets during execution
                 if budget_tracker:
@@ -442,12 +868,10 @@ class AutonomousExecutor:
                         budget_tracker.check()
                     except BudgetExceeded as e:
                         logger.error(f"Job {job_id} exceeded budget: {e}")
-                        if self.anomaly_detector:
-                            self.anomaly_detector.record_job_outcome(False, job_id)
                         raise
                 
                 # Calculate execution time
-                execution_time = time.time() - start_time
+                execution_time = monotonic() - start_time
                 
                 # Phase 3 M6: Stop budget tracking
                 resource_usage = None
@@ -455,28 +879,21 @@ class AutonomousExecutor:
                     resource_usage = budget_tracker.stop()
                     logger.info(f"Job {job_id} resource usage: {resource_usage}")
                 
-                # Log outcome
-                self._log_outcome(
-                    JobResult(
-                        job_id=job_id,
-                        success=True,
-                        output=str(result) if result else None,
-                        execution_time_s=execution_time
-                    )
+                # Anomaly tracking and job state are recorded here; only the
+                # memory log entry is left to the outcome thread
+                outcome = JobResult(
+                    job_id=job_id,
+                    success=True,
+                    output=str(result) if result else None,
+                    execution_time_s=execution_time
                 )
-                
-                # Phase 3 M6: Record successful outcome
-                if self.anomaly_detector:
-                    self.anomaly_detector.record_job_outcome(True, job_id)
-                
-                # Update job state
-                self.scheduler_engine.update_job_state(job_id, 'completed')
+                record_result(outcome)
+                log_outcome(outcome)
                 
                 return result
             
             except Exception as e:
-                signal.alarm(0)
-                execution_time = time.time() - start_time
+                execution_time = monotonic() - start_time
                 
                 # Phase 3 M6: Stop budget tracking on failure
                 if budget_tracker:
@@ -485,67 +902,147 @@ class AutonomousExecutor:
                     except Exception:
                         pass  # Budget tracking failed, but we're already handling an error
                 
-                # Log failure
-                self._log_outcome(
-                    JobResult(
-                        job_id=job_id,
-                        success=False,
-                        error=str(e),
-                        execution_time_s=execution_time
-                    )
-                )
-                
-                # Phase 3 M6: Record failure and check for anomalies
-                if self.anomaly_detector:
-                    try:
-                        self.anomaly_detector.record_job_outcome(False, job_id)
-                    except Exception as anomaly_exc:
-                        # Anomaly detected (e.g., repeated failures)
-                        logger.critical(f"ANOMALY DETECTED: {anomaly_exc}")
-                        
-                        # Enter safe-mode
-                        if self.guardrail_enforcer:
-                            self.guardrail_enforcer.enter_safe_mode(
-                                f"Anomaly: {anomaly_exc}"
-                            )
-                        
-                        # Trigger recovery
-                        if self.recovery_executor:
-                            self.recovery_executor.execute_alert_user(
-                                f"Job {job_id} triggered anomaly: {anomaly_exc}",
-                                severity="critical"
-                            )
-                
-                # Update job state
-                self.scheduler_engine.update_job_state(
-                    job_id, 'failed', error=str(e)
+                # Record failure before any retry starts, so a retry sees the
+                # failed state and any safe-mode entry it triggered
+                outcome = JobResult(
+                    job_id=job_id,
+                    success=False,
+                    error=str(e),
+                    execution_time_s=execution_time
                 )
+                record_result(outcome)
+                log_outcome(outcome)
                 
                 raise
         
         return wrapped
     
+    def _run_with_timeout(
+        self,
+        job_id: str,
+        task_func: Callable,
+        timeout_s: int,
+        executor: str = 'default'
+    ) -> Any:
+        """
+        Run a task body, raising TimeoutError if it exceeds timeout_s.
+        
+        APScheduler runs jobs in worker threads, where SIGALRM cannot be used,
+        so the body runs in a separate pool and is waited on with a timeout.
+        A timed-out body cannot be interrupted; it keeps its pool worker until
+        it returns, but the job is failed and its scheduler worker is freed.
+        Guardrails, state and outcome tracking stay in the scheduler thread
+        either way; only task_func itself runs in the process pool.
+        """
+        with self._task_pool_lock:
+            pool = self._task_pools.get(executor)
+            if pool is None:
+                if executor == 'processpool':
+                    pool = futures.ProcessPoolExecutor(max_workers=self.max_workers)
+                else:
+                    pool = futures.ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="job-task"
+                    )
+                self._task_pools[executor] = pool
+        
+        future = pool.submit(task_func)
+        try:
+            return future.result(timeout=timeout_s)
+        except futures.TimeoutError:
+            future.cancel()
+            raise TimeoutError(f"Job {job_id} exceeded {timeout_s}s timeout") from None
+    
     def _on_retry(self, job_id: str, attempt: int, exc: Exception, delay: float):
         """Callback for retry attempts."""
         logger.warning(
             f"Job {job_id} retry {attempt} after {delay:.2f}s: {exc}"
         )
         
-        # Update retry count
+        # Update retry count (persisted with the attempt's outcome)
         job = self.scheduler_engine.get_job(job_id)
         if job:
             job.retries = attempt
-            self.scheduler_engine._persist_job(job)
+    
+    def _record_result(self, result: JobResult):
+        """
+        Feed a finished job's outcome to the anomaly detector and move the
+        job to its final state.
+        
+        Runs in the job's worker thread. Errors are logged rather than
+        raised, so they never change the job's own outcome.
+        """
+        try:
+            self._record_anomaly_outcome(result)
+        except Exception as e:
+            logger.error(
+                f"Failed to handle anomaly for job {result.job_id}: {e}", exc_info=True
+            )
+        
+        try:
+            if result.success:
+                self.scheduler_engine.update_job_state(result.job_id, 'completed')
+            else:
+                self.scheduler_engine.update_job_state(
+                    result.job_id, 'failed', error=result.error
+                )
+        except Exception as e:
+            logger.error(
+                f"Failed to update state of job {result.job_id}: {e}", exc_info=True
+            )
     
     def _log_outcome(self, result: JobResult):
-        """Log job outcome to memory (Phase 3 M2 integration)."""
+        """Queue a finished job's outcome for the memory log (Phase 3 M2 integration)."""
+        self._outcomes.put((result, iso_now_z()))
+        
+        with self._outcome_lock:
+            if self._outcome_thread is None or not self._outcome_thread.is_alive():
+                self._outcome_thread = threading.Thread(
+                    target=self._outcome_loop, name="outcome-writer", daemon=True
+                )
+                self._outcome_thread.start()
+        
+        logger.info(f"Queued outcome for job {result.job_id}: success={result.success}")
+    
+    def _outcome_loop(self):
+        """Append queued outcomes to memory in batches until flushed."""
         try:
-            # Import here to avoid circular dependency
-            from ..memory.writer import MemoryWriter
+            writer = _get_memory_writer()
+        except Exception as e:
+            logger.error(f"Failed to open memory writer for outcomes: {e}")
+            writer = None
+        
+        done = False
+        while not done:
+            item = self._outcomes.get()
+            if item is None:
+                break
             
-            writer = MemoryWriter()
+            batch = [item]
+            deadline = time.monotonic() + OUTCOME_FLUSH_S
+            while len(batch) < OUTCOME_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._outcomes.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    done = True
+                    break
+                batch.append(item)
             
-            outcome_entry = {
+            self._write_outcomes(batch, writer)
+    
+    def _write_outcomes(self, batch: List[tuple], writer):
+        """
+        Append a batch of (JobResult, timestamp) outcomes to the memory log.
+        
+        Write errors are logged, so they never stop the outcome thread.
+        """
+        entries = []
+        for result, ts in batch:
+            entries.append({
                 'job_id': result.job_id,
                 'success': result.success,
                 'output': result.output,
@@ -553,24 +1050,57 @@ class AutonomousExecutor:
                 'confidence': result.confidence,
                 'execution_time_s': result.execution_time_s,
                 'retry_count': result.retry_count,
-                'ts': datetime.now(timezone.utc).isoformat() + 'Z'
-            }
-            
-            writer.write_action_outcome(outcome_entry)
-            logger.info(f"Logged outcome for job {result.job_id}: success={result.success}")
+                'ts': ts
+            })
         
+        try:
+            written = writer is not None and writer.write_action_outcomes(entries)
         except Exception as e:
-            logger.error(f"Failed to log outcome for {result.job_id}: {e}")
+            logger.error(f"Failed to write job outcomes: {e}", exc_info=True)
+            written = False
+        if not written:
+            logger.error(f"Failed to log {len(entries)} job outcomes")
+    
+    def _record_anomaly_outcome(self, result: JobResult):
+        """Feed an outcome to the anomaly detector (Phase 3 M6)."""
+        if not self.anomaly_detector:
+            return
+        
+        try:
+            self.anomaly_detector.record_job_outcome(result.success, result.job_id)
+        except Exception as anomaly_exc:
+            # Anomaly detected (e.g., repeated failures)
+            logger.critical(f"ANOMALY DETECTED: {anomaly_exc}")
+            
+            # Enter safe-mode
+            if self.guardrail_enforcer:
+                self.guardrail_enforcer.enter_safe_mode(f"Anomaly: {anomaly_exc}")
+            
+            # Trigger recovery
+            if self.recovery_executor:
+                self.recovery_executor.execute_alert_user(
+                    f"Job {result.job_id} triggered anomaly: {anomaly_exc}",
+                    severity="critical"
+                )
+    
+    def flush_outcomes(self):
+        """Write all queued outcomes and stop the outcome thread."""
+        with self._outcome_lock:
+            if self._outcome_thread is not None:
+                self._outcomes.put(None)
+                self._outcome_thread.join()
+                self._outcome_thread = None
     
     def get_status(self) -> Dict[str, Any]:
         """Get executor status (Phase 3 M6: includes guardrail status)."""
+        counts = self.scheduler_engine.count_by_state()
         status = {
             'running': self._running,
             'max_workers': self.max_workers,
-            'scheduled_jobs': len(self.scheduler.get_jobs()) if self._running else 0,
-            'pending_jobs': len(self.scheduler_engine.list_jobs('pending')),
-            'completed_jobs': len(self.scheduler_engine.list_jobs('completed')),
-            'failed_jobs': len(self.scheduler_engine.list_jobs('failed')),
+            'scheduled_jobs': len(self._job_index) if self._running else 0,
+            'pending_jobs': counts.get('pending', 0),
+            'completed_jobs': counts.get('completed', 0),
+            'failed_jobs': counts.get('failed', 0),
             'guardrails_enabled': self.enable_guardrails
         }
         
@@ -8,10 +8,12 @@ from .system_tools import (
     SYSTEM_TOOLS,
     execute_tool,
     get_tool_schemas,
+    get_tool_schemas_json,
 )
 
 __all__ = [
     'SYSTEM_TOOLS',
     'execute_tool',
     'get_tool_schemas',
+    'get_tool_schemas_json',
 ]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 from typing import Any, Dict, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from ..policy.loader import load_policy
 from ..policy.engine import decide
 from ..obs.audit import write_audit
@@ -19,6 +19,10 @@ class ToolRequest(BaseModel):
 
 
 class ToolResponse(BaseModel):
+    # Responses are built internally from trusted values; hot paths use
+    # ToolResponse.model_construct() to skip validation
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     request_id: str
     ok: bool
     error: Optional[str] = None
@@ -32,7 +36,7 @@ class BaseTool:
     side_effects: bool = False
 
     def execute(self, req: ToolRequest) -> ToolResponse:
-        return ToolResponse(request_id=req.request_id, ok=False, error="NotImplemented", outputs={})
+        return ToolResponse.model_construct(request_id=req.request_id, ok=False, error="NotImplemented", outputs={})
 
     # Centralized policy enforcement for side-effecting apply paths
     def _policy_check(self, req: ToolRequest) -> tuple[bool, Optional[ToolResponse]]:
@@ -48,10 +52,10 @@ class BaseTool:
             dec = decide(pol, self.name, is_apply=True, ctx={"inputs": req.inputs})
             if not dec.allow:
                 write_audit(tool=self.name, mode="apply", request_id=req.request_id, ok=False, summary=dec.reason)
-                return False, ToolResponse(request_id=req.request_id, ok=False, error=dec.reason, outputs={"diff": "", "applied": False})
+                return False, ToolResponse.model_construct(request_id=req.request_id, ok=False, error=dec.reason, outputs={"diff": "", "applied": False})
         except Exception as e:
             # Fail-safe: deny on policy evaluation errors
             msg = f"policy error: {e}"
             write_audit(tool=self.name, mode="apply", request_id=req.request_id, ok=False, summary=msg)
-            return False, ToolResponse(request_id=req.request_id, ok=False, error=msg, outputs={"diff": "", "applied": False})
+            return False, ToolResponse.model_construct(request_id=req.request_id, ok=False, error=msg, outputs={"diff": "", "applied": False})
         return True, None
@@ -1,8 +1,72 @@
 from __future__ import annotations
 import os
-from typing import Any, Dict
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
 from .base import BaseTool, ToolRequest, ToolResponse
 
+# sysfs sensor files hold a single short value (e.g. b"42000\n")
+_SENSOR_READ_BYTES = 64
+
+# Hardware updates sensors at ~1 Hz; reads within this window share one
+# file read (callers can pass inputs["max_age_s"], 0 to force a fresh read)
+DEFAULT_MAX_AGE_S = 0.5
+
+# sensor_path -> (monotonic read time, raw bytes)
+_SENSOR_CACHE: Dict[str, Tuple[float, bytes]] = {}
+_SENSOR_CACHE_LOCK = threading.Lock()
+
+# Shared pool for batched reads (slow hwmon drivers block in the kernel)
+_BATCH_WORKERS = 8
+_batch_pool: Optional[ThreadPoolExecutor] = None
+_batch_pool_lock = threading.Lock()
+
+
+def _read_raw(path: str, max_age_s: float) -> bytes:
+    """Read a sensor file, reusing a read younger than max_age_s."""
+    now = time.monotonic()
+    if max_age_s > 0:
+        with _SENSOR_CACHE_LOCK:
+            entry = _SENSOR_CACHE.get(path)
+        if entry and now - entry[0] < max_age_s:
+            return entry[1]
+    # Raw fd read: no buffered text wrapper or decoding; a missing file
+    # surfaces from open() instead of a separate exists() stat
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        raw = os.read(fd, _SENSOR_READ_BYTES).strip()
+    finally:
+        os.close(fd)
+    with _SENSOR_CACHE_LOCK:
+        _SENSOR_CACHE[path] = (now, raw)
+    return raw
+
+
+def _parse_value(raw: bytes, metric: str) -> Any:
+    # hwmon values are integer strings; int() skips the float parse.
+    # Temps are often millidegrees C
+    try:
+        val = int(raw)
+        if metric == "temp" and val > 1000:
+            return val / 1000.0
+        return val
+    except ValueError:
+        pass
+    try:
+        return float(raw)
+    except ValueError:
+        return raw.decode("utf-8", errors="replace")
+
+
+def _get_batch_pool() -> ThreadPoolExecutor:
+    global _batch_pool
+    with _batch_pool_lock:
+        if _batch_pool is None:
+            _batch_pool = ThreadPoolExecutor(max_workers=_BATCH_WORKERS, thread_name_prefix="sensor-read")
+        return _batch_pool
+
+
 class ReadSensor(BaseTool):
     name = "read_sensor"
     side_effects = False
@@ -10,18 +74,60 @@ class ReadSensor(BaseTool):
     def execute(self, req: ToolRequest) -> ToolResponse:
         metric = req.inputs.get("metric", "temp")
         path = req.inputs.get("sensor_path")
-        if not path or not os.path.exists(path):
-            return ToolResponse(request_id=req.request_id, ok=False, error="sensor_path not found", outputs={})
+        if not path:
+            return ToolResponse.model_construct(request_id=req.request_id, ok=False, error="sensor_path not found", outputs={})
         try:
-            with open(path, "r") as f:
-                raw = f.read().strip()
-            # hwmon temps are often millidegrees C
             try:
-                val = float(raw)
-                if metric == "temp" and val > 1000:
-                    val = val / 1000.0
-            except ValueError:
-                val = raw
-            return ToolResponse(request_id=req.request_id, ok=True, outputs={"value": val, "metric": metric})
+                raw = _read_raw(path, float(req.inputs.get("max_age_s", DEFAULT_MAX_AGE_S)))
+            except FileNotFoundError:
+                return ToolResponse.model_construct(request_id=req.request_id, ok=False, error="sensor_path not found", outputs={})
+            val = _parse_value(raw, metric)
+            return ToolResponse.model_construct(request_id=req.request_id, ok=True, outputs={"value": val, "metric": metric})
         except Exception as e:
-            return ToolResponse(request_id=req.request_id, ok=False, error=str(e), outputs={})
+            return ToolResponse.model_construct(request_id=req.request_id, ok=False, error=str(e), outputs={})
+
+
+class ReadSensorsBatch(BaseTool):
+    """
+    Read many sensor files in one tool call.
+
+    inputs: sensor_paths (list), metric, max_age_s (as for read_sensor).
+    outputs: values {path: value}, errors {path: message}, metric.
+    Per-path failures are reported in errors; the call itself only fails
+    when no paths are given.
+    """
+    name = "read_sensors_batch"
+    side_effects = False
+
+    def execute(self, req: ToolRequest) -> ToolResponse:
+        metric = req.inputs.get("metric", "temp")
+        paths = list(dict.fromkeys(req.inputs.get("sensor_paths") or []))
+        if not paths:
+            return ToolResponse.model_construct(request_id=req.request_id, ok=False, error="sensor_paths is empty", outputs={})
+        max_age_s = float(req.inputs.get("max_age_s", DEFAULT_MAX_AGE_S))
+
+        def read_one(path: str) -> Tuple[Optional[bytes], Optional[str]]:
+            try:
+                return _read_raw(path, max_age_s), None
+            except FileNotFoundError:
+                return None, "sensor_path not found"
+            except Exception as e:
+                return None, str(e)
+
+        if len(paths) == 1:
+            results = [read_one(paths[0])]
+        else:
+            results = list(_get_batch_pool().map(read_one, paths))
+
+        values: Dict[str, Any] = {}
+        errors: Dict[str, str] = {}
+        for path, (raw, error) in zip(paths, results):
+            if error is None:
+                values[path] = _parse_value(raw, metric)
+            else:
+                errors[path] = error
+        return ToolResponse.model_construct(
+            request_id=req.request_id,
+            ok=True,
+            outputs={"values": values, "errors": errors, "metric": metric},
+        )
@@ -5,18 +5,27 @@ These tools allow the LLM to query system state in real-time.
 All tools are read-only and safe to execute without user approval.
 """
 
+import atexit
+import functools
+import json
+import math
+import os
+import pwd
+import re
 import subprocess
 import shutil
 import logging
+import threading
+import time
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 
 logger = logging.getLogger('halbert.tools')
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ToolResult:
-    """Result from tool execution."""
+    """Result from tool execution (immutable; cached results are shared)."""
     success: bool
     data: Any
     error: Optional[str] = None
@@ -45,13 +54,13 @@ SYSTEM_TOOLS = [
         "type": "function",
         "function": {
             "name": "get_service_status",
-            "description": "Get the status of a systemd service. Use this when the user asks if a service is running, or wants to check service health.",
+            "description": "Get the status of one or more systemd services. Use this when the user asks if a service is running, or wants to check service health.",
             "parameters": {
                 "type": "object",
                 "properties": {
                     "service_name": {
                         "type": "string",
-                        "description": "Name of the service (e.g., 'docker', 'nginx', 'ssh')"
+                        "description": "Name of the service (e.g., 'docker', 'nginx', 'ssh'); separate several with commas to check them in one call"
                     }
                 },
                 "required": ["service_name"]
@@ -148,282 +157,519 @@ SYSTEM_TOOLS = [
     },
 ]
 
+# SYSTEM_TOOLS serialized once; the schemas never change at runtime
+_SYSTEM_TOOLS_JSON = json.dumps(SYSTEM_TOOLS, separators=(",", ":")).encode("utf-8")
 
-def _run_command(cmd: List[str], timeout: int = 10) -> tuple:
-    """Run a command and return (success, stdout, stderr)."""
+
+# Read-only systemd/network queries are often repeated within one chat turn,
+# so their successful results are reused for this long
+TOOL_CACHE_TTL_S = 1.5
+_TTL_CACHE_MAX = 128
+
+# (handler name, args, kwargs, epoch) -> (monotonic time, ToolResult)
+_TTL_CACHE: Dict[tuple, tuple] = {}
+_cache_epoch = 0
+
+
+def invalidate_tool_cache() -> None:
+    """Drop cached tool results (e.g. after a config change is applied)."""
+    global _cache_epoch
+    _cache_epoch += 1
+    _TTL_CACHE.clear()
+
+
+def _ttl_cached(func):
+    """Reuse a handler's successful ToolResult for TOOL_CACHE_TTL_S."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = (func.__name__, args, tuple(sorted(kwargs.items())), _cache_epoch)
+        now = time.monotonic()
+        hit = _TTL_CACHE.get(key)
+        if hit is not None and now - hit[0] < TOOL_CACHE_TTL_S:
+            return hit[1]
+
+        result = func(*args, **kwargs)
+        if result.success:
+            if len(_TTL_CACHE) >= _TTL_CACHE_MAX:
+                for stale in [k for k, (ts, _) in _TTL_CACHE.items() if now - ts >= TOOL_CACHE_TTL_S]:
+                    _TTL_CACHE.pop(stale, None)
+            _TTL_CACHE[key] = (now, result)
+        return result
+    return wrapper
+
+
+def _run_command(cmd: List[str], timeout: int = 10, text: bool = True) -> tuple:
+    """
+    Run a command and return (success, stdout, stderr).
+
+    Output is captured as bytes and decoded once as UTF-8 (invalid bytes
+    replaced) rather than through a locale-dependent text-mode pipe. With
+    text=False, stdout and stderr are returned as bytes.
+    """
     try:
         result = subprocess.run(
             cmd,
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             timeout=timeout
         )
-        return result.returncode == 0, result.stdout, result.stderr
     except subprocess.TimeoutExpired:
-        return False, "", "Command timed out"
+        return False, "" if text else b"", "Command timed out"
     except Exception as e:
-        return False, "", str(e)
+        return False, "" if text else b"", str(e)
+
+    if not text:
+        return result.returncode == 0, result.stdout, result.stderr
+    return (
+        result.returncode == 0,
+        result.stdout.decode('utf-8', 'replace'),
+        result.stderr.decode('utf-8', 'replace')
+    )
+
+
+# Octal escapes used by /proc/mounts for space, tab, newline and backslash
+_MOUNT_ESCAPE = re.compile(r'\\([0-7]{3})')
+
+
+def _human_size(num_bytes: int, unit_suffix: str = "", round_up: bool = True) -> str:
+    """
+    Format a byte count like `df -h` (powers of 1024, rounded up).
+
+    unit_suffix="i" with round_up=False matches `free -h` (Ki, Mi, Gi, ...,
+    rounded to nearest).
+    """
+    rounding = math.ceil if round_up else round
+    value = float(num_bytes)
+    for unit in ("", "K", "M", "G", "T", "P"):
+        if value < 1024 or unit == "P":
+            break
+        value /= 1024
+    if not unit:
+        return f"{num_bytes}B" if unit_suffix else str(num_bytes)
+    unit += unit_suffix
+    if value < 10:
+        return f"{rounding(value * 10) / 10:.1f}{unit}"
+    return f"{rounding(value)}{unit}"
+
+
+def _list_filesystems() -> List[Dict[str, str]]:
+    """
+    Usage of every mounted filesystem, in the same shape `df -h` gave.
+
+    Like df, pseudo filesystems (zero blocks: proc, sysfs, cgroup, ...) and
+    repeat mounts of the same device are left out.
+    """
+    filesystems = []
+    seen_devices = set()
+    with open('/proc/self/mounts', 'r') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) < 3:
+                continue
+            mount = _MOUNT_ESCAPE.sub(lambda m: chr(int(m.group(1), 8)), parts[1])
+            try:
+                st = os.statvfs(mount)
+                device = os.stat(mount).st_dev
+            except OSError:
+                continue
+            if st.f_blocks == 0 or device in seen_devices:
+                continue
+            seen_devices.add(device)
+
+            used = (st.f_blocks - st.f_bfree) * st.f_frsize
+            available = st.f_bavail * st.f_frsize
+            percent = math.ceil(used * 100 / (used + available)) if used + available else 0
+            filesystems.append({
+                "mount": mount,
+                "size": _human_size(st.f_blocks * st.f_frsize),
+                "used": _human_size(used),
+                "available": _human_size(available),
+                "percent": f"{percent}%"
+            })
+    return filesystems
 
 
 def check_disk_space(path: str = "") -> ToolResult:
     """Check disk space for a path or all filesystems."""
-    try:
-        if path:
-            # Check specific path
-            usage = shutil.disk_usage(path)
-            total_gb = usage.total / (1024**3)
-            used_gb = usage.used / (1024**3)
-            free_gb = usage.free / (1024**3)
-            percent = (usage.used / usage.total) * 100
-            
-            return ToolResult(
-                success=True,
-                data={
-                    "path": path,
-                    "total_gb": round(total_gb, 2),
-                    "used_gb": round(used_gb, 2),
-                    "free_gb": round(free_gb, 2),
-                    "percent_used": round(percent, 1)
-                }
-            )
-        else:
-            # All filesystems via df
-            success, stdout, stderr = _run_command(["df", "-h", "--output=target,size,used,avail,pcent"])
-            if success:
-                lines = stdout.strip().split('\n')
-                filesystems = []
-                for line in lines[1:]:  # Skip header
-                    parts = line.split()
-                    if len(parts) >= 5:
-                        filesystems.append({
-                            "mount": parts[0],
-                            "size": parts[1],
-                            "used": parts[2],
-                            "available": parts[3],
-                            "percent": parts[4]
-                        })
-                return ToolResult(success=True, data={"filesystems": filesystems})
-            else:
-                return ToolResult(success=False, data=None, error=stderr)
-    except Exception as e:
-        return ToolResult(success=False, data=None, error=str(e))
+    if path:
+        # Check specific path
+        usage = shutil.disk_usage(path)
+        total_gb = usage.total / (1024**3)
+        used_gb = usage.used / (1024**3)
+        free_gb = usage.free / (1024**3)
+        percent = (usage.used / usage.total) * 100
+        
+        return ToolResult(
+            success=True,
+            data={
+                "path": path,
+                "total_gb": round(total_gb, 2),
+                "used_gb": round(used_gb, 2),
+                "free_gb": round(free_gb, 2),
+                "percent_used": round(percent, 1)
+            }
+        )
+    else:
+        # All filesystems via /proc/self/mounts + statvfs (no df fork)
+        return ToolResult(success=True, data={"filesystems": _list_filesystems()})
+
+
+def _service_status(service_name: str, props: Dict[str, str]) -> Dict[str, str]:
+    return {
+        "service": service_name,
+        "active": props.get("ActiveState", "unknown"),
+        "sub_state": props.get("SubState", "unknown"),
+        "load_state": props.get("LoadState", "unknown"),
+        "pid": props.get("MainPID", "0"),
+        "started": props.get("ExecMainStartTimestamp", "")
+    }
 
 
+@_ttl_cached
 def get_service_status(service_name: str) -> ToolResult:
-    """Get systemd service status."""
-    try:
-        success, stdout, stderr = _run_command([
-            "systemctl", "show", service_name,
-            "--property=ActiveState,SubState,LoadState,MainPID,ExecMainStartTimestamp"
-        ])
-        
-        if success:
+    """
+    Get systemd service status.
+
+    service_name may list several services separated by commas; they are
+    queried with a single `systemctl show` and returned under "services".
+    """
+    names = [name.strip() for name in service_name.split(',') if name.strip()]
+    if not names:
+        return ToolResult(success=False, data=None, error="service_name required")
+
+    success, stdout, stderr = _run_command([
+        "systemctl", "show", *names,
+        "--property=ActiveState,SubState,LoadState,MainPID,ExecMainStartTimestamp"
+    ])
+    
+    if success:
+        # One block of KEY=VALUE lines per unit, in argument order,
+        # separated by blank lines
+        blocks = []
+        for block in stdout.strip().split('\n\n'):
             props = {}
-            for line in stdout.strip().split('\n'):
+            for line in block.splitlines():
                 if '=' in line:
                     key, value = line.split('=', 1)
                     props[key] = value
-            
-            return ToolResult(
-                success=True,
-                data={
-                    "service": service_name,
-                    "active": props.get("ActiveState", "unknown"),
-                    "sub_state": props.get("SubState", "unknown"),
-                    "load_state": props.get("LoadState", "unknown"),
-                    "pid": props.get("MainPID", "0"),
-                    "started": props.get("ExecMainStartTimestamp", "")
-                }
-            )
-        else:
-            return ToolResult(success=False, data=None, error=f"Service not found: {service_name}")
-    except Exception as e:
-        return ToolResult(success=False, data=None, error=str(e))
+            blocks.append(props)
+        
+        if len(names) == 1:
+            return ToolResult(success=True, data=_service_status(names[0], blocks[0]))
+        return ToolResult(
+            success=True,
+            data={
+                "services": [
+                    _service_status(name, blocks[i] if i < len(blocks) else {})
+                    for i, name in enumerate(names)
+                ]
+            }
+        )
+    else:
+        return ToolResult(success=False, data=None, error=f"Service not found: {service_name}")
 
 
+@_ttl_cached
 def list_running_services(filter: str = "") -> ToolResult:
     """List running systemd services."""
-    try:
-        cmd = ["systemctl", "list-units", "--type=service", "--state=running", "--no-pager", "--plain"]
-        success, stdout, stderr = _run_command(cmd)
+    cmd = ["systemctl", "list-units", "--type=service", "--state=running", "--no-pager", "--plain"]
+    success, stdout, stderr = _run_command(cmd)
+    
+    if success:
+        flt = filter.lower() if filter else None
+        services = []
+        count = 0
+        for line in stdout.splitlines()[1:]:  # Skip header
+            # Only the first four columns are used; the description is left whole
+            parts = line.split(None, 4)
+            if len(parts) < 4 or not parts[0].endswith('.service'):
+                continue  # Legend/footer lines
+            name = parts[0][:-8]
+            if flt and flt not in name.lower():
+                continue
+            count += 1
+            if len(services) < 30:  # Limit to 30
+                services.append({
+                    "name": name,
+                    "load": parts[1],
+                    "active": parts[2],
+                    "sub": parts[3]
+                })
         
-        if success:
-            services = []
-            for line in stdout.strip().split('\n')[1:]:  # Skip header
-                parts = line.split()
-                if len(parts) >= 4:
-                    name = parts[0].replace('.service', '')
-                    if not filter or filter.lower() in name.lower():
-                        services.append({
-                            "name": name,
-                            "load": parts[1] if len(parts) > 1 else "",
-                            "active": parts[2] if len(parts) > 2 else "",
-                            "sub": parts[3] if len(parts) > 3 else ""
-                        })
-            
-            return ToolResult(
-                success=True,
-                data={"count": len(services), "services": services[:30]}  # Limit to 30
-            )
-        else:
-            return ToolResult(success=False, data=None, error=stderr)
-    except Exception as e:
-        return ToolResult(success=False, data=None, error=str(e))
+        return ToolResult(
+            success=True,
+            data={"count": count, "services": services}
+        )
+    else:
+        return ToolResult(success=False, data=None, error=stderr)
+
+
+_CLK_TCK = os.sysconf('SC_CLK_TCK') if hasattr(os, 'sysconf') else 100
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+# Descriptors for small /proc files read on every call (loadavg, meminfo,
+# uptime), opened once and re-read with pread; closed at exit
+_PROC_FDS: Dict[str, int] = {}
+_PROC_FDS_LOCK = threading.Lock()
+
+
+def _close_proc_fds() -> None:
+    with _PROC_FDS_LOCK:
+        for fd in _PROC_FDS.values():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        _PROC_FDS.clear()
+
+
+atexit.register(_close_proc_fds)
+
+
+def _read_proc(path: str) -> bytes:
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def _pread_proc(path: str, size: int = 4096) -> bytes:
+    """
+    Read a small, frequently polled /proc file through a cached descriptor.
+
+    procfs regenerates the content on every read at offset 0, so one fd
+    serves every call. Falls back to a plain read where pread is missing.
+    """
+    fd = _PROC_FDS.get(path)
+    if fd is None:
+        if not hasattr(os, 'pread'):
+            return _read_proc(path)
+        with _PROC_FDS_LOCK:
+            fd = _PROC_FDS.get(path)
+            if fd is None:
+                fd = _PROC_FDS[path] = os.open(path, os.O_RDONLY)
+    return os.pread(fd, size, 0)
+
+
+def _read_meminfo() -> Dict[str, int]:
+    """Parse /proc/meminfo into {field: kB}."""
+    meminfo = {}
+    for line in _pread_proc('/proc/meminfo', 16384).decode('ascii', 'replace').splitlines():
+        key, _, value = line.partition(':')
+        parts = value.split()
+        if parts:
+            meminfo[key] = int(parts[0])
+    return meminfo
+
+
+def _user_name(uid: int, cache: Dict[int, str]) -> str:
+    name = cache.get(uid)
+    if name is None:
+        try:
+            name = pwd.getpwuid(uid).pw_name
+        except KeyError:
+            name = str(uid)
+        cache[uid] = name
+    return name
 
 
 def check_process(process_name: str) -> ToolResult:
-    """Check if a process is running."""
-    try:
-        success, stdout, stderr = _run_command([
-            "ps", "aux"
-        ])
-        
-        if success:
-            processes = []
-            for line in stdout.strip().split('\n')[1:]:
-                if process_name.lower() in line.lower():
-                    parts = line.split(None, 10)
-                    if len(parts) >= 11:
-                        processes.append({
-                            "user": parts[0],
-                            "pid": parts[1],
-                            "cpu": parts[2],
-                            "mem": parts[3],
-                            "command": parts[10][:80]  # Truncate
-                        })
-            
-            return ToolResult(
-                success=True,
-                data={
-                    "process": process_name,
-                    "running": len(processes) > 0,
-                    "count": len(processes),
-                    "instances": processes[:10]  # Limit to 10
-                }
-            )
-        else:
-            return ToolResult(success=False, data=None, error=stderr)
-    except Exception as e:
-        return ToolResult(success=False, data=None, error=str(e))
+    """
+    Check if a process is running.
+
+    Walks /proc directly instead of forking `ps aux`. A process matches when
+    the name appears (case-insensitively) in its comm or command line; cpu
+    and mem are computed the way ps computes %CPU and %MEM.
+    """
+    needle = process_name.lower()
+    uptime = float(_pread_proc('/proc/uptime', 128).split()[0])
+    mem_total_kb = _read_meminfo().get('MemTotal', 0)
+
+    processes = []
+    count = 0
+    users: Dict[int, str] = {}
+    for entry in os.scandir('/proc'):
+        if not entry.name.isdigit():
+            continue
+        try:
+            comm = _read_proc(f'/proc/{entry.name}/comm').decode('utf-8', 'replace').strip()
+            cmdline = _read_proc(f'/proc/{entry.name}/cmdline')
+            command = cmdline.replace(b'\0', b' ').decode('utf-8', 'replace').strip()
+            if needle not in comm.lower() and needle not in command.lower():
+                continue
+            count += 1
+            if len(processes) >= 10:  # Limit to 10
+                continue
+
+            stat = _read_proc(f'/proc/{entry.name}/stat')
+            fields = stat[stat.rindex(b')') + 2:].split()
+            cpu_time = (int(fields[11]) + int(fields[12])) / _CLK_TCK
+            elapsed = uptime - int(fields[19]) / _CLK_TCK
+            rss_kb = int(fields[21]) * _PAGE_SIZE // 1024
+            uid = entry.stat().st_uid
+        except (OSError, ValueError, IndexError):
+            continue  # Exited while we looked, or not ours to read
+
+        processes.append({
+            "user": _user_name(uid, users),
+            "pid": entry.name,
+            "cpu": f"{cpu_time * 100 / elapsed:.1f}" if elapsed > 0 else "0.0",
+            "mem": f"{rss_kb * 100 / mem_total_kb:.1f}" if mem_total_kb else "0.0",
+            "command": (command or f"[{comm}]")[:80]  # Truncate
+        })
+
+    return ToolResult(
+        success=True,
+        data={
+            "process": process_name,
+            "running": count > 0,
+            "count": count,
+            "instances": processes
+        }
+    )
 
 
 def get_system_load() -> ToolResult:
     """Get system load and memory usage."""
-    try:
-        # Load average
-        with open('/proc/loadavg', 'r') as f:
-            load_parts = f.read().strip().split()
-            load_1, load_5, load_15 = load_parts[0], load_parts[1], load_parts[2]
-        
-        # Memory
-        success, stdout, stderr = _run_command(["free", "-h"])
-        mem_info = {}
-        if success:
-            lines = stdout.strip().split('\n')
-            if len(lines) >= 2:
-                parts = lines[1].split()
-                if len(parts) >= 4:
-                    mem_info = {
-                        "total": parts[1],
-                        "used": parts[2],
-                        "free": parts[3],
-                        "available": parts[6] if len(parts) > 6 else parts[3]
-                    }
-        
-        # CPU count
-        import os
-        cpu_count = os.cpu_count() or 1
-        
-        return ToolResult(
-            success=True,
-            data={
-                "load_1min": float(load_1),
-                "load_5min": float(load_5),
-                "load_15min": float(load_15),
-                "cpu_count": cpu_count,
-                "memory": mem_info
-            }
-        )
-    except Exception as e:
-        return ToolResult(success=False, data=None, error=str(e))
+    # Load average
+    load_parts = _pread_proc('/proc/loadavg', 128).split()
+    load_1, load_5, load_15 = load_parts[0], load_parts[1], load_parts[2]
+    
+    # Memory, from the same source `free -h` reads (values in kB)
+    meminfo = _read_meminfo()
+    mem_info = {}
+    if 'MemTotal' in meminfo:
+        total = meminfo['MemTotal']
+        free = meminfo.get('MemFree', 0)
+        available = meminfo.get('MemAvailable', free)
+        mem_info = {
+            "total": _human_size(total * 1024, "i", round_up=False),
+            "used": _human_size((total - available) * 1024, "i", round_up=False),
+            "free": _human_size(free * 1024, "i", round_up=False),
+            "available": _human_size(available * 1024, "i", round_up=False)
+        }
+    
+    # CPU count
+    cpu_count = os.cpu_count() or 1
+    
+    return ToolResult(
+        success=True,
+        data={
+            "load_1min": float(load_1),
+            "load_5min": float(load_5),
+            "load_15min": float(load_15),
+            "cpu_count": cpu_count,
+            "memory": mem_info
+        }
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _classify_log(log_path: str) -> tuple:
+    """
+    Classify a read_log_tail target as ("journal", True) or ("file", allowed).
+
+    Files are allowed only under /var/log, checked after normalizing the
+    path so "/var/log/../..." cannot escape it.
+    """
+    if log_path == "journalctl" or log_path.startswith("journal"):
+        return "journal", True
+    normalized = os.path.normpath(log_path)
+    return "file", normalized == "/var/log" or normalized.startswith("/var/log/")
+
+
+def _tail_lines(path: str, count: int, block_size: int = 8192) -> List[str]:
+    """
+    Last count lines of a file, read backwards from the end in blocks.
+
+    Only the tail of the file is read, however large the log is.
+    """
+    if count <= 0:
+        return []
+    with open(path, 'rb') as f:
+        pos = f.seek(0, os.SEEK_END)
+        data = b''
+        # count + 1 newlines guarantee the first kept line is complete
+        while pos > 0 and data.count(b'\n') <= count:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    return data.decode('utf-8', 'replace').splitlines()[-count:]
 
 
 def read_log_tail(log_path: str, lines: int = 20, filter: str = "") -> ToolResult:
     """Read last N lines from a log file."""
-    try:
-        lines = min(lines, 100)  # Cap at 100 lines
-        
-        if log_path == "journalctl" or log_path.startswith("journal"):
-            cmd = ["journalctl", "-n", str(lines), "--no-pager"]
-            if filter:
-                cmd.extend(["--grep", filter])
-        else:
-            # Validate path (only allow /var/log paths for security)
-            if not log_path.startswith('/var/log'):
-                return ToolResult(
-                    success=False,
-                    data=None,
-                    error="Only /var/log paths are allowed for security"
-                )
-            
-            if filter:
-                cmd = ["sh", "-c", f"tail -n {lines} {log_path} | grep -i '{filter}'"]
-            else:
-                cmd = ["tail", "-n", str(lines), log_path]
-        
+    lines = min(lines, 100)  # Cap at 100 lines
+    
+    kind, allowed = _classify_log(log_path)
+    if kind == "journal":
+        cmd = ["journalctl", "-n", str(lines), "--no-pager"]
+        if filter:
+            cmd.extend(["--grep", filter])
         success, stdout, stderr = _run_command(cmd, timeout=5)
-        
-        if success:
+        if not success:
+            return ToolResult(success=False, data=None, error=stderr or "Failed to read log")
+        log_lines = stdout.splitlines()
+    else:
+        # Validate path (only allow /var/log paths for security)
+        if not allowed:
             return ToolResult(
-                success=True,
-                data={
-                    "log": log_path,
-                    "lines": stdout.strip().split('\n') if stdout.strip() else []
-                }
+                success=False,
+                data=None,
+                error="Only /var/log paths are allowed for security"
             )
-        else:
-            return ToolResult(success=False, data=None, error=stderr or "Failed to read log")
-    except Exception as e:
-        return ToolResult(success=False, data=None, error=str(e))
+        
+        # Read the tail in-process (no tail/grep fork); the filter is a
+        # case-insensitive substring match, as grep -i did
+        log_lines = _tail_lines(log_path, lines)
+        if filter:
+            pattern = re.compile(re.escape(filter), re.IGNORECASE)
+            log_lines = [line for line in log_lines if pattern.search(line)]
+    
+    return ToolResult(
+        success=True,
+        data={
+            "log": log_path,
+            "lines": log_lines
+        }
+    )
 
 
+@_ttl_cached
 def get_network_info(interface: str = "") -> ToolResult:
     """Get network interface information."""
-    try:
+    if interface:
+        cmd = ["ip", "addr", "show", interface]
+    else:
+        cmd = ["ip", "-brief", "addr", "show"]
+    
+    success, stdout, stderr = _run_command(cmd)
+    
+    if success:
+        interfaces = []
         if interface:
-            cmd = ["ip", "addr", "show", interface]
+            # Parse full output for single interface
+            interfaces.append({
+                "name": interface,
+                "details": stdout.strip()[:500]  # Limit output
+            })
         else:
-            cmd = ["ip", "-brief", "addr", "show"]
-        
-        success, stdout, stderr = _run_command(cmd)
+            # Parse brief output
+            for line in stdout.splitlines():
+                parts = line.split()
+                if len(parts) >= 3:
+                    interfaces.append({
+                        "name": parts[0],
+                        "state": parts[1],
+                        "addresses": parts[2:]
+                    })
         
-        if success:
-            interfaces = []
-            if interface:
-                # Parse full output for single interface
-                interfaces.append({
-                    "name": interface,
-                    "details": stdout.strip()[:500]  # Limit output
-                })
-            else:
-                # Parse brief output
-                for line in stdout.strip().split('\n'):
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        interfaces.append({
-                            "name": parts[0],
-                            "state": parts[1],
-                            "addresses": parts[2:] if len(parts) > 2 else []
-                        })
-            
-            return ToolResult(
-                success=True,
-                data={"interfaces": interfaces}
-            )
-        else:
-            return ToolResult(success=False, data=None, error=stderr)
-    except Exception as e:
-        return ToolResult(success=False, data=None, error=str(e))
+        return ToolResult(
+            success=True,
+            data={"interfaces": interfaces}
+        )
+    else:
+        return ToolResult(success=False, data=None, error=stderr)
 
 
 # Tool execution dispatcher
@@ -454,7 +700,8 @@ def execute_tool(tool_name: str, arguments: Dict[str, Any]) -> ToolResult:
         logger.info(f"Tool {tool_name} result: success={result.success}")
         return result
     except Exception as e:
-        logger.error(f"Tool execution failed: {tool_name}: {e}")
+        # Single error boundary for every handler
+        logger.error(f"Tool execution failed: {tool_name}: {e}", exc_info=True)
         return ToolResult(
             success=False,
             data=None,
@@ -463,5 +710,10 @@ def execute_tool(tool_name: str, arguments: Dict[str, Any]) -> ToolResult:
 
 
 def get_tool_schemas() -> List[Dict[str, Any]]:
-    """Get tool schemas for LLM function calling."""
+    """Get tool schemas for LLM function calling (shared; do not mutate)."""
     return SYSTEM_TOOLS
+
+
+def get_tool_schemas_json() -> bytes:
+    """Get the tool schemas as compact, pre-serialized JSON bytes."""
+    return _SYSTEM_TOOLS_JSON
@@ -1,16 +1,53 @@
 from __future__ import annotations
 import configparser
 import difflib
+import functools
 import json
 import os
 import shutil
 from io import StringIO
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from .base import BaseTool, ToolRequest, ToolResponse
+from .system_tools import invalidate_tool_cache
 from ..obs.audit import write_audit
 import yaml  # type: ignore
 from ..obs.tracing import trace_call
 
+# libyaml C loader/dumper when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+@functools.lru_cache(maxsize=256)
+def _config_kind(path: str) -> Optional[str]:
+    """File type handled by WriteConfig: "yaml", "json", "ini" or None."""
+    lower = path.lower()
+    if lower.endswith((".yaml", ".yml")):
+        return "yaml"
+    if lower.endswith(".json"):
+        return "json"
+    if lower.endswith((".ini", ".conf", ".service", ".timer")):
+        return "ini"
+    return None
+
+
+def _can_replace(path: str) -> bool:
+    """
+    Whether path can be swapped for a new file: its directory is writable
+    and the file's owner and group can be given to the new file.
+    """
+    if not os.access(os.path.dirname(path) or ".", os.W_OK):
+        return False
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return True
+    euid = os.geteuid()
+    if euid == 0:
+        return True
+    return st.st_uid == euid and (st.st_gid == os.getegid() or st.st_gid in os.getgroups())
+
+
 class WriteConfig(BaseTool):
     name = "write_config"
     side_effects = True
@@ -50,18 +87,18 @@ class WriteConfig(BaseTool):
                     write_audit(tool=self.name, mode="dry_run", request_id=req.request_id, ok=True, summary=f"preview rollback for {path}", path=path)
                     return ToolResponse(request_id=req.request_id, ok=True, outputs=outputs)
                 # Apply rollback
-                with open(path, "w", encoding="utf-8") as f:
-                    f.write(after_txt)
+                self._write_atomic(path, after_txt)
                 write_audit(tool=self.name, mode="apply", request_id=req.request_id, ok=True, summary=f"rollback applied for {path}", path=path)
+                invalidate_tool_cache()
                 outputs["applied"] = True
                 return ToolResponse(request_id=req.request_id, ok=True, outputs=outputs)
 
-            lower = str(path).lower()
-            if lower.endswith((".yaml", ".yml")):
+            kind = _config_kind(str(path))
+            if kind == "yaml":
                 preview, applied = self._apply_yaml(path, changes, backup, apply=not (req.dry_run or not req.confirm))
-            elif lower.endswith(".json"):
+            elif kind == "json":
                 preview, applied = self._apply_json(path, changes, backup, apply=not (req.dry_run or not req.confirm))
-            elif lower.endswith((".ini", ".conf", ".service", ".timer")):
+            elif kind == "ini":
                 preview, applied = self._apply_ini(path, changes, backup, apply=not (req.dry_run or not req.confirm))
             else:
                 # Text fallback unsupported for apply in Phase 1
@@ -72,6 +109,8 @@ class WriteConfig(BaseTool):
 
             mode = "dry_run" if (req.dry_run or not req.confirm) else "apply"
             ok = True
+            if applied:
+                invalidate_tool_cache()
             summary = ("preview changes for " + path) if mode == "dry_run" else ("applied changes for " + path if applied else "no-op (already up to date) for " + path)
             write_audit(tool=self.name, mode=mode, request_id=req.request_id, ok=ok, summary=summary, path=path)
             return ToolResponse(request_id=req.request_id, ok=True, outputs={"diff": preview, "applied": applied})
@@ -81,53 +120,161 @@ class WriteConfig(BaseTool):
 
     # Helpers
     def _unified_diff(self, before: str, after: str, path: str) -> str:
+        # Identical text (e.g. rolling back to an unchanged backup) diffs to
+        # nothing; skip splitting both sides into line lists
+        if before == after:
+            return ""
         a = before.splitlines(keepends=True)
         b = after.splitlines(keepends=True)
         diff = difflib.unified_diff(a, b, fromfile=f"{path} (before)", tofile=f"{path} (after)")
         return "".join(diff)
 
+    def _write_atomic(self, path: str, text: str) -> None:
+        """
+        Replace path with text atomically (temp file, fdatasync, rename).
+
+        A crash leaves either the old or the new file, never a partial one.
+        The temp file gets the original file's mode and owner before any
+        contents are written. Where the file cannot be replaced without
+        changing its owner, or its directory is not writable, it is
+        rewritten in place instead. A symlinked path is written through:
+        its target is replaced, the link stays.
+        """
+        path = os.path.realpath(path)
+        if not _can_replace(path):
+            self._write_in_place(path, text)
+            return
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            st = None
+        # Unique name, created exclusively: never follows a planted link
+        tmp = f"{path}.tmp.{os.getpid()}.{os.urandom(4).hex()}"
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL,
+                     st.st_mode & 0o777 if st is not None else 0o666)
+        owned = True
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                if st is not None:
+                    os.fchmod(fd, st.st_mode & 0o7777)
+                    try:
+                        os.fchown(fd, st.st_uid, st.st_gid)
+                    except PermissionError:
+                        owned = False
+                if owned:
+                    f.write(text)
+                    f.flush()
+                    getattr(os, "fdatasync", os.fsync)(f.fileno())
+            if owned:
+                os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
+        if not owned:
+            os.remove(tmp)
+            self._write_in_place(path, text)
+
+    def _write_in_place(self, path: str, text: str) -> None:
+        """Overwrite path's existing file, keeping its inode, mode and owner."""
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            getattr(os, "fdatasync", os.fsync)(f.fileno())
+
+    def _backup(self, path: str) -> None:
+        """
+        Save path as <path>.bak.
+
+        A file that _write_atomic will replace (rather than rewrite in
+        place) is hard-linked, which keeps the old contents without copying
+        them. Otherwise, or where links are not possible, it is copied. For
+        a symlinked path the backup holds the target's contents and sits
+        next to the link, where rollback looks for it.
+        """
+        bak = f"{path}.bak"
+        real = os.path.realpath(path)
+        if not _can_replace(real):
+            shutil.copy2(path, bak)
+            return
+        tmp = f"{bak}.tmp.{os.getpid()}"
+        try:
+            os.link(real, tmp)
+            os.replace(tmp, bak)
+        except OSError:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            shutil.copy2(path, bak)
+
+    def _read_text(self, path: str) -> str:
+        """Current file text, or "" if it is missing or unreadable."""
+        try:
+            with open(path, "rb") as f:
+                return f.read().decode("utf-8", "replace")
+        except OSError:
+            return ""
+
     def _deep_merge(self, base: Any, changes: Any) -> Any:
-        if isinstance(base, dict) and isinstance(changes, dict):
-            out = dict(base)
-            for k, v in changes.items():
-                out[k] = self._deep_merge(base.get(k), v)
-            return out
-        return changes
+        if not (isinstance(base, dict) and isinstance(changes, dict)):
+            return changes
+        # Iterative walk; only dicts on a changed path are copied, so base is
+        # never mutated
+        out = dict(base)
+        stack = [(out, changes)]
+        while stack:
+            dst, src = stack.pop()
+            for k, v in src.items():
+                cur = dst.get(k)
+                if isinstance(cur, dict) and isinstance(v, dict):
+                    cur = dst[k] = dict(cur)
+                    stack.append((cur, v))
+                else:
+                    dst[k] = v
+        return out
 
     def _apply_yaml(self, path: str, changes: Dict[str, Any], backup: bool, apply: bool) -> tuple[str, bool]:
-        before_obj: Dict[str, Any] = {}
-        if os.path.exists(path):
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    before_obj = yaml.safe_load(f) or {}
-            except Exception:
-                before_obj = {}
-        after_obj = self._deep_merge(before_obj, changes if isinstance(changes, dict) else {})
-        before_txt = yaml.safe_dump(before_obj, sort_keys=False) if before_obj else ""
-        after_txt = yaml.safe_dump(after_obj, sort_keys=False)
+        if not changes or not isinstance(changes, dict):
+            return "", False
+        # One read: the raw text is diffed as-is, the parse feeds the merge
+        before_txt = self._read_text(path)
+        try:
+            before_obj = yaml.load(before_txt, Loader=_YAML_LOADER) or {}
+        except Exception:
+            before_obj = {}
+        after_obj = self._deep_merge(before_obj, changes)
+        # No effective change: skip serializing
+        if after_obj == before_obj:
+            return "", False
+        after_txt = yaml.dump(after_obj, Dumper=_YAML_DUMPER, sort_keys=False)
         diff = self._unified_diff(before_txt, after_txt, path)
         if not apply:
             return diff, False
         if before_txt == after_txt:
             return diff, False
         if backup and os.path.exists(path):
-            shutil.copy2(path, f"{path}.bak")
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(after_txt)
+            self._backup(path)
+        self._write_atomic(path, after_txt)
         return diff, True
 
     def _apply_json(self, path: str, changes: Dict[str, Any], backup: bool, apply: bool) -> tuple[str, bool]:
-        before_obj: Any = {}
-        if os.path.exists(path):
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    before_obj = json.load(f)
-            except Exception:
-                before_obj = {}
         if not isinstance(changes, dict):
             raise ValueError("changes must be an object for JSON files")
+        if not changes:
+            return "", False
+        # One read: the raw text is diffed as-is, the parse feeds the merge
+        before_txt = self._read_text(path)
+        try:
+            before_obj: Any = json.loads(before_txt) if before_txt.strip() else {}
+        except Exception:
+            before_obj = {}
         after_obj = self._deep_merge(before_obj if isinstance(before_obj, dict) else {}, changes)
-        before_txt = json.dumps(before_obj, ensure_ascii=False, indent=2) if before_obj else ""
+        # No effective change: skip serializing
+        if after_obj == before_obj:
+            return "", False
         after_txt = json.dumps(after_obj, ensure_ascii=False, indent=2)
         diff = self._unified_diff(before_txt, after_txt, path)
         if not apply:
@@ -135,11 +282,22 @@ class WriteConfig(BaseTool):
         if before_txt == after_txt:
             return diff, False
         if backup and os.path.exists(path):
-            shutil.copy2(path, f"{path}.bak")
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(after_txt)
+            self._backup(path)
+        self._write_atomic(path, after_txt)
         return diff, True
 
+    def _ini_changes_needed(self, parser: configparser.ConfigParser, changes: Any) -> bool:
+        if not isinstance(changes, dict):
+            return False
+        for section, kv in changes.items():
+            if section != parser.default_section and not parser.has_section(section):
+                return True
+            if isinstance(kv, dict):
+                for k, v in kv.items():
+                    if parser.get(section, k, fallback=None) != str(v):
+                        return True
+        return False
+
     def _apply_ini(self, path: str, changes: Dict[str, Any], backup: bool, apply: bool) -> tuple[str, bool]:
         parser = configparser.ConfigParser(interpolation=None)
         if os.path.exists(path):
@@ -149,9 +307,14 @@ class WriteConfig(BaseTool):
             except Exception:
                 # Start with empty config
                 parser = configparser.ConfigParser(interpolation=None)
-        before_io = StringIO()
-        parser.write(before_io)
-        before_txt = before_io.getvalue()
+        # No effective change (every key already has its value): skip
+        # serializing either side
+        if not self._ini_changes_needed(parser, changes):
+            return "", False
+        # One buffer serializes both sides
+        buf = StringIO()
+        parser.write(buf)
+        before_txt = buf.getvalue()
         # Apply changes: expected structure {section: {key: value}}
         if isinstance(changes, dict):
             for section, kv in changes.items():
@@ -160,16 +323,16 @@ class WriteConfig(BaseTool):
                 if isinstance(kv, dict):
                     for k, v in kv.items():
                         parser.set(section, k, str(v))
-        after_io = StringIO()
-        parser.write(after_io)
-        after_txt = after_io.getvalue()
+        buf.seek(0)
+        buf.truncate(0)
+        parser.write(buf)
+        after_txt = buf.getvalue()
         diff = self._unified_diff(before_txt, after_txt, path)
         if not apply:
             return diff, False
         if before_txt == after_txt:
             return diff, False
         if backup and os.path.exists(path):
-            shutil.copy2(path, f"{path}.bak")
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(after_txt)
+            self._backup(path)
+        self._write_atomic(path, after_txt)
         return diff, True
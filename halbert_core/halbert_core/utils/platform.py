@@ -2,8 +2,13 @@
 Platform detection utilities for cross-platform support (Phase 5 M3 / Phase 6 prep).
 
 Provides platform-specific behavior and detection for Linux and macOS.
+
+OS and hardware identity cannot change while the process runs, so the
+detection helpers are memoized; each probe (os-release parse, sysctl fork)
+happens at most once. Helpers returning dicts hand out copies.
 """
 
+import functools
 import platform
 import subprocess
 from pathlib import Path
@@ -13,6 +18,7 @@ import logging
 logger = logging.getLogger('halbert')
 
 
+@functools.lru_cache(maxsize=1)
 def get_platform() -> str:
     """
     Get current platform.
@@ -23,16 +29,19 @@ def get_platform() -> str:
     return platform.system().lower()
 
 
+@functools.lru_cache(maxsize=1)
 def is_linux() -> bool:
     """Check if running on Linux."""
     return get_platform() == "linux"
 
 
+@functools.lru_cache(maxsize=1)
 def is_macos() -> bool:
     """Check if running on macOS."""
     return get_platform() == "darwin"
 
 
+@functools.lru_cache(maxsize=1)
 def is_windows() -> bool:
     """Check if running on Windows."""
     return get_platform() == "windows"
@@ -49,6 +58,11 @@ def get_linux_distro() -> Dict[str, str]:
         - package_manager: e.g., "apt", "pacman", "dnf"
         - family: e.g., "debian", "arch", "rhel"
     """
+    return dict(_linux_distro())
+
+
+@functools.lru_cache(maxsize=1)
+def _linux_distro() -> Dict[str, str]:
     result = {
         "name": "Linux",
         "id": "linux",
@@ -124,6 +138,41 @@ def get_linux_distro() -> Dict[str, str]:
     return result
 
 
+# macOS sysctl keys read by the Apple Silicon helpers
+_SYSCTL_KEYS = ("hw.memsize", "machdep.cpu.brand_string", "hw.optional.arm64")
+
+
+@functools.lru_cache(maxsize=1)
+def _sysctl_values() -> Dict[str, str]:
+    """
+    Read all _SYSCTL_KEYS with one sysctl call.
+    
+    -i skips keys the kernel does not have (hw.optional.arm64 is missing
+    on older Intel Macs) instead of failing the whole call.
+    
+    Returns:
+        Key to value, for the keys that were found
+    """
+    try:
+        result = subprocess.run(
+            ["sysctl", "-i", *_SYSCTL_KEYS],
+            capture_output=True,
+            text=True,
+            timeout=2
+        )
+    except Exception as e:
+        logger.debug(f"Failed to run sysctl: {e}")
+        return {}
+    
+    values = {}
+    for line in result.stdout.splitlines():
+        key, sep, value = line.partition(": ")
+        if sep:
+            values[key] = value.strip()
+    return values
+
+
+@functools.lru_cache(maxsize=1)
 def is_mac_apple_silicon() -> bool:
     """
     Detect if running on Mac with Apple Silicon (M1/M2/M3).
@@ -142,21 +191,20 @@ def is_mac_apple_silicon() -> bool:
         if arch == "arm64":
             return True
         
-        # Alternative: check with sysctl
-        result = subprocess.run(
-            ["sysctl", "-n", "machdep.cpu.brand_string"],
-            capture_output=True,
-            text=True,
-            timeout=2
+        # Alternative: check with sysctl (also true under Rosetta, where
+        # machine() reports x86_64)
+        values = _sysctl_values()
+        return (
+            "Apple" in values.get("machdep.cpu.brand_string", "")
+            or values.get("hw.optional.arm64") == "1"
         )
-        
-        return "Apple" in result.stdout
     
     except Exception as e:
         logger.debug(f"Failed to detect Apple Silicon: {e}")
         return False
 
 
+@functools.lru_cache(maxsize=1)
 def get_unified_memory_gb() -> Optional[int]:
     """
     Get unified memory size on Mac Apple Silicon.
@@ -168,15 +216,8 @@ def get_unified_memory_gb() -> Optional[int]:
         return None
     
     try:
-        result = subprocess.run(
-            ["sysctl", "-n", "hw.memsize"],
-            capture_output=True,
-            text=True,
-            timeout=2
-        )
-        
         # Convert bytes to GB
-        memory_bytes = int(result.stdout.strip())
+        memory_bytes = int(_sysctl_values()["hw.memsize"])
         memory_gb = memory_bytes // (1024 ** 3)
         
         logger.info(f"Detected Mac unified memory: {memory_gb}GB")
@@ -251,6 +292,7 @@ def get_cache_dir() -> Path:
         return Path.home() / ".cache" / "halbert"
 
 
+@functools.lru_cache(maxsize=1)
 def get_recommended_provider() -> str:
     """
     Get recommended model provider for current platform.
@@ -273,13 +315,20 @@ def get_platform_info() -> Dict[str, Any]:
     Returns:
         Dictionary with platform details
     """
+    return dict(_platform_info())
+
+
+@functools.lru_cache(maxsize=1)
+def _platform_info() -> Dict[str, Any]:
+    # One uname() for machine and processor instead of a getter per field
+    uname = platform.uname()
     info = {
         "platform": get_platform(),
         "is_linux": is_linux(),
         "is_macos": is_macos(),
         "is_windows": is_windows(),
-        "machine": platform.machine(),
-        "processor": platform.processor(),
+        "machine": uname.machine,
+        "processor": uname.processor,
         "python_version": platform.python_version(),
         "recommended_provider": get_recommended_provider(),
     }
@@ -0,0 +1,49 @@
+"""
+Fast UTC ISO-8601 timestamps for hot paths (scheduler state transitions).
+
+Formatting the date and time-of-day is the expensive part of
+``datetime.now(timezone.utc).isoformat()``; it only changes once per
+second, so it is cached and only the milliseconds are formatted per call.
+"""
+
+from __future__ import annotations
+import time
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS"), replaced as one tuple for thread safety
+_cached_second = (-1, "")
+
+
+def _second_prefix(second: int) -> str:
+    """Formatted date and time-of-day for an epoch second, cached per second."""
+    global _cached_second
+    cached = _cached_second
+    if cached[0] != second:
+        cached = _cached_second = (
+            second, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        )
+    return cached[1]
+
+
+def iso_now() -> str:
+    """
+    Current UTC time as ISO-8601 with millisecond precision.
+
+    Returns:
+        e.g. "2025-01-31T12:00:00.123+00:00" (same form as
+        ``datetime.now(timezone.utc).isoformat(timespec='milliseconds')``)
+    """
+    now = time.time()
+    second = int(now)
+    return f"{_second_prefix(second)}.{int((now - second) * 1000):03d}+00:00"
+
+
+def iso_now_z() -> str:
+    """
+    Current UTC time as ISO-8601 with millisecond precision and a "Z" suffix.
+
+    Returns:
+        e.g. "2025-01-31T12:00:00.123Z"
+    """
+    ns = time.time_ns()
+    second, rem = divmod(ns, 1_000_000_000)
+    return f"{_second_prefix(second)}.{rem // 1_000_000:03d}Z"
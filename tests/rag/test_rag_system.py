@@ -9,6 +9,8 @@ import tempfile
 import os
 
 from halbert_core.rag import EmbeddingManager, HybridRetriever, RAGPipeline
+from halbert_core.rag.bm25 import BM25Index
+from halbert_core.rag.scrapers.minhash import find_near_duplicates
 
 
 @pytest.fixture
@@ -106,6 +108,52 @@ class TestEmbeddingManager:
         assert embeddings.shape[1] == manager.embedding_dimension
 
 
+class TestBM25Index:
+    """Test BM25Index."""
+    
+    def test_get_scores(self):
+        """Matching documents score above non-matching ones."""
+        corpus = [
+            "systemctl restart service".split(),
+            "journalctl view logs".split(),
+            "df disk space usage".split(),
+        ]
+        index = BM25Index(corpus)
+        
+        scores = index.get_scores(["disk", "space"])
+        
+        assert scores.shape == (3,)
+        assert scores.argmax() == 2
+        assert scores[0] == 0 and scores[1] == 0
+    
+    def test_unknown_terms(self):
+        """Out-of-vocabulary query terms contribute nothing."""
+        index = BM25Index([["a", "b"], ["b", "c"]])
+        
+        assert index.token_ids(["a", "zzz"]) == [0]
+        assert not index.get_scores(["zzz"]).any()
+
+
+class TestNearDuplicates:
+    """Test MinHash-LSH near-duplicate detection."""
+    
+    def test_find_near_duplicates(self):
+        """Near-identical texts collapse to the longest one."""
+        base = " ".join(f"word{i}" for i in range(200))
+        near = base + " trailing"
+        other = " ".join(f"other{i}" for i in range(200))
+        
+        keep = find_near_duplicates([base, other, near])
+        
+        assert keep == [False, True, True]
+    
+    def test_distinct_texts_kept(self):
+        """Unrelated texts are never dropped."""
+        texts = [" ".join(f"doc{d}w{i}" for i in range(50)) for d in range(5)]
+        
+        assert all(find_near_duplicates(texts))
+
+
 class TestHybridRetriever:
     """Test HybridRetriever."""
     
@@ -0,0 +1,236 @@
+"""
+Tests for autonomous task LLM decision making.
+"""
+
+import json
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from halbert_core.scheduler.autonomous_tasks import (
+    AutonomousTask,
+    DecisionCache,
+    SystemHealthCheckTask,
+    TaskDecision,
+)
+
+
+class FakeModelManager:
+    """Returns a fixed JSON decision and counts calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def generate(self, prompt, max_tokens=512, temperature=0.3, stop=None):
+        self.calls += 1
+        return json.dumps({
+            "step": 1,
+            "action": "Rotate logs",
+            "confidence": 0.9,
+            "reasoning": "Logs are large",
+            "requires_approval": False,
+            "approval_reason": None,
+            "risk_level": "low",
+        })
+
+
+class FakeBatchModelManager(FakeModelManager):
+    """Counts batched calls separately."""
+
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def generate_batch(self, prompts, max_tokens=512, temperature=0.3, stop=None):
+        self.batches.append(len(prompts))
+        return [FakeModelManager.generate(self, p) for p in prompts]
+
+
+class FakePromptManager:
+    def build_prompt(self, mode=None, task_context=None):
+        return task_context or ""
+
+
+def _task(model):
+    return AutonomousTask(
+        model_manager=model,
+        prompt_manager=FakePromptManager(),
+        decision_cache=DecisionCache(),
+    )
+
+
+def test_repeated_decision_is_cached():
+    """Same task and state reuse the LLM decision."""
+    model = FakeModelManager()
+    task = _task(model)
+
+    first = task._make_decision("Clean logs", {"size_gb": 1.5})
+    second = task._make_decision("Clean logs", {"size_gb": 1.5})
+
+    assert model.calls == 1
+    assert second == first
+    assert second is not first
+
+
+def test_changed_state_misses_cache():
+    """A different state asks the LLM again."""
+    model = FakeModelManager()
+    task = _task(model)
+
+    task._make_decision("Clean logs", {"size_gb": 1.5})
+    task._make_decision("Clean logs", {"size_gb": 9.0})
+
+    assert model.calls == 2
+
+
+def test_decision_cache_lru():
+    """Oldest entries are evicted."""
+    decision = TaskDecision(
+        step=1, action="x", confidence=0.9, reasoning="r", requires_approval=False
+    )
+
+    cache = DecisionCache(max_size=2)
+    cache.put("one", decision)
+    cache.put("two", decision)
+    cache.put("three", decision)
+    assert cache.get("one") is None
+    assert cache.get("three") == decision
+
+
+def test_decision_cache_is_per_model():
+    """Switching models does not replay the previous model's decisions."""
+    class Config:
+        runtime = "ollama"
+        model_id = "llama3.1:8b-instruct"
+
+    model = FakeModelManager()
+    model.config = Config()
+    task = _task(model)
+
+    task._make_decision("Clean logs", {"size_gb": 1.5})
+    model.config.model_id = "qwen2.5:7b-instruct"
+    task._make_decision("Clean logs", {"size_gb": 1.5})
+
+    assert model.calls == 2
+
+
+def test_health_check_cache_ignores_small_reading_changes():
+    """Live readings in the same bucket reuse the decision."""
+    model = FakeModelManager()
+    task = SystemHealthCheckTask(
+        model_manager=model,
+        prompt_manager=FakePromptManager(),
+        decision_cache=DecisionCache(),
+    )
+
+    task._make_decision("Check health", {"cpu_percent": 12.3, "memory_percent": 41.2})
+    task._make_decision("Check health", {"cpu_percent": 9.8, "memory_percent": 40.1})
+    task._make_decision("Check health", {"cpu_percent": 55.0, "memory_percent": 40.1})
+
+    assert model.calls == 2
+
+
+def test_make_decisions_batch_single_llm_call():
+    """Uncached decisions for several tasks share one generate_batch call."""
+    model = FakeBatchModelManager()
+    task = _task(model)
+    task._make_decision("Clean logs", {"size_gb": 1.5})
+
+    decisions = AutonomousTask.make_decisions_batch([
+        (task, "Clean logs", {"size_gb": 1.5}, 1),
+        (task, "Check health", {"cpu": 10}, 1),
+        (task, "Check disk", {"disk": 80}, 1),
+    ])
+
+    assert [d.action for d in decisions] == ["Rotate logs"] * 3
+    assert model.batches == [2]
+
+
+def test_decision_parsing_tolerates_trailing_commas():
+    """Extra text and trailing commas around the JSON are accepted."""
+    task = _task(FakeModelManager())
+
+    decision = task._finalize_decision(
+        'Here you go: {"action": "Rotate logs", "confidence": 0.95,} Thanks!',
+        step=1,
+        cache_key="k",
+    )
+
+    assert decision.action == "Rotate logs"
+    assert decision.confidence == 0.95
+
+
+def test_memory_retrieval_is_cached_per_description():
+    """Core knowledge is retrieved once per task description within the TTL."""
+
+    class FakeRetrieval:
+        def __init__(self):
+            self.calls = 0
+
+        def retrieve_from(self, collection, query, k=3):
+            self.calls += 1
+            return [{"text": "Logs live in /var/log"}]
+
+    retrieval = FakeRetrieval()
+    task = _task(FakeModelManager())
+    task.memory_retrieval = retrieval
+
+    first = task._memory_context("Clean logs")
+    second = task._memory_context("Clean logs")
+    task._memory_context("Check health")
+
+    assert "Logs live in /var/log" in first
+    assert second == first
+    assert retrieval.calls == 2
+
+
+def test_decision_parsing_accepts_response_cut_at_stop_sequence():
+    """A response ending where the closing-brace stop sequence matched parses."""
+    task = _task(FakeModelManager())
+
+    decision = task._finalize_decision(
+        '{\n  "action": "Rotate logs",\n  "confidence": 0.95',
+        step=1,
+        cache_key="k",
+    )
+
+    assert decision.action == "Rotate logs"
+    assert decision.confidence == 0.95
+
+
+def test_decision_parsing_handles_braces_in_strings_and_nested_objects():
+    """Braces inside strings or a nested last field do not truncate the object."""
+    task = _task(FakeModelManager())
+
+    in_string = task._finalize_decision(
+        '{"action": "Rotate logs", "confidence": 0.95, "reasoning": "use {x}"}',
+        step=1,
+        cache_key="k1",
+    )
+    nested_cut = task._finalize_decision(
+        '{\n  "action": "Rotate logs",\n  "confidence": 0.95,\n  "params": {"a": 1}',
+        step=1,
+        cache_key="k2",
+    )
+
+    assert in_string.reasoning == "use {x}"
+    assert in_string.confidence == 0.95
+    assert nested_cut.action == "Rotate logs"
+    assert nested_cut.confidence == 0.95
+
+
+def test_fallback_decisions_are_not_shared():
+    """Editing a returned fallback decision does not leak into later ones."""
+    task = AutonomousTask(decision_cache=DecisionCache())
+
+    first = task._make_decision("Clean logs", {"size_gb": 1.5})
+    first.requires_approval = False
+    result = task._complete({}, first)
+    result["decision"]["action"] = "Delete everything"
+
+    second = task._make_decision("Clean logs", {"size_gb": 1.5})
+    assert second.requires_approval is True
+    assert second.action == "Skip (no LLM available)"
+    assert first.action == "Skip (no LLM available)"
@@ -0,0 +1,32 @@
+from halbert_core.tools.base import ToolRequest
+from halbert_core.tools.read_sensor import ReadSensor, ReadSensorsBatch
+
+
+def _req(**inputs):
+    return ToolRequest(tool="read_sensor", request_id="r1", inputs=inputs)
+
+
+def test_read_sensor_scales_millidegrees_and_caches(tmp_path):
+    p = tmp_path / "temp1_input"
+    p.write_text("42000\n")
+    assert ReadSensor().execute(_req(sensor_path=str(p))).outputs["value"] == 42.0
+
+    p.write_text("50000\n")
+    # Within max_age_s the earlier read is reused; max_age_s=0 reads again
+    assert ReadSensor().execute(_req(sensor_path=str(p))).outputs["value"] == 42.0
+    assert ReadSensor().execute(_req(sensor_path=str(p), max_age_s=0)).outputs["value"] == 50.0
+
+
+def test_read_sensors_batch_reports_per_path_errors(tmp_path):
+    a = tmp_path / "a"
+    b = tmp_path / "b"
+    a.write_text("1500\n")
+    b.write_text("Package id 0\n")
+    missing = tmp_path / "missing"
+
+    res = ReadSensorsBatch().execute(_req(sensor_paths=[str(a), str(b), str(missing)]))
+    assert res.ok is True
+    assert res.outputs["values"] == {str(a): 1.5, str(b): "Package id 0"}
+    assert res.outputs["errors"] == {str(missing): "sensor_path not found"}
+
+    assert ReadSensorsBatch().execute(_req(sensor_paths=[])).ok is False
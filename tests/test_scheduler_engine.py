@@ -0,0 +1,159 @@
+import json
+import sqlite3
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from halbert_core.scheduler import engine as engine_module
+from halbert_core.scheduler.engine import SchedulerEngine
+from halbert_core.scheduler.job import Job
+
+
+def test_jobs_round_trip_through_store(tmp_path):
+    engine = SchedulerEngine(str(tmp_path))
+    engine.add_job(Job(id="a", task="snapshot_configs", schedule="0 2 * * *", priority=1))
+    engine.update_job_state("a", "running")
+    engine.close()
+
+    reloaded = SchedulerEngine(str(tmp_path))
+    job = reloaded.get_job("a")
+    assert job.state == "running"
+    assert job.priority == 1
+    assert job.started_at
+    reloaded.close()
+
+
+def test_legacy_json_jobs_are_migrated(tmp_path):
+    legacy = Job(id="old", task="update_packages", schedule="0 3 * * *")
+    (tmp_path / "old.json").write_text(json.dumps(legacy.__dict__))
+
+    engine = SchedulerEngine(str(tmp_path))
+    assert engine.get_job("old") == legacy
+    assert not (tmp_path / "old.json").exists()
+    engine.close()
+
+    reloaded = SchedulerEngine(str(tmp_path))
+    assert reloaded.get_job("old") == legacy
+    reloaded.close()
+
+
+def test_list_jobs_by_state_follows_transitions(tmp_path):
+    engine = SchedulerEngine(str(tmp_path))
+    engine.add_job(Job(id="low", task="t", schedule="x", priority=9))
+    engine.add_job(Job(id="high", task="t", schedule="x", priority=1))
+    engine.add_job(Job(id="mid", task="t", schedule="x", priority=5))
+
+    engine.update_job_state("mid", "running")
+    engine.cancel_job("low")
+
+    assert [j.id for j in engine.list_jobs("pending")] == ["high"]
+    assert [j.id for j in engine.list_jobs("running")] == ["mid"]
+    assert [j.id for j in engine.list_jobs("cancelled")] == ["low"]
+    assert engine.list_jobs("failed") == []
+    assert [j.id for j in engine.list_jobs()] == ["high", "mid", "low"]
+    assert engine.count_by_state() == {"pending": 1, "running": 1, "cancelled": 1}
+    engine.close()
+
+
+def test_rapid_transitions_are_flushed_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(engine_module, "FLUSH_DEBOUNCE_S", 5.0)
+    engine = SchedulerEngine(str(tmp_path))
+    engine.add_job(Job(id="a", task="t", schedule="x"))
+    engine.update_job_state("a", "running")
+    engine.update_job_state("a", "completed")
+    assert list(engine._dirty) == ["a"]
+
+    engine.flush()
+    assert engine._dirty == {}
+
+    other = SchedulerEngine(str(tmp_path))
+    assert other.get_job("a").state == "completed"
+    other.close()
+    engine.close()
+
+
+def test_list_jobs_cache_is_invalidated_on_change(tmp_path):
+    engine = SchedulerEngine(str(tmp_path))
+    engine.add_job(Job(id="a", task="t", schedule="x", priority=2))
+    assert [j.id for j in engine.list_jobs("pending")] == ["a"]
+
+    engine.add_job(Job(id="b", task="t", schedule="x", priority=1))
+    assert [j.id for j in engine.list_jobs("pending")] == ["b", "a"]
+
+    engine.update_job_state("b", "running")
+    assert [j.id for j in engine.list_jobs("pending")] == ["a"]
+
+    listing = engine.list_jobs()
+    listing.clear()
+    assert len(engine.list_jobs()) == 2
+    engine.close()
+
+
+def test_unpersisted_job_is_written_on_first_state_change(tmp_path):
+    engine = SchedulerEngine(str(tmp_path))
+    engine.add_job(Job(id="a", task="snapshot_configs", schedule="0 2 * * *"), persist=False)
+    engine.flush()
+    assert SchedulerEngine(str(tmp_path)).get_job("a") is None
+
+    engine.update_job_state("a", "completed")
+    engine.close()
+
+    assert SchedulerEngine(str(tmp_path)).get_job("a").state == "completed"
+
+
+def test_failed_flush_requeues_jobs(tmp_path, monkeypatch):
+    monkeypatch.setattr(engine_module, "FLUSH_DEBOUNCE_S", 5.0)
+    engine = SchedulerEngine(str(tmp_path))
+    engine.add_job(Job(id="a", task="snapshot_configs", schedule="0 2 * * *"), persist=False)
+    engine.update_job_state("a", "completed", persist=False)
+    engine._persist_job(engine.get_job("a"))
+
+    persist_jobs = engine._persist_jobs
+
+    def failing(jobs):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(engine, "_persist_jobs", failing)
+    with pytest.raises(sqlite3.OperationalError):
+        engine.flush()
+
+    monkeypatch.setattr(engine, "_persist_jobs", persist_jobs)
+    engine.close()
+    assert SchedulerEngine(str(tmp_path)).get_job("a").state == "completed"
+
+
+def test_queued_jobs_are_written_at_exit(tmp_path):
+    script = (
+        "import sys\n"
+        "from halbert_core.scheduler.engine import SchedulerEngine\n"
+        "from halbert_core.scheduler.job import Job\n"
+        "SchedulerEngine(sys.argv[1]).add_job(Job(id='a', task='t', schedule='x'))\n"
+    )
+    subprocess.run([sys.executable, "-c", script, str(tmp_path)], check=True)
+
+    reloaded = SchedulerEngine(str(tmp_path))
+    assert reloaded.get_job("a").state == "pending"
+    reloaded.close()
+
+
+def test_change_during_listing_is_not_cached_stale(tmp_path, monkeypatch):
+    engine = SchedulerEngine(str(tmp_path))
+    engine.add_job(Job(id="a", task="t", schedule="x"))
+    worker = threading.Thread(target=engine.update_job_state, args=("a", "running"))
+    sort_key = engine_module._job_sort_key
+
+    def key_starting_worker(job):
+        # Another thread changes state while the listing is being sorted
+        if not worker.is_alive() and worker.ident is None:
+            worker.start()
+            worker.join(0.2)
+        return sort_key(job)
+
+    monkeypatch.setattr(engine_module, "_job_sort_key", key_starting_worker)
+    engine.list_jobs("pending")
+    worker.join()
+
+    assert engine.list_jobs("pending") == []
+    engine.close()
@@ -0,0 +1,132 @@
+import json
+
+import pytest
+
+pytest.importorskip("apscheduler")
+
+from halbert_core.scheduler.executor import AutonomousExecutor, read_next_run_times
+
+
+def _task():
+    return "ok"
+
+
+@pytest.fixture
+def make_executor(tmp_path, monkeypatch):
+    monkeypatch.setenv("Halbert_DATA_DIR", str(tmp_path / "data"))
+    db_path = str(tmp_path / "jobs.db")
+    executors = []
+
+    def make():
+        executor = AutonomousExecutor(db_path=db_path, enable_guardrails=False)
+        executors.append(executor)
+        return executor
+
+    yield make
+    for executor in executors:
+        executor.stop(wait=False)
+        executor.scheduler_engine.close()
+
+
+def test_idle_executor_keeps_job_snapshot(make_executor, tmp_path):
+    """An executor that schedules nothing (e.g. the dashboard's) never clears the snapshot."""
+    main = make_executor()
+    main.start()
+    main.schedule_cron_job("j1", _task, {"hour": 2})
+    main.stop()
+
+    idle = make_executor()
+    idle.start()
+    idle.stop(wait=False)
+
+    other = make_executor()
+    other.start()
+    other.schedule_cron_job("j2", _task, {"hour": 3})
+    other.stop()
+
+    snapshot = json.loads((tmp_path / "jobs.snapshot.json").read_text())
+    next_runs = {entry["id"]: entry["next_run"] for entry in snapshot}
+    assert set(next_runs) == {"j1", "j2"}
+    assert read_next_run_times(str(tmp_path / "jobs.db")) == next_runs
+
+
+def test_failing_anomaly_handling_still_records_outcomes(make_executor, monkeypatch):
+    """Job state is final when the task returns, even if anomaly handling fails."""
+    from halbert_core.scheduler import executor as executor_module
+    from halbert_core.scheduler.job import Job
+
+    class Writer:
+        def __init__(self):
+            self.entries = []
+
+        def write_action_outcomes(self, entries):
+            self.entries.extend(entries)
+            return True
+
+    class Detector:
+        def record_job_outcome(self, success, job_id):
+            if not success:
+                raise RuntimeError("repeated failures")
+
+    class Enforcer:
+        def enter_safe_mode(self, reason):
+            raise PermissionError("data/safe_mode_active.flag")
+
+    writer = Writer()
+    monkeypatch.setattr(executor_module, "_MEMORY_WRITER", writer)
+
+    executor = make_executor()
+    executor.anomaly_detector = Detector()
+    executor.guardrail_enforcer = Enforcer()
+    for job_id in ("x", "y"):
+        executor.scheduler_engine.add_job(Job(id=job_id, task="t", schedule="s"))
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        executor._wrap_task("x", fail, max_retries=1, timeout_s=5)()
+    assert executor._wrap_task("y", _task, max_retries=1, timeout_s=5)() == "ok"
+
+    assert executor.scheduler_engine.get_job("x").state == "failed"
+    assert executor.scheduler_engine.get_job("x").error == "boom"
+    assert executor.scheduler_engine.get_job("y").state == "completed"
+
+    executor.flush_outcomes()
+    assert [entry["job_id"] for entry in writer.entries] == ["x", "y"]
+
+
+def test_rescheduling_cancelled_job_resets_its_record(make_executor):
+    """A cancelled job scheduled again is pending and cancellable again."""
+    executor = make_executor()
+    executor.start()
+    executor.schedule_cron_job("j1", _task, {"hour": 2})
+    assert executor.cancel_job("j1")
+
+    executor.schedule_cron_job("j1", _task, {"hour": 2})
+
+    job = executor.scheduler_engine.get_job("j1")
+    assert job.state == "pending"
+    assert job.completed_at is None
+    assert executor.scheduler_engine.cancel_job("j1")
+
+
+def test_scheduled_jobs_report_actual_next_run(make_executor):
+    """next_run follows the job itself: restored from the snapshot, or paused."""
+    from datetime import datetime, timedelta, timezone
+
+    first = make_executor()
+    first.start()
+    first.schedule_cron_job("j1", _task, {"minute": "*"})
+    resume_at = datetime.now(timezone.utc).replace(microsecond=0) + timedelta(hours=1)
+    first.scheduler.modify_job("j1", next_run_time=resume_at)
+    first.stop()
+
+    second = make_executor()
+    second.start()
+    second.schedule_cron_job("j1", _task, {"minute": "*"})
+    second.schedule_cron_job("j2", _task, {"minute": "*"})
+    second.scheduler.pause_job("j2")
+
+    next_runs = {job["id"]: job["next_run"] for job in second.get_scheduled_jobs()}
+    assert next_runs == {"j1": resume_at.isoformat(), "j2": None}
@@ -0,0 +1,25 @@
+from datetime import datetime, timedelta, timezone
+
+from halbert_core.utils.timestamps import iso_now, iso_now_z
+
+
+def test_iso_now_matches_datetime_format():
+    before = datetime.now(timezone.utc) - timedelta(milliseconds=1)
+    stamp = iso_now()
+    after = datetime.now(timezone.utc)
+
+    parsed = datetime.fromisoformat(stamp)
+    assert stamp.endswith("+00:00")
+    assert len(stamp) == len(after.isoformat(timespec="milliseconds"))
+    assert before <= parsed <= after
+
+
+def test_iso_now_z_uses_zulu_suffix():
+    before = datetime.now(timezone.utc) - timedelta(milliseconds=1)
+    stamp = iso_now_z()
+    after = datetime.now(timezone.utc)
+
+    parsed = datetime.fromisoformat(stamp.replace("Z", "+00:00"))
+    assert stamp.endswith("Z")
+    assert "+" not in stamp
+    assert before <= parsed <= after
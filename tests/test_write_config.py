@@ -46,3 +46,51 @@ def test_yaml_dry_run_no_write(tmp_path):
     diff, applied = wc._apply_yaml(str(p), {"foo": 2}, backup=True, apply=False)
     assert applied is False
     assert p.read_text("utf-8") == before
+
+
+def test_apply_json_writes_through_symlink(tmp_path):
+    wc = WriteConfig()
+    real = tmp_path / "real.json"
+    real.write_text(json.dumps({"x": 1}), encoding="utf-8")
+    link = tmp_path / "cfg.json"
+    link.symlink_to(real)
+    _, applied = wc._apply_json(str(link), {"x": 2}, backup=True, apply=True)
+    assert applied is True
+    assert link.is_symlink()
+    assert json.loads(real.read_text("utf-8")) == {"x": 2}
+    assert json.loads((tmp_path / "cfg.json.bak").read_text("utf-8")) == {"x": 1}
+
+
+def test_write_keeps_mode_before_contents_are_written(tmp_path, monkeypatch):
+    wc = WriteConfig()
+    p = tmp_path / "secret.json"
+    p.write_text(json.dumps({"token": "old"}), encoding="utf-8")
+    p.chmod(0o600)
+    modes = []
+    fdatasync = os.fdatasync
+
+    def spy(fd):
+        modes.append(os.fstat(fd).st_mode & 0o777)
+        fdatasync(fd)
+
+    monkeypatch.setattr(os, "fdatasync", spy)
+    _, applied = wc._apply_json(str(p), {"token": "new"}, backup=False, apply=True)
+    assert applied is True
+    assert modes == [0o600]
+    assert p.stat().st_mode & 0o777 == 0o600
+    assert [f.name for f in tmp_path.iterdir()] == ["secret.json"]
+
+
+def test_in_place_write_keeps_backup(tmp_path, monkeypatch):
+    from halbert_core.tools import write_config
+
+    monkeypatch.setattr(write_config, "_can_replace", lambda path: False)
+    wc = WriteConfig()
+    p = tmp_path / "cfg.json"
+    p.write_text(json.dumps({"x": 1}), encoding="utf-8")
+    inode = p.stat().st_ino
+    _, applied = wc._apply_json(str(p), {"x": 2}, backup=True, apply=True)
+    assert applied is True
+    assert p.stat().st_ino == inode
+    assert json.loads(p.read_text("utf-8")) == {"x": 2}
+    assert json.loads((tmp_path / "cfg.json.bak").read_text("utf-8")) == {"x": 1}